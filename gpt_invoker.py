@@ -7,9 +7,10 @@ import re
 import sqlite3
 import threading
 import traceback
-from typing import Optional
+from typing import Iterator, Optional
 
 import colorlog
+import httpx
 from openai import OpenAI
 from openai.types.chat import ChatCompletion, ChatCompletionMessageParam
 
@@ -38,6 +39,29 @@ RESPONSE_JSON_PATTERN = re.compile("```json\n(.*?)```", re.DOTALL)
 RESPONSE_JAVA_PATTERN = re.compile("```java\n(.*?)```", re.DOTALL)
 
 
+HTTP_POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the process-wide pooled HTTP client shared by all invokers."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None or _http_client.is_closed:
+            try:
+                import h2  # noqa: F401
+
+                http2 = True
+            except ImportError:
+                http2 = False
+            _http_client = httpx.Client(
+                limits=HTTP_POOL_LIMITS, http2=http2, follow_redirects=True
+            )
+        return _http_client
+
+
 GPT_PRICE_TABLE = {
     "default": (5, 20, 2.5),
     "gpt-4.1": (2, 8, 0.5),
@@ -66,6 +90,8 @@ class Usage:
         self.prompt_tokens = 0
         self.completion_tokens_cached = 0
         self.prompt_tokens_cached = 0
+        # Subset of prompt_tokens served from the provider's prompt-prefix cache
+        self.prompt_tokens_prefix_cached = 0
 
     def update(self, result: ChatCompletion, is_cached: bool = False):
         usage = result.usage
@@ -76,6 +102,9 @@ class Usage:
             if not is_cached:
                 self.completion_tokens += usage.completion_tokens
                 self.prompt_tokens += usage.prompt_tokens
+                details = usage.prompt_tokens_details
+                if details is not None and details.cached_tokens:
+                    self.prompt_tokens_prefix_cached += details.cached_tokens
             else:
                 self.completion_tokens_cached += usage.completion_tokens
                 self.prompt_tokens_cached += usage.prompt_tokens
@@ -90,9 +119,12 @@ class Usage:
         input_tokens_cached = self.prompt_tokens_cached
         output_tokens_cached = self.completion_tokens_cached
 
+        input_tokens_prefix_cached = self.prompt_tokens_prefix_cached
         input_tokens_price = (
-            input_tokens * GPT_PRICE_TABLE[self.model_name][0] / 1000000
-        )
+            (input_tokens - input_tokens_prefix_cached)
+            * GPT_PRICE_TABLE[self.model_name][0]
+            + input_tokens_prefix_cached * GPT_PRICE_TABLE[self.model_name][2]
+        ) / 1000000
         output_tokens_price = (
             output_tokens * GPT_PRICE_TABLE[self.model_name][1] / 1000000
         )
@@ -114,7 +146,7 @@ class Usage:
         )
 
         return (
-            f"{model_str} Input: {input_tokens} tokens ({input_tokens_price:.4f} USD), "
+            f"{model_str} Input: {input_tokens} tokens, {input_tokens_prefix_cached} prefix-cached ({input_tokens_price:.4f} USD), "
             f"Output: {output_tokens} tokens ({output_tokens_price:.4f} USD), "
             f"Cached Input: {input_tokens_cached} tokens ({input_tokens_cached_price:.4f} USD), "
             f"Cached Output: {output_tokens_cached} tokens ({output_tokens_cached_price:.4f} USD), "
@@ -157,7 +189,10 @@ class GPTInvoker:
         self.write_gpt_log = write_gpt_log
         self.dump_gpt_log = dump_gpt_log
 
-        self.client = OpenAI(api_key=api_key, base_url=api_host)
+        # Share one connection pool so keep-alive connections survive across invokers
+        self.client = OpenAI(
+            api_key=api_key, base_url=api_host, http_client=_get_http_client()
+        )
         self.model = model
         self.model_args = {
             "top_p": top_p,
@@ -271,40 +306,57 @@ class GPTInvoker:
         except Exception:
             logger.error("Error while writing to GPT cache", exc_info=True)
 
-    def _msg_digest(self, message: list[ChatCompletionMessageParam]) -> tuple[str, str]:
+    def _msg_digest(
+        self,
+        message: list[ChatCompletionMessageParam],
+        response_format: Optional[dict] = None,
+    ) -> tuple[str, str]:
         msg_concat = [self.model_args_str]
         msg_concat.append(json.dumps(message, ensure_ascii=False))
+        if response_format is not None:
+            msg_concat.append(json.dumps(response_format, ensure_ascii=False, sort_keys=True))
         msg_concat = "".join(msg_concat)
         msg_digest = hashlib.sha1(msg_concat.encode()).hexdigest()
         return msg_digest, msg_concat
 
     def generate_inner(
-        self, messages: list[ChatCompletionMessageParam]
+        self,
+        messages: list[ChatCompletionMessageParam],
+        response_format: Optional[dict] = None,
     ) -> ChatCompletion:
+        extra_args = {}
+        if response_format is not None:
+            extra_args["response_format"] = response_format
         response = self.client.chat.completions.create(
-            model=self.model, messages=messages, **self.model_args
+            model=self.model, messages=messages, **self.model_args, **extra_args
         )
         return response
 
     def generate_inner_stream(self, messages: list[ChatCompletionMessageParam]) -> str:
+        return "".join(self.generate_stream(messages))
+
+    def generate_stream(
+        self, messages: list[ChatCompletionMessageParam]
+    ) -> Iterator[str]:
+        """Yield the response text incrementally as it arrives (uncached)."""
         response = self.client.chat.completions.create(
             model=self.model, messages=messages, stream=True, **self.model_args
         )
-        all_text = []
         for sse_chunk in response:
             if len(sse_chunk.choices) > 0:
                 content = sse_chunk.choices[0].delta.content
                 if content is not None:
-                    all_text.append(content)
-        response = "".join(all_text)
-        return response
+                    yield content
 
     def generate_all_res(
-        self, messages: list[ChatCompletionMessageParam], ignore_cache=False
+        self,
+        messages: list[ChatCompletionMessageParam],
+        ignore_cache=False,
+        response_format: Optional[dict] = None,
     ) -> ChatCompletion:
         msg_digest, msg_concat = None, None
         if (self.read_from_cache and not ignore_cache) or self.write_to_cache:
-            msg_digest, msg_concat = self._msg_digest(messages)
+            msg_digest, msg_concat = self._msg_digest(messages, response_format)
             if self.read_from_cache and not ignore_cache:
                 gpt_cache = self._query_gpt_cache(msg_digest, msg_concat)
                 if gpt_cache is not None:
@@ -313,7 +365,7 @@ class GPTInvoker:
                     return gpt_cache
 
         try:
-            response = self.generate_inner(messages)
+            response = self.generate_inner(messages, response_format)
         except Exception:
             logger.error("Error while generating response", exc_info=True)
             err_msg = traceback.format_exc()
@@ -330,8 +382,12 @@ class GPTInvoker:
 
         return response
 
-    def generate(self, messages: list[ChatCompletionMessageParam]) -> str:
-        response = self.generate_all_res(messages)
+    def generate(
+        self,
+        messages: list[ChatCompletionMessageParam],
+        response_format: Optional[dict] = None,
+    ) -> str:
+        response = self.generate_all_res(messages, response_format=response_format)
         choices = response.choices
         if len(choices) == 0:
             raise ValueError("No choices in the response")
@@ -1,6 +1,42 @@
 """Price modifiers for estimation."""
 
-from typing import Union
+from functools import lru_cache
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Factor tables for the categorical modifiers (unknown levels map to 1.0)
+COMPLETENESS_FACTORS = {
+    "fragment": 0.4,
+    "standard": 1.0,
+    "full": 1.2,
+}
+
+EXCLUSIVITY_FACTORS = {
+    "widely_leaked": 0.5,
+    "limited": 1.0,
+    "single_seller": 1.5,
+}
+
+PACKAGING_FACTORS = {
+    "retail_lookup": 1.5,
+    "bulk_dump": 0.3,
+    "account_access": 1.0,
+    "document_scan": 1.2,
+}
+
+REPUTATION_FACTORS = {
+    "unknown": 0.9,
+    "verified": 1.0,
+    "escrow_guarantee": 1.2,
+}
+
+DEMAND_FACTORS = {
+    "low": 0.8,
+    "normal": 1.0,
+    "high": 1.1,
+    "spike": 1.3,
+}
 
 
 def freshness_factor(days_old: int) -> float:
@@ -31,12 +67,7 @@ def completeness_factor(level: str) -> float:
     Returns:
         Modifier factor
     """
-    mapping = {
-        "fragment": 0.4,
-        "standard": 1.0,
-        "full": 1.2,
-    }
-    return mapping.get(level.lower(), 1.0)
+    return COMPLETENESS_FACTORS.get(level.lower(), 1.0)
 
 
 def exclusivity_factor(kind: str) -> float:
@@ -49,12 +80,7 @@ def exclusivity_factor(kind: str) -> float:
     Returns:
         Modifier factor
     """
-    mapping = {
-        "widely_leaked": 0.5,
-        "limited": 1.0,
-        "single_seller": 1.5,
-    }
-    return mapping.get(kind.lower(), 1.0)
+    return EXCLUSIVITY_FACTORS.get(kind.lower(), 1.0)
 
 
 def packaging_factor(listing_type: str) -> float:
@@ -67,13 +93,7 @@ def packaging_factor(listing_type: str) -> float:
     Returns:
         Modifier factor
     """
-    mapping = {
-        "retail_lookup": 1.5,
-        "bulk_dump": 0.3,
-        "account_access": 1.0,
-        "document_scan": 1.2,
-    }
-    return mapping.get(listing_type.lower(), 1.0)
+    return PACKAGING_FACTORS.get(listing_type.lower(), 1.0)
 
 
 def reputation_factor(level: str) -> float:
@@ -86,12 +106,7 @@ def reputation_factor(level: str) -> float:
     Returns:
         Modifier factor
     """
-    mapping = {
-        "unknown": 0.9,
-        "verified": 1.0,
-        "escrow_guarantee": 1.2,
-    }
-    return mapping.get(level.lower(), 1.0)
+    return REPUTATION_FACTORS.get(level.lower(), 1.0)
 
 
 def demand_factor(level: str) -> float:
@@ -104,18 +119,45 @@ def demand_factor(level: str) -> float:
     Returns:
         Modifier factor
     """
-    mapping = {
-        "low": 0.8,
-        "normal": 1.0,
-        "high": 1.1,
-        "spike": 1.3,
-    }
-    return mapping.get(level.lower(), 1.0)
+    return DEMAND_FACTORS.get(level.lower(), 1.0)
 
 
-def apply_all_modifiers(base_sum: float, features: dict, vip_add: float = 0.0) -> float:
+# Feature key, reported modifier name and factor function of the categorical
+# modifiers, in application order (freshness is applied before them)
+_CATEGORICAL_DISPATCH = (
+    ("completeness", "completeness", completeness_factor),
+    ("exclusivity", "exclusivity", exclusivity_factor),
+    ("listing_type", "packaging", packaging_factor),
+    ("seller_reputation", "reputation", reputation_factor),
+    ("demand", "demand", demand_factor),
+)
+
+
+@lru_cache(maxsize=4096)
+def _categorical_modifiers(levels: Tuple[Optional[str], ...]) -> Tuple[Tuple[str, float], ...]:
     """
-    Apply all modifiers to base sum.
+    Resolve the categorical levels of a feature set to their modifier factors.
+    
+    Feature sets repeat the same few level combinations, so the results are
+    memoized; the numeric freshness modifier is left out of the key.
+    
+    Args:
+        levels: Level of each _CATEGORICAL_DISPATCH feature (None when absent)
+        
+    Returns:
+        (modifier name, factor) pairs for the levels present, in application order
+    """
+    return tuple(
+        (name, factor_fn(level))
+        for level, (_, name, factor_fn) in zip(levels, _CATEGORICAL_DISPATCH)
+        if level is not None
+    )
+
+
+def apply_all_modifiers_detailed(base_sum: float, features: dict,
+                                 vip_add: float = 0.0) -> Tuple[float, Dict[str, float]]:
+    """
+    Apply all modifiers to base sum and report each factor used.
     
     Args:
         base_sum: Base price sum
@@ -123,36 +165,91 @@ def apply_all_modifiers(base_sum: float, features: dict, vip_add: float = 0.0) -
         vip_add: Additional VIP premium
         
     Returns:
-        Final estimated price
+        Tuple of (final estimated price, modifier factors applied)
     """
+    modifiers: Dict[str, float] = {}
+    days_old = features.get("freshness_days")
+    if days_old is not None:
+        modifiers["freshness"] = freshness_factor(days_old)
+    # Spelled out in _CATEGORICAL_DISPATCH order; cheaper than mapping over the keys
+    get = features.get
+    modifiers.update(_categorical_modifiers(
+        (get("completeness"), get("exclusivity"), get("listing_type"), get("seller_reputation"), get("demand"))
+    ))
+    
     # Apply multiplicative modifiers
     final_price = base_sum
+    for factor in modifiers.values():
+        final_price *= factor
     
-    # Freshness
-    if "freshness_days" in features:
-        final_price *= freshness_factor(features["freshness_days"])
+    # Add VIP premium
+    final_price += vip_add
     
-    # Completeness
-    if "completeness" in features:
-        final_price *= completeness_factor(features["completeness"])
+    return max(0.0, final_price), modifiers  # Ensure non-negative
+
+
+def apply_all_modifiers(base_sum: float, features: dict, vip_add: float = 0.0) -> float:
+    """
+    Apply all modifiers to base sum.
     
-    # Exclusivity
-    if "exclusivity" in features:
-        final_price *= exclusivity_factor(features["exclusivity"])
+    Args:
+        base_sum: Base price sum
+        features: Feature dictionary with modifier values
+        vip_add: Additional VIP premium
+        
+    Returns:
+        Final estimated price
+    """
+    return apply_all_modifiers_detailed(base_sum, features, vip_add)[0]
+
+
+# Feature key and factor table of the categorical modifiers, in application order
+_CATEGORICAL_COLUMNS = (
+    ("completeness", COMPLETENESS_FACTORS),
+    ("exclusivity", EXCLUSIVITY_FACTORS),
+    ("listing_type", PACKAGING_FACTORS),
+    ("seller_reputation", REPUTATION_FACTORS),
+    ("demand", DEMAND_FACTORS),
+)
+
+
+def _categorical_factors(levels: Sequence[Optional[str]], table: Dict[str, float]) -> np.ndarray:
+    """Look up the factor of every level in one column (None and unknown levels map to 1.0)."""
+    return np.fromiter(
+        (1.0 if level is None else table.get(level.lower(), 1.0) for level in levels),
+        dtype=float, count=len(levels)
+    )
+
+
+def apply_all_modifiers_batch(base_sums: Sequence[float], features: Mapping[str, Sequence],
+                              vip_adds: Union[float, Sequence[float]] = 0.0) -> np.ndarray:
+    """
+    Apply all modifiers to many base sums at once.
     
-    # Packaging (from listing type)
-    if "listing_type" in features:
-        final_price *= packaging_factor(features["listing_type"])
+    Equivalent to calling apply_all_modifiers per row, but the factors are
+    combined with array arithmetic instead of per-row Python calls.
     
-    # Reputation
-    if "seller_reputation" in features:
-        final_price *= reputation_factor(features["seller_reputation"])
+    Args:
+        base_sums: Base price sum of each row
+        features: Feature columns keyed like the features of apply_all_modifiers
+            (missing columns and None entries leave that modifier out)
+        vip_adds: Additional VIP premium, per row or shared by all rows
+        
+    Returns:
+        Array of final estimated prices
+    """
+    prices = np.array(base_sums, dtype=float)
     
-    # Demand
-    if "demand" in features:
-        final_price *= demand_factor(features["demand"])
+    days = features.get("freshness_days")
+    if days is not None:
+        days = np.array(days, dtype=float)
+        fresh = np.where(days <= 30, 1.0, np.where(days < 180, 0.5, 0.2))
+        prices *= np.where(np.isnan(days), 1.0, fresh)
     
-    # Add VIP premium
-    final_price += vip_add
+    for key, table in _CATEGORICAL_COLUMNS:
+        levels = features.get(key)
+        if levels is not None:
+            prices *= _categorical_factors(levels, table)
     
-    return max(0.0, final_price)  # Ensure non-negative
+    prices += np.asarray(vip_adds, dtype=float)
+    return np.maximum(prices, 0.0)  # Ensure non-negative
@@ -10,15 +10,16 @@ import click
 from .config import Config
 from .schemas import ItemSpec, DataType, ListingType
 from .ingest import iter_docs, extract_text, chunk_text
-from .extract import sniff_prices, LLMClient, EvidenceExtractor
+from .extract import LLMClient, EvidenceExtractor
 from .aggregate import build_price_bench
 from .estimate import PriceEstimator
 from .estimate.llm_pricing_agent import LLMPricingAgent, HybridPricingAgent
 from .estimate.api_pricing_agent import APIPricingAgent
 from .extract.llm_client import LLMClient
-from .utils.io import save_evidence, save_benchmark, load_benchmark
+from .utils.io import save_evidence, save_benchmark, load_benchmark, load_json
 from .ingest.loader import scrape_and_save_web_content
 from .ingest.api_parser import load_apis_from_file
+from .utils.log import setup_logging
 
 
 @click.group()
@@ -26,6 +27,7 @@ from .ingest.api_parser import load_apis_from_file
 @click.pass_context
 def cli(ctx, config):
     """Pricing Agent - Analyze dark web pricing documents and estimate data breach prices."""
+    setup_logging()
     ctx.ensure_object(dict)
     ctx.obj['config'] = Config.from_env()
 
@@ -46,11 +48,12 @@ def run_pipeline(ctx, repo_docs, evidence_output, benchmark_output, api_key):
     click.echo("Starting pricing pipeline...")
     
     # Initialize LLM client
-    llm_client = LLMClient(config.llm_api_key, config.llm_model)
+    llm_client = LLMClient(config.llm_api_key, config.llm_model, cache_dir=config.extraction_cache_dir)
     extractor = EvidenceExtractor(llm_client)
     
     # Collect all evidence
     all_evidence = []
+    pending_chunks = []
     
     click.echo(f"Processing documents in {repo_docs}...")
     
@@ -66,16 +69,12 @@ def run_pipeline(ctx, repo_docs, evidence_output, benchmark_output, api_key):
         # Chunk text
         chunks = chunk_text(text, config.chunk_size, config.chunk_overlap)
         
-        # Extract evidence from each chunk
-        for i, chunk in enumerate(chunks):
-            # Quick regex check for price mentions
-            price_mentions = sniff_prices(chunk)
-            if not price_mentions:
-                continue
-            
-            # Extract structured evidence
-            evidence = extractor.extract_from_chunk(doc_info, chunk)
-            all_evidence.extend(evidence)
+        pending_chunks.extend((doc_info, chunk) for chunk in chunks)
+    
+    # Extract structured evidence, several chunks per LLM call; chunks
+    # without a regex price signal are skipped by the extractor
+    all_evidence.extend(extractor.extract_from_chunks(pending_chunks))
+    click.echo(f"Skipped {extractor.chunks_skipped}/{extractor.chunks_checked} chunks without price mentions")
     
     click.echo(f"Extracted {len(all_evidence)} price evidence entries")
     
@@ -221,9 +220,7 @@ def llm_estimate(ctx, benchmark_file, data_type, region, freshness_days,
     click.echo("Initializing LLM pricing agent...")
     
     # Load benchmark as raw JSON for LLM context
-    import json
-    with open(benchmark_file, 'r') as f:
-        benchmark_raw = json.load(f)
+    benchmark_raw = load_json(benchmark_file)
     
     # Initialize LLM client and agent
     llm_client = LLMClient(api_key, config.llm_model)
@@ -362,8 +359,7 @@ def price_apis(ctx, api_definition_file, api_key, benchmark_file, output, limit)
     if benchmark_file:
         click.echo(f"Loading benchmark data from {benchmark_file}...")
         try:
-            with open(benchmark_file, 'r') as f:
-                benchmark_data = json.load(f)
+            benchmark_data = load_json(benchmark_file)
             click.echo(f"Loaded {len(benchmark_data)} benchmark entries")
         except Exception as e:
             click.echo(f"Warning: Could not load benchmark data: {e}")
@@ -517,14 +513,12 @@ def content_estimate_cmd(ctx, api_response_file, api_key, output, model_params):
     
     try:
         # Load API response
-        with open(api_response_file, 'r') as f:
-            api_response = json.load(f)
+        api_response = load_json(api_response_file)
         
         # Load model params if provided
         params = None
         if model_params:
-            with open(model_params, 'r') as f:
-                params = json.load(f)
+            params = load_json(model_params)
         
         # Initialize agent
         click.echo("Initializing content pricing agent...")
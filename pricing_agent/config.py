@@ -18,6 +18,7 @@ class Config(BaseModel):
     chunk_size: int = Field(default=3000, description="Maximum characters per text chunk")
     chunk_overlap: int = Field(default=200, description="Overlap between chunks")
     min_confidence: float = Field(default=0.5, description="Minimum confidence for price evidence")
+    extraction_cache_dir: Optional[str] = Field(default=None, description="Directory for cached LLM extractions (disabled if unset)")
     
     # File paths
     repo_docs_dir: str = Field(default="repo_docs", description="Directory containing source documents")
@@ -34,6 +35,7 @@ class Config(BaseModel):
             chunk_size=int(os.getenv("CHUNK_SIZE", "3000")),
             chunk_overlap=int(os.getenv("CHUNK_OVERLAP", "200")),
             min_confidence=float(os.getenv("MIN_CONFIDENCE", "0.5")),
+            extraction_cache_dir=os.getenv("EXTRACTION_CACHE_DIR"),
             repo_docs_dir=os.getenv("REPO_DOCS_DIR", "repo_docs"),
             sources_file=os.getenv("SOURCES_FILE", "sources.yml"),
         )
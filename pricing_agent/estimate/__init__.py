@@ -1,7 +1,7 @@
 """Price estimation module."""
 
 from .estimator import PriceEstimator
-from .rule_model import apply_modifiers
+from .rule_model import apply_modifiers, apply_modifiers_detailed
 from .voi_model import VoIModel, AttackerAction, VictimState, ExPostParams
 from .ex_post_inference import ExPostInference
 from .voi_pricing_agent import VoIPricingAgent
@@ -9,6 +9,7 @@ from .voi_pricing_agent import VoIPricingAgent
 __all__ = [
     "PriceEstimator", 
     "apply_modifiers",
+    "apply_modifiers_detailed",
     "VoIModel",
     "AttackerAction",
     "VictimState",
@@ -1,8 +1,8 @@
-import json
 from typing import Dict, Any, Optional, List
 from ..extract.llm_client import LLMClient
 from ..api_schemas import APIDefinition, APIPricingResult, APIBatchPricingResult
 from ..schemas import DataType
+from ..utils.io import dumps_indented
 
 
 class APIPricingAgent:
@@ -60,7 +60,7 @@ class APIPricingAgent:
         
         benchmark_context = ""
         if self.benchmark_data:
-            benchmark_context = f"\n\nHISTORICAL PERSONAL DATA PRICING (for reference):\n{json.dumps(self.benchmark_data[:10], indent=2)}"
+            benchmark_context = f"\n\nHISTORICAL PERSONAL DATA PRICING (for reference):\n{dumps_indented(self.benchmark_data[:10])}"
         
         prompt = f"""Analyze this API and estimate the potential revenue that could be earned per API call.
 
@@ -81,7 +81,7 @@ OUTPUT FIELDS:
 {benchmark_context}
 
 MARKET CONTEXT:
-{json.dumps(market_context or {}, indent=2)}
+{dumps_indented(market_context or {})}
 
 ANALYSIS TASK:
 ==============
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 
 from ..schemas import ContentPriceEstimate
+from ..utils.cache import ResponseCache
 from .llm_variable_scorer import LLMVariableScorer
 from .pricing_formulas import LogLinearPricingModel, MultiplicativePricingModel
 
@@ -81,7 +82,8 @@ class ContentPricingAgent:
     def __init__(self, 
                  llm_client,
                  model_params: Optional[Dict] = None,
-                 anchors: Optional[List[Dict]] = None):
+                 anchors: Optional[List[Dict]] = None,
+                 response_cache: Optional[ResponseCache] = None):
         """
         Initialize content pricing agent.
         
@@ -89,8 +91,9 @@ class ContentPricingAgent:
             llm_client: LLMClient instance
             model_params: Model parameters dict (uses defaults if None)
             anchors: List of price anchors (uses defaults if None)
+            response_cache: Cache for LLM variable scores (optional)
         """
-        self.scorer = LLMVariableScorer(llm_client)
+        self.scorer = LLMVariableScorer(llm_client, response_cache)
         self.model_params = model_params or DEFAULT_MODEL_PARAMS
         self.log_linear_model = LogLinearPricingModel(self.model_params)
         self.anchors = anchors or DEFAULT_ANCHORS
@@ -1,45 +1,123 @@
 """Main price estimator."""
 
-from typing import List, Dict, Any
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
 from ..schemas import PriceBenchRow, ItemSpec, EstimationResult, DataType, ListingType
-from ..aggregate.aggregator import get_benchmark_for_spec
-from .rule_model import apply_modifiers
+from ..aggregate.modifiers import apply_all_modifiers_batch
+from .rule_model import apply_modifiers_detailed
+
+# Enum positions used as array coordinates in the batched p50 tables
+_DATA_TYPE_INDEX: Dict[DataType, int] = {dt: i for i, dt in enumerate(DataType)}
+_LISTING_TYPE_INDEX: Dict[ListingType, int] = {lt: i for i, lt in enumerate(ListingType)}
+
+# Default number of estimation results kept per estimator (0: caching is opt-in)
+ESTIMATE_CACHE_SIZE = 0
 
 
 class PriceEstimator:
     """Estimates prices based on benchmarks and modifiers."""
     
-    def __init__(self, bench: List[PriceBenchRow]):
+    __slots__ = ("bench", "_bench_has_data", "_bench_index", "_p50_tables",
+                 "_estimate_cache", "_estimate_cache_size", "_estimate_cache_lock")
+    
+    def __init__(self, bench: List[PriceBenchRow], estimate_cache_size: int = ESTIMATE_CACHE_SIZE):
         """
         Initialize estimator with price benchmark.
         
         Args:
             bench: List of price benchmark rows
+            estimate_cache_size: Maximum number of cached estimation results
+                (least recently used are evicted; 0, the default, disables caching)
         """
         self.bench = bench
+        self._bench_has_data = any(row.n > 0 for row in bench)
+        
+        # (data_type, listing_type, region) -> first matching row, the same
+        # row get_benchmark_for_spec would find by scanning the list
+        self._bench_index: Dict[Tuple[DataType, ListingType, Optional[str]], PriceBenchRow] = {}
+        for row in bench:
+            self._bench_index.setdefault((row.data_type, row.listing_type, row.region), row)
+        
+        # region -> (data_type, listing_type) array of component prices, built on first use
+        self._p50_tables: Dict[Optional[str], np.ndarray] = {}
+        
+        self._estimate_cache: "OrderedDict[tuple, EstimationResult]" = OrderedDict()
+        self._estimate_cache_size = estimate_cache_size
+        self._estimate_cache_lock = threading.Lock()
     
     def estimate(self, spec: ItemSpec) -> EstimationResult:
         """
         Estimate price for given item specification.
         
+        When estimate_cache_size is set, results are cached by specification
+        content; each call gets its own copy of the modifiers and components,
+        so the cache cannot be altered.
+        
         Args:
             spec: Item specification
             
         Returns:
             Estimation result
         """
+        key = self._estimate_key(spec)
+        if key is None or not self._estimate_cache_size:
+            return self._estimate_uncached(spec)
+        
+        cache = self._estimate_cache
+        with self._estimate_cache_lock:
+            result = cache.get(key)
+            if result is not None:
+                cache.move_to_end(key)
+        if result is not None:
+            return self._copy_result(result)
+        
+        result = self._estimate_uncached(spec)
+        with self._estimate_cache_lock:
+            cache[key] = result
+            if len(cache) > self._estimate_cache_size:
+                cache.popitem(last=False)
+        return self._copy_result(result)
+    
+    @staticmethod
+    def _copy_result(result: EstimationResult) -> EstimationResult:
+        """Copy a cached result with its own modifiers dict and components list."""
+        return result.model_copy(update={
+            "modifiers_applied": dict(result.modifiers_applied),
+            "components_used": list(result.components_used)
+        })
+    
+    def cache_clear(self) -> None:
+        """Drop cached estimation results and price tables (e.g. after the benchmark is refreshed)."""
+        with self._estimate_cache_lock:
+            self._estimate_cache.clear()
+        self._p50_tables.clear()
+    
+    @staticmethod
+    def _estimate_key(spec: ItemSpec) -> Optional[tuple]:
+        """Build the cache key of a specification (None if a feature value is unhashable)."""
+        key = (spec.data_type, spec.region, spec.listing_type, tuple(spec.components),
+               tuple(sorted(spec.features.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _estimate_uncached(self, spec: ItemSpec) -> EstimationResult:
+        """Estimate price for given item specification without the result cache."""
         # Get base components
         base_sum, components_used = self.pick_base_components(spec)
         
-        # Apply modifiers
-        est_price = apply_modifiers(base_sum, spec.features)
+        # Apply modifiers, keeping the factors used
+        est_price, modifiers_applied = apply_modifiers_detailed(base_sum, spec.features)
         
         # Calculate confidence based on available data
         confidence = self._calculate_confidence(spec, components_used)
         
-        # Extract modifiers applied
-        modifiers_applied = self._extract_modifiers_applied(spec.features)
-        
         return EstimationResult(
             base_sum=base_sum,
             est_price=est_price,
@@ -48,10 +126,86 @@ class PriceEstimator:
             confidence=confidence
         )
     
+    def batch_estimate(self, specs: List[ItemSpec]) -> List[EstimationResult]:
+        """
+        Estimate prices for several item specifications.
+        
+        Args:
+            specs: Item specifications
+            
+        Returns:
+            Estimation results, in the same order as specs
+        """
+        estimate = self.estimate
+        return [estimate(spec) for spec in specs]
+    
+    def batch_base_sums(self, specs: List[ItemSpec]) -> np.ndarray:
+        """
+        Compute the base sum of many item specifications at once.
+        
+        Component prices are gathered from per-region p50 tables with one
+        fancy-indexing read and summed per specification.
+        
+        Args:
+            specs: Item specifications
+            
+        Returns:
+            Array of base sums, equal to pick_base_components(spec)[0] per spec
+        """
+        regions: Dict[Optional[str], int] = {}
+        owners: List[int] = []
+        region_codes: List[int] = []
+        dt_codes: List[int] = []
+        lt_codes: List[int] = []
+        for i, spec in enumerate(specs):
+            region_code = regions.setdefault(spec.region, len(regions))
+            lt_code = _LISTING_TYPE_INDEX[spec.listing_type]
+            # Primary data type first, each data type counted once
+            for data_type in dict.fromkeys([spec.data_type, *spec.components]):
+                owners.append(i)
+                region_codes.append(region_code)
+                dt_codes.append(_DATA_TYPE_INDEX[data_type])
+                lt_codes.append(lt_code)
+        
+        if not owners:
+            return np.zeros(len(specs))
+        tables = np.stack([self._p50_table(region) for region in regions])
+        prices = tables[region_codes, dt_codes, lt_codes]
+        return np.bincount(owners, weights=prices, minlength=len(specs))
+    
+    def batch_est_prices(self, specs: List[ItemSpec]) -> np.ndarray:
+        """
+        Compute the estimated price of many item specifications at once.
+        
+        Args:
+            specs: Item specifications
+            
+        Returns:
+            Array of estimated prices, equal to estimate(spec).est_price per spec
+        """
+        keys = {key for spec in specs for key in spec.features}
+        features = {key: [spec.features.get(key) for spec in specs] for key in keys}
+        vip_adds = [spec.features.get("vip_add", 0.0) for spec in specs]
+        return apply_all_modifiers_batch(self.batch_base_sums(specs), features, vip_adds)
+    
+    def _p50_table(self, region: Optional[str]) -> np.ndarray:
+        """Get the (data_type, listing_type) component price table of a region."""
+        table = self._p50_tables.get(region)
+        if table is None:
+            table = np.zeros((len(_DATA_TYPE_INDEX), len(_LISTING_TYPE_INDEX)))
+            for data_type, i in _DATA_TYPE_INDEX.items():
+                for listing_type, j in _LISTING_TYPE_INDEX.items():
+                    table[i, j] = self._get_component_price(data_type, listing_type, region)
+            self._p50_tables[region] = table
+        return table
+    
     def pick_base_components(self, spec: ItemSpec) -> tuple[float, List[DataType]]:
         """
         Pick base price components for the specification.
         
+        Each data type is counted once: components repeating the primary
+        data type or an earlier component are skipped.
+        
         Args:
             spec: Item specification
             
@@ -68,34 +222,48 @@ class PriceEstimator:
             components_used.append(spec.data_type)
         
         # Add additional components
+        seen = {spec.data_type}
         for component in spec.components:
-            if component != spec.data_type:  # Avoid double counting
-                component_price = self._get_component_price(component, spec.listing_type, spec.region)
-                if component_price is not None:
-                    base_sum += component_price
-                    components_used.append(component)
+            if component in seen:  # Avoid double counting
+                continue
+            seen.add(component)
+            component_price = self._get_component_price(component, spec.listing_type, spec.region)
+            if component_price is not None:
+                base_sum += component_price
+                components_used.append(component)
         
         return base_sum, components_used
     
+    def _lookup_benchmark(self, data_type: DataType, listing_type: ListingType,
+                          region: str = None) -> Optional[PriceBenchRow]:
+        """Find the benchmark row for a component, falling back to the "ANY" region."""
+        bench_row = self._bench_index.get((data_type, listing_type, region))
+        if bench_row is None and region:
+            bench_row = self._bench_index.get((data_type, listing_type, "ANY"))
+        return bench_row
+    
     def _get_component_price(self, data_type: DataType, listing_type: ListingType, region: str = None) -> float:
         """Get price for a specific component."""
-        bench_row = get_benchmark_for_spec(self.bench, data_type, listing_type, region)
+        bench_row = self._lookup_benchmark(data_type, listing_type, region)
         if bench_row:
             return bench_row.p50  # Use median price
         return 0.0
     
     def _calculate_confidence(self, spec: ItemSpec, components_used: List[DataType]) -> float:
         """Calculate confidence in the estimate."""
-        if not components_used:
+        if not components_used or not self._bench_has_data:
             return 0.0
         
-        # Check if we actually found benchmark data for any components
+        # Adjust for data availability, checking that we actually found
+        # benchmark data for at least one component
         has_benchmark_data = False
+        data_availability = 0.0
         for component in components_used:
-            bench_row = get_benchmark_for_spec(self.bench, component, spec.listing_type, spec.region)
+            bench_row = self._lookup_benchmark(component, spec.listing_type, spec.region)
             if bench_row and bench_row.n > 0:
                 has_benchmark_data = True
-                break
+                # Higher confidence for more data points
+                data_availability += min(1.0, bench_row.n / 10.0)
         
         if not has_benchmark_data:
             return 0.0
@@ -103,49 +271,8 @@ class PriceEstimator:
         # Base confidence on how many components we found data for
         component_coverage = len(components_used) / (1 + len(spec.components))
         
-        # Adjust for data availability
-        data_availability = 0.0
-        for component in components_used:
-            bench_row = get_benchmark_for_spec(self.bench, component, spec.listing_type, spec.region)
-            if bench_row and bench_row.n > 0:
-                # Higher confidence for more data points
-                data_availability += min(1.0, bench_row.n / 10.0)
-        
         data_availability /= len(components_used)
         
         # Combine factors
         confidence = (component_coverage * 0.6 + data_availability * 0.4)
         return min(1.0, confidence)
-    
-    def _extract_modifiers_applied(self, features: Dict[str, Any]) -> Dict[str, float]:
-        """Extract the modifiers that were applied."""
-        modifiers = {}
-        
-        # Import modifier functions
-        from ..aggregate.modifiers import (
-            freshness_factor, completeness_factor, exclusivity_factor,
-            packaging_factor, reputation_factor, demand_factor
-        )
-        
-        if "freshness_days" in features:
-            modifiers["freshness"] = freshness_factor(features["freshness_days"])
-        
-        if "completeness" in features:
-            modifiers["completeness"] = completeness_factor(features["completeness"])
-        
-        if "exclusivity" in features:
-            modifiers["exclusivity"] = exclusivity_factor(features["exclusivity"])
-        
-        if "listing_type" in features:
-            modifiers["packaging"] = packaging_factor(features["listing_type"])
-        
-        if "seller_reputation" in features:
-            modifiers["reputation"] = reputation_factor(features["seller_reputation"])
-        
-        if "demand" in features:
-            modifiers["demand"] = demand_factor(features["demand"])
-        
-        if "vip_add" in features:
-            modifiers["vip_add"] = features["vip_add"]
-        
-        return modifiers
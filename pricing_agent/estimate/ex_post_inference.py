@@ -1,7 +1,10 @@
-import json
+import logging
 from typing import Dict, Any
+from ..utils.io import dumps_indented
 from .voi_model import AttackerAction, ExPostParams
 
+logger = logging.getLogger(__name__)
+
 
 EX_POST_INFERENCE_PROMPT = """You are an expert in adversarial information economics and cybersecurity risk assessment. Analyze this telecom API response to estimate ex-post parameters for an attacker's decision model.
 
@@ -102,10 +105,33 @@ OUTPUT FORMAT (valid JSON only):
 
 Provide ONLY valid JSON. No additional text."""
 
+_ACTIONS = tuple(AttackerAction)
+_ACTION_VALUES = tuple(action.value for action in _ACTIONS)
+
+EX_POST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        value: {
+            "type": "object",
+            "properties": {
+                "P_success": {"type": "number", "minimum": 0, "maximum": 1},
+                "R_expected": {"type": "number", "minimum": 0},
+                "C_cost": {"type": "number", "minimum": 0},
+                "detection_risk": {"type": "number", "minimum": 0, "maximum": 1},
+                "reasoning": {"type": "string"}
+            },
+            "required": ["P_success", "R_expected", "C_cost", "detection_risk"]
+        } for value in _ACTION_VALUES
+    },
+    "required": list(_ACTION_VALUES)
+}
+
 
 class ExPostInference:
     """Extracts ex-post parameters from API responses using LLM."""
     
+    __slots__ = ("llm",)
+    
     def __init__(self, llm_client):
         self.llm = llm_client
     
@@ -118,7 +144,7 @@ class ExPostInference:
             )
         
         prompt = EX_POST_INFERENCE_PROMPT.format(
-            api_response_json=json.dumps(api_response, indent=2)
+            api_response_json=dumps_indented(api_response)
         )
         
         last_error = None
@@ -130,36 +156,19 @@ class ExPostInference:
                     "parameters for attacker utility functions. Provide only valid JSON output."
                 )
                 
-                schema = {
-                    "type": "object",
-                    "properties": {
-                        action.value: {
-                            "type": "object",
-                            "properties": {
-                                "P_success": {"type": "number", "minimum": 0, "maximum": 1},
-                                "R_expected": {"type": "number", "minimum": 0},
-                                "C_cost": {"type": "number", "minimum": 0},
-                                "detection_risk": {"type": "number", "minimum": 0, "maximum": 1},
-                                "reasoning": {"type": "string"}
-                            },
-                            "required": ["P_success", "R_expected", "C_cost", "detection_risk"]
-                        } for action in AttackerAction
-                    },
-                    "required": [action.value for action in AttackerAction]
-                }
-                
-                result = self.llm.json_extract(system_prompt, prompt, schema)
+                result = self.llm.json_extract(system_prompt, prompt, EX_POST_SCHEMA,
+                                              validate=self._validate_ex_post_output)
                 
                 if self._validate_ex_post_output(result):
                     return self._parse_ex_post(result)
                 else:
                     last_error = "Invalid ex-post parameters returned from LLM"
                     if attempt < max_retries - 1:
-                        print(f"Attempt {attempt + 1}: Invalid LLM output, retrying...")
+                        logger.warning("Attempt %d: Invalid LLM output, retrying...", attempt + 1)
                         
             except Exception as e:
                 last_error = str(e)
-                print(f"Ex-post inference attempt {attempt + 1}/{max_retries} failed: {e}")
+                logger.warning("Ex-post inference attempt %d/%d failed: %s", attempt + 1, max_retries, e)
         
         raise RuntimeError(f"Ex-post inference failed after {max_retries} attempts. Last error: {last_error}")
     
@@ -167,11 +176,11 @@ class ExPostInference:
         if not output or not isinstance(output, dict):
             return False
         
-        for action in AttackerAction:
-            if action.value not in output:
+        for value in _ACTION_VALUES:
+            if value not in output:
                 return False
             
-            params = output[action.value]
+            params = output[value]
             required_keys = ["P_success", "R_expected", "C_cost", "detection_risk"]
             
             for key in required_keys:
@@ -196,8 +205,8 @@ class ExPostInference:
         C_cost = {}
         detection_risk = {}
         
-        for action in AttackerAction:
-            params = llm_output[action.value]
+        for action, value in zip(_ACTIONS, _ACTION_VALUES):
+            params = llm_output[value]
             P_success[action] = float(params["P_success"])
             R_expected[action] = float(params["R_expected"])
             C_cost[action] = float(params["C_cost"])
@@ -1,24 +1,129 @@
 """LLM-based pricing agent for comprehensive price determination."""
 
-import json
-from typing import Dict, Any, Optional, List
+import heapq
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
 from ..extract.llm_client import LLMClient
 from ..schemas import ItemSpec, DataType, ListingType, PriceEvidence
+from ..utils.cache import ResponseCache, canonical_key
+from ..utils.io import dumps_indented
+
+
+PRICING_SYSTEM_PROMPT = """You are an expert dark web market analyst specializing in data pricing. Your task is to determine the most accurate market price for data items based on:
+
+1. Historical pricing data and benchmarks
+2. Current market conditions and trends
+3. Data quality and characteristics
+4. Seller reputation and trust factors
+5. Regional and temporal variations
+
+You have deep knowledge of:
+- Dark web market dynamics
+- Data valuation principles
+- Price elasticity and demand factors
+- Quality assessment metrics
+- Market psychology and behavior
+
+IMPORTANT: You must respond with ONLY a valid JSON object that matches the required schema. Do not include any explanatory text, markdown formatting, or additional commentary outside the JSON. Your response should start with { and end with }.
+
+Provide accurate, well-reasoned price determinations that reflect real market conditions. Consider both quantitative factors (historical prices, quality metrics) and qualitative factors (market sentiment, exclusivity, trust)."""
+
+PRICING_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "determined_price": {
+            "type": "number",
+            "description": "The predicted market price for this data item"
+        },
+        "confidence": {
+            "type": "number",
+            "minimum": 0.0,
+            "maximum": 1.0,
+            "description": "Confidence in the price prediction (0-1)"
+        },
+        "reasoning": {
+            "type": "string",
+            "description": "Detailed reasoning explaining the price analysis"
+        },
+        "key_factors": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Key factors that influenced the pricing decision"
+        },
+        "market_sentiment": {
+            "type": "string",
+            "description": "Market sentiment classification (bearish/neutral/bullish)"
+        },
+        "price_range": {
+            "type": "object",
+            "properties": {
+                "min_price": {"type": "number"},
+                "max_price": {"type": "number"}
+            },
+            "description": "Confidence interval for the price"
+        },
+        "market_conditions": {
+            "type": "object",
+            "properties": {
+                "demand_level": {"type": "string"},
+                "supply_level": {"type": "string"},
+                "market_trend": {"type": "string"}
+            },
+            "description": "Current market conditions assessment"
+        },
+        "quality_assessment": {
+            "type": "object",
+            "properties": {
+                "data_quality": {"type": "string"},
+                "completeness": {"type": "string"},
+                "freshness": {"type": "string"},
+                "exclusivity": {"type": "string"}
+            },
+            "description": "Assessment of data quality factors"
+        },
+        "comparison_to_benchmarks": {
+            "description": "Comparison to historical benchmark data"
+        }
+    },
+    "required": ["determined_price", "confidence", "reasoning", "key_factors"]
+}
 
 
 class LLMPricingAgent:
     """LLM-based agent that determines exact prices for data items."""
     
-    def __init__(self, llm_client: LLMClient, benchmark_data: List[Dict[str, Any]]):
+    __slots__ = ("llm_client", "benchmark_data", "response_cache", "_by_dt", "_by_lt", "_by_region",
+                 "_bench_json_cache", "_relevant_cache")
+    
+    def __init__(self, llm_client: LLMClient, benchmark_data: List[Dict[str, Any]],
+                 response_cache: Optional[ResponseCache] = None):
         """
         Initialize LLM pricing agent.
         
         Args:
             llm_client: LLM client for price determination
             benchmark_data: Historical benchmark data for context
+            response_cache: Cache of validated LLM results (optional)
         """
         self.llm_client = llm_client
-        self.benchmark_data = benchmark_data
+        self.response_cache = response_cache
+        # Frozen so the indexes and JSON cache below stay in sync with the rows
+        self.benchmark_data: Tuple[Dict[str, Any], ...] = tuple(benchmark_data)
+        
+        # Inverted indexes from field value to benchmark row positions
+        self._by_dt: Dict[Any, List[int]] = defaultdict(list)
+        self._by_lt: Dict[Any, List[int]] = defaultdict(list)
+        self._by_region: Dict[Any, List[int]] = defaultdict(list)
+        for i, benchmark in enumerate(self.benchmark_data):
+            self._by_dt[benchmark.get('data_type')].append(i)
+            self._by_lt[benchmark.get('listing_type')].append(i)
+            self._by_region[benchmark.get('region')].append(i)
+        
+        # Serialized benchmark JSON keyed by the tuple of row indices
+        self._bench_json_cache: Dict[Tuple[int, ...], str] = {}
+        # Relevant row indices keyed by (data_type, listing_type, region)
+        self._relevant_cache: Dict[Tuple[Any, Any, Any], Tuple[int, ...]] = {}
     
     def determine_price(self, item_spec: ItemSpec, market_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -31,9 +136,18 @@ class LLMPricingAgent:
         Returns:
             Dictionary with price determination and reasoning
         """
-        relevant_benchmarks = self._get_relevant_benchmarks(item_spec)
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = canonical_key(item_spec.model_dump(mode="json"), market_context)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
         
-        prompt = self._build_pricing_prompt(item_spec, relevant_benchmarks, market_context)
+        idxs = self._get_relevant_indices(item_spec)
+        relevant_benchmarks = [self.benchmark_data[i] for i in idxs]
+        
+        prompt = self._build_pricing_prompt(item_spec, relevant_benchmarks, market_context,
+                                            benchmarks_json=self._get_benchmarks_json(idxs))
         
         result = self.llm_client.json_extract(
             system_prompt=self._get_pricing_system_prompt(),
@@ -46,29 +160,45 @@ class LLMPricingAgent:
         
         if not result.get("determined_price") or not result.get("confidence"):
             raise Exception("LLM returned invalid result")
+        
+        if cache_key is not None:
+            self.response_cache.put(cache_key, result)
         return result
     
     
+    def _get_relevant_indices(self, item_spec: ItemSpec) -> Tuple[int, ...]:
+        """Get indices of relevant benchmark rows for the item specification."""
+        key = (item_spec.data_type.value, item_spec.listing_type.value, item_spec.region)
+        relevant = self._relevant_cache.get(key)
+        if relevant is None:
+            data_type, listing_type, region = key
+            # Match by data type, listing type or region, keeping benchmark order
+            idxs = set(self._by_dt.get(data_type, ()))
+            idxs.update(self._by_lt.get(listing_type, ()))
+            idxs.update(self._by_region.get(region, ()))
+            
+            relevant = tuple(heapq.nsmallest(10, idxs))  # Limit to top 10 most relevant
+            self._relevant_cache[key] = relevant
+        return relevant
+    
     def _get_relevant_benchmarks(self, item_spec: ItemSpec) -> List[Dict[str, Any]]:
         """Get relevant benchmark data for the item specification."""
-        relevant = []
-        
-        for benchmark in self.benchmark_data:
-            # Match by data type
-            if benchmark.get('data_type') == item_spec.data_type.value:
-                relevant.append(benchmark)
-            # Match by listing type
-            elif benchmark.get('listing_type') == item_spec.listing_type.value:
-                relevant.append(benchmark)
-            # Match by region
-            elif benchmark.get('region') == item_spec.region:
-                relevant.append(benchmark)
-        
-        return relevant[:10]  # Limit to top 10 most relevant
+        return [self.benchmark_data[i] for i in self._get_relevant_indices(item_spec)]
+    
+    def _get_benchmarks_json(self, idxs: Tuple[int, ...]) -> str:
+        """Get serialized benchmark rows, encoding each index set only once."""
+        benchmarks_json = self._bench_json_cache.get(idxs)
+        if benchmarks_json is None:
+            benchmarks_json = dumps_indented([self.benchmark_data[i] for i in idxs])
+            self._bench_json_cache[idxs] = benchmarks_json
+        return benchmarks_json
     
     def _build_pricing_prompt(self, item_spec: ItemSpec, benchmarks: List[Dict[str, Any]], 
-                            market_context: Optional[Dict[str, Any]]) -> str:
+                            market_context: Optional[Dict[str, Any]],
+                            benchmarks_json: Optional[str] = None) -> str:
         """Build comprehensive pricing prompt."""
+        if benchmarks_json is None:
+            benchmarks_json = dumps_indented(benchmarks)
         
         # Extract key features for emphasis
         freshness_days = item_spec.features.get('freshness_days', 'unknown')
@@ -94,10 +224,10 @@ KEY ITEM CHARACTERISTICS:
 - VIP Add-on: ${vip_add}
 
 HISTORICAL BENCHMARK DATA:
-{json.dumps(benchmarks, indent=2)}
+{benchmarks_json}
 
 MARKET CONTEXT:
-{json.dumps(market_context or {}, indent=2)}
+{dumps_indented(market_context) if market_context else '{}'}
 
 ANALYSIS APPROACH:
 1. Examine the historical benchmarks to understand typical pricing for this data type
@@ -143,91 +273,18 @@ Do not include any text outside the JSON object."""
     
     def _get_pricing_system_prompt(self) -> str:
         """Get system prompt for pricing agent."""
-        return """You are an expert dark web market analyst specializing in data pricing. Your task is to determine the most accurate market price for data items based on:
-
-1. Historical pricing data and benchmarks
-2. Current market conditions and trends
-3. Data quality and characteristics
-4. Seller reputation and trust factors
-5. Regional and temporal variations
-
-You have deep knowledge of:
-- Dark web market dynamics
-- Data valuation principles
-- Price elasticity and demand factors
-- Quality assessment metrics
-- Market psychology and behavior
-
-IMPORTANT: You must respond with ONLY a valid JSON object that matches the required schema. Do not include any explanatory text, markdown formatting, or additional commentary outside the JSON. Your response should start with { and end with }.
-
-Provide accurate, well-reasoned price determinations that reflect real market conditions. Consider both quantitative factors (historical prices, quality metrics) and qualitative factors (market sentiment, exclusivity, trust)."""
+        return PRICING_SYSTEM_PROMPT
     
     def _get_pricing_schema(self) -> Dict[str, Any]:
         """Get JSON schema for pricing response."""
-        return {
-            "type": "object",
-            "properties": {
-                "determined_price": {
-                    "type": "number",
-                    "description": "The predicted market price for this data item"
-                },
-                "confidence": {
-                    "type": "number",
-                    "minimum": 0.0,
-                    "maximum": 1.0,
-                    "description": "Confidence in the price prediction (0-1)"
-                },
-                "reasoning": {
-                    "type": "string",
-                    "description": "Detailed reasoning explaining the price analysis"
-                },
-                "key_factors": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Key factors that influenced the pricing decision"
-                },
-                "market_sentiment": {
-                    "type": "string",
-                    "description": "Market sentiment classification (bearish/neutral/bullish)"
-                },
-                "price_range": {
-                    "type": "object",
-                    "properties": {
-                        "min_price": {"type": "number"},
-                        "max_price": {"type": "number"}
-                    },
-                    "description": "Confidence interval for the price"
-                },
-                "market_conditions": {
-                    "type": "object",
-                    "properties": {
-                        "demand_level": {"type": "string"},
-                        "supply_level": {"type": "string"},
-                        "market_trend": {"type": "string"}
-                    },
-                    "description": "Current market conditions assessment"
-                },
-                "quality_assessment": {
-                    "type": "object",
-                    "properties": {
-                        "data_quality": {"type": "string"},
-                        "completeness": {"type": "string"},
-                        "freshness": {"type": "string"},
-                        "exclusivity": {"type": "string"}
-                    },
-                    "description": "Assessment of data quality factors"
-                },
-                "comparison_to_benchmarks": {
-                    "description": "Comparison to historical benchmark data"
-                }
-            },
-            "required": ["determined_price", "confidence", "reasoning", "key_factors"]
-        }
+        return PRICING_SCHEMA
 
 
 class HybridPricingAgent:
     """Hybrid agent combining rule-based and LLM-based pricing."""
     
+    __slots__ = ("rule_estimator", "llm_agent")
+    
     def __init__(self, rule_estimator, llm_agent: LLMPricingAgent):
         """
         Initialize hybrid pricing agent.
@@ -255,6 +312,51 @@ class HybridPricingAgent:
         # Get rule-based estimate
         rule_result = self.rule_estimator.estimate(item_spec)
         
+        # Get LLM-based estimate
+        llm_result = self.llm_agent.determine_price(item_spec, market_context) if use_llm else None
+        
+        return self._combine_results(rule_result, llm_result)
+    
+    def estimate_prices_batch(self, item_specs: List[ItemSpec], use_llm: bool = True,
+                              market_context: Optional[Dict[str, Any]] = None,
+                              max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Estimate prices for several items, issuing LLM calls concurrently.
+        
+        Rule-based estimates are computed up front; the LLM client is
+        synchronous, so the LLM calls are then spread over worker threads
+        and overlap. Results keep the order of item_specs.
+        
+        Args:
+            item_specs: Item specifications to price
+            use_llm: Whether to use LLM agent (default: True)
+            market_context: Additional market context shared by all items
+            max_workers: Maximum number of concurrent LLM calls
+            
+        Returns:
+            List of pricing results, one per item specification
+        """
+        rule_results = [self.rule_estimator.estimate(spec) for spec in item_specs]
+        
+        if not use_llm:
+            return [self._combine_results(rule_result, None) for rule_result in rule_results]
+        
+        if len(item_specs) <= 1:
+            llm_results = [self.llm_agent.determine_price(spec, market_context) for spec in item_specs]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(item_specs))) as executor:
+                llm_results = list(executor.map(
+                    lambda spec: self.llm_agent.determine_price(spec, market_context),
+                    item_specs
+                ))
+        
+        return [
+            self._combine_results(rule_result, llm_result)
+            for rule_result, llm_result in zip(rule_results, llm_results)
+        ]
+    
+    def _combine_results(self, rule_result, llm_result: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine a rule-based estimate with an optional LLM result."""
         result = {
             "rule_based_price": rule_result.est_price,
             "rule_based_confidence": rule_result.confidence,
@@ -262,10 +364,7 @@ class HybridPricingAgent:
             "components_used": [dt.value for dt in rule_result.components_used]
         }
         
-        if use_llm:
-            # Get LLM-based estimate
-            llm_result = self.llm_agent.determine_price(item_spec, market_context)
-            
+        if llm_result is not None:
             llm_price = llm_result.get("determined_price")
             llm_confidence = llm_result.get("confidence", 0.0)
             
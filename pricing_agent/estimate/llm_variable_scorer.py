@@ -1,7 +1,11 @@
 """LLM-based variable scorer for content-based pricing."""
 
-import json
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+
+from ..utils.cache import ResponseCache, canonical_key
+from ..utils.io import dumps_compact, dumps_indented
+from .pricing_formulas import VARIABLE_ORDER
 
 
 SCORING_PROMPT_TEMPLATE = """You are an expert in dark web data market economics. Analyze the ACTUAL CONTENT of this telecom API response to estimate its black/gray-market resale value.
@@ -104,23 +108,56 @@ OUTPUT (valid JSON only):
   "legal_risk": {{"score": G.G, "justification": "Jurisdiction and enforcement risk"}}
 }}"""
 
+# Static text before and after the API response; the prefix is identical for
+# every request, so providers with prompt-prefix caching can reuse it.
+SCORING_PROMPT_PREFIX, SCORING_PROMPT_SUFFIX = (
+    part.replace("{{", "{").replace("}}", "}")
+    for part in SCORING_PROMPT_TEMPLATE.split("{api_response_json}")
+)
+
+SCORING_SYSTEM_PROMPT = "You are an expert data market analyst specializing in content-based valuation. Analyze the actual data values, not just field names. Provide only valid JSON output."
+
+# Written to satisfy strict structured-output rules so it can also be
+# enforced by the provider (see LLMClient.json_extract_constrained)
+SCORING_SCHEMA = {
+    "type": "object",
+    "properties": {
+        var: {
+            "type": "object",
+            "properties": {
+                "score": {"type": "number"},
+                "justification": {"type": "string"}
+            },
+            "required": ["score", "justification"],
+            "additionalProperties": False
+        } for var in VARIABLE_ORDER
+    },
+    "required": list(VARIABLE_ORDER),
+    "additionalProperties": False
+}
+
 
 class LLMVariableScorer:
     """LLM-based scorer for content pricing variables."""
     
-    def __init__(self, llm_client):
+    def __init__(self, llm_client, response_cache: Optional[ResponseCache] = None,
+                 compact_json: bool = False, structured_output: bool = False):
         """
         Initialize scorer with LLM client.
         
         Args:
             llm_client: LLMClient instance from pricing_agent.extract.llm_client
+            response_cache: Cache of validated scores keyed by API response (optional)
+            compact_json: Embed the API response as compact instead of indented JSON,
+                saving prompt tokens (default: False)
+            structured_output: Have the provider enforce SCORING_SCHEMA during
+                generation, so malformed JSON no longer costs a retry (default: False)
         """
         self.llm = llm_client
-        self.variable_names = [
-            "target", "sensitivity", "completeness", "freshness", 
-            "rarity", "exploitability", "volume", "packaging",
-            "seller_reputation", "legal_risk"
-        ]
+        self.response_cache = response_cache
+        self.compact_json = compact_json
+        self.structured_output = structured_output
+        self.variable_names = list(VARIABLE_ORDER)
     
     def score_api_response(self, api_response: Dict[str, Any], max_retries: int = 3) -> Dict[str, Dict[str, Any]]:
         """
@@ -143,33 +180,33 @@ class LLMVariableScorer:
                 "Install missing dependencies: pip install colorlog"
             )
         
-        prompt = SCORING_PROMPT_TEMPLATE.format(
-            api_response_json=json.dumps(api_response, indent=2)
-        )
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = canonical_key(api_response)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        api_response_json = dumps_compact(api_response) if self.compact_json else dumps_indented(api_response)
+        prompt = SCORING_PROMPT_PREFIX + api_response_json + SCORING_PROMPT_SUFFIX
         
         # Try calling LLM with retries
         last_error = None
         for attempt in range(max_retries):
             try:
-                # Use the existing json_extract method
-                system_prompt = "You are an expert data market analyst specializing in content-based valuation. Analyze the actual data values, not just field names. Provide only valid JSON output."
-                schema = {
-                    "type": "object",
-                    "properties": {
-                        var: {
-                            "type": "object",
-                            "properties": {
-                                "score": {"type": "number"},
-                                "justification": {"type": "string"}
-                            }
-                        } for var in self.variable_names
-                    }
-                }
-                
-                result = self.llm.json_extract(system_prompt, prompt, schema)
+                if self.structured_output:
+                    result = self.llm.json_extract_constrained(
+                        SCORING_SYSTEM_PROMPT, prompt, SCORING_SCHEMA, schema_name="variable_scores"
+                    )
+                else:
+                    # Use the existing json_extract method
+                    result = self.llm.json_extract(SCORING_SYSTEM_PROMPT, prompt, SCORING_SCHEMA,
+                                                   validate=self._validate_scores)
                 
                 # Validate the result
                 if self._validate_scores(result):
+                    if cache_key is not None:
+                        self.response_cache.put(cache_key, result)
                     return result
                 else:
                     last_error = "Invalid scores returned from LLM"
@@ -187,22 +224,46 @@ class LLMVariableScorer:
             f"Ensure LLM_API_KEY is set and GPTInvoker is properly configured."
         )
     
+    def score_api_response_batch(self, api_responses: List[Dict[str, Any]], max_retries: int = 3,
+                                 max_workers: int = 8) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Score several API responses, issuing LLM calls concurrently.
+        
+        Args:
+            api_responses: API response dicts to score
+            max_retries: Number of retry attempts per response
+            max_workers: Maximum number of concurrent LLM calls
+            
+        Returns:
+            List of score dicts, in the order of api_responses
+            
+        Raises:
+            RuntimeError: If LLM is unavailable or all retries fail for any response
+        """
+        if len(api_responses) <= 1:
+            return [self.score_api_response(r, max_retries) for r in api_responses]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(api_responses))) as executor:
+            return list(executor.map(
+                lambda api_response: self.score_api_response(api_response, max_retries),
+                api_responses
+            ))
+    
     def _validate_scores(self, scores: Dict) -> bool:
         """Validate that all scores are present and in valid range."""
         if not scores or not isinstance(scores, dict):
             return False
-            
-        for var in self.variable_names:
-            if var not in scores:
-                return False
-            if "score" not in scores[var]:
+        
+        entries = [scores.get(var) for var in self.variable_names]
+        for entry in entries:
+            if not isinstance(entry, dict):
                 return False
-            score = scores[var]["score"]
-            if not isinstance(score, (int, float)) or score < 0 or score > 10:
+            score = entry.get("score")
+            if not isinstance(score, (int, float)) or not 0 <= score <= 10:
                 return False
-            if "justification" not in scores[var]:
-                scores[var]["justification"] = "No justification provided"
+        
+        # Fill in missing justifications only once the whole result is valid
+        for entry in entries:
+            entry.setdefault("justification", "No justification provided")
         
         return True
-
-
@@ -1,7 +1,91 @@
 """Pricing formulas for content-based API valuation."""
 
 import math
-from typing import Dict, Tuple, Any
+from types import MappingProxyType
+from typing import Dict, List, Tuple, Any, Union
+
+import numpy as np
+
+
+# Variable order used for score matrices (one column per variable)
+VARIABLE_ORDER = (
+    "target",
+    "sensitivity",
+    "completeness",
+    "freshness",
+    "rarity",
+    "exploitability",
+    "volume",
+    "packaging",
+    "seller_reputation",
+    "legal_risk"
+)
+
+# Multipliers of the multiplicative model, in application order, as
+# (variable, intercept, slope, pivot): multiplier = intercept + slope * (score - pivot)
+MULTIPLIERS = (
+    ("target", 0.5, 0.15, 0.0),
+    ("sensitivity", 0.6, 0.10, 0.0),
+    ("completeness", 0.5, 0.10, 0.0),
+    ("freshness", 0.3, 0.07, 0.0),
+    ("rarity", 0.7, 0.08, 0.0),
+    ("exploitability", 0.6, 0.12, 0.0),
+    ("volume", 0.8, 0.02, 0.0),
+    ("packaging", 0.9, 0.02, 0.0),
+    ("seller_reputation", 0.85, 0.03, 0.0),
+    ("legal_risk", 1.0, 0.03, 10.0)  # Inverse: 1.0 - 0.03 * (10 - score)
+)
+
+
+def extract_scores(variable_scores: Dict[str, Dict[str, Any]],
+                   variable_names=VARIABLE_ORDER) -> np.ndarray:
+    """
+    Convert a variable score dict into a score vector.
+    
+    Converting once and passing the vector to several models avoids
+    repeating the nested dict lookups per model.
+    
+    Args:
+        variable_scores: Dict mapping variable names to {"score": float, ...}
+        variable_names: Order of the vector entries
+        
+    Returns:
+        (len(variable_names),) float array; missing variables are NaN
+    """
+    return np.fromiter(
+        (variable_scores[var_name]["score"] if var_name in variable_scores else np.nan
+         for var_name in variable_names),
+        dtype=float,
+        count=len(variable_names)
+    )
+
+
+def scores_to_matrix(variable_scores_list: List[Dict[str, Dict[str, Any]]],
+                     variable_names=VARIABLE_ORDER, dtype=np.float64) -> np.ndarray:
+    """
+    Convert variable score dicts into a score matrix.
+    
+    Args:
+        variable_scores_list: List of dicts mapping variable names to {"score": float, ...}
+        variable_names: Column order of the matrix
+        dtype: Floating dtype of the matrix; np.float32 halves memory for large
+            batches while keeping ample precision for 0-10 scores
+        
+    Returns:
+        (N, len(variable_names)) float array; missing variables are NaN
+    """
+    matrix = np.full((len(variable_scores_list), len(variable_names)), np.nan, dtype=dtype)
+    for row, variable_scores in enumerate(variable_scores_list):
+        matrix[row] = extract_scores(variable_scores, variable_names)
+    return matrix
+
+
+def _as_float_array(score_matrix) -> np.ndarray:
+    """Return score_matrix as a float array, keeping float32 input as is."""
+    score_matrix = np.asarray(score_matrix)
+    if not np.issubdtype(score_matrix.dtype, np.floating):
+        score_matrix = score_matrix.astype(np.float64)
+    return score_matrix
 
 
 class LogLinearPricingModel:
@@ -18,9 +102,21 @@ class LogLinearPricingModel:
                 - "covariance": dict mapping variable names to variances (optional)
         """
         self.alpha = model_params.get("alpha", 3.12)
-        self.betas = model_params.get("betas", self._default_betas())
-        self.covariance = model_params.get("covariance", {})
+        # Read-only copies: the precomputed terms below must not drift from them
+        self.betas = MappingProxyType(dict(model_params.get("betas", self._default_betas())))
+        self.covariance = MappingProxyType(dict(model_params.get("covariance", {})))
         self.variable_names = list(self.betas.keys())
+        
+        # Per-variable (name, beta, variance) terms, default small variance
+        self._terms = tuple(
+            (var_name, beta, self.covariance.get(var_name, 0.01))
+            for var_name, beta in self.betas.items()
+        )
+        # Vector-path coefficients aligned to VARIABLE_ORDER, the order extract_scores
+        # and scores_to_matrix produce; variables without a beta contribute nothing
+        term_by_name = {var_name: (beta, var_coef) for var_name, beta, var_coef in self._terms}
+        self._beta_vec = np.array([term_by_name.get(v, (0.0, 0.0))[0] for v in VARIABLE_ORDER], dtype=float)
+        self._cov_vec = np.array([term_by_name.get(v, (0.0, 0.0))[1] for v in VARIABLE_ORDER], dtype=float)
     
     @staticmethod
     def _default_betas() -> Dict[str, float]:
@@ -38,29 +134,29 @@ class LogLinearPricingModel:
             "legal_risk": -0.018
         }
     
-    def estimate_price(self, variable_scores: Dict[str, Dict[str, Any]]) -> Tuple[float, float, float]:
+    def estimate_price(self, variable_scores: Union[Dict[str, Dict[str, Any]], np.ndarray]) -> Tuple[float, float, float]:
         """
         Estimate price using log-linear model.
         
         Args:
-            variable_scores: Dict mapping variable names to {"score": float, ...}
+            variable_scores: Dict mapping variable names to {"score": float, ...}, or a
+                score vector in VARIABLE_ORDER (see extract_scores); betas for variables
+                outside VARIABLE_ORDER only apply to dict input
             
         Returns:
             Tuple of (price_point, price_low, price_high)
         """
-        # Compute log-price
-        ln_price = self.alpha
-        for var_name, beta in self.betas.items():
-            if var_name in variable_scores:
-                score = variable_scores[var_name]["score"]
-                ln_price += beta * score
+        if isinstance(variable_scores, np.ndarray):
+            points, lows, highs = self.estimate_price_batch(variable_scores[np.newaxis, :])
+            return float(points[0]), float(lows[0]), float(highs[0])
         
-        # Estimate uncertainty
+        # Compute log-price and uncertainty
+        ln_price = self.alpha
         variance = 0.0
-        for var_name in self.variable_names:
+        for var_name, beta, var_coef in self._terms:
             if var_name in variable_scores:
                 score = variable_scores[var_name]["score"]
-                var_coef = self.covariance.get(var_name, 0.01)  # Default small variance
+                ln_price += beta * score
                 variance += var_coef * (score ** 2)
         
         std_dev = math.sqrt(max(variance, 0.01))  # Ensure positive
@@ -71,6 +167,24 @@ class LogLinearPricingModel:
         price_high = math.exp(ln_price + 1.96 * std_dev)
         
         return price_point, price_low, price_high
+    
+    def estimate_price_batch(self, score_matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Estimate prices for many score vectors at once.
+        
+        Args:
+            score_matrix: (N, 10) array of scores in VARIABLE_ORDER (see scores_to_matrix);
+                NaN entries are treated as missing variables
+            
+        Returns:
+            Tuple of (price_points, price_lows, price_highs) arrays of shape (N,)
+        """
+        scores = np.nan_to_num(_as_float_array(score_matrix), nan=0.0)
+        ln_price = self.alpha + scores @ self._beta_vec
+        variance = (scores ** 2) @ self._cov_vec
+        std_dev = np.sqrt(np.maximum(variance, 0.01))
+        
+        return np.exp(ln_price), np.exp(ln_price - 1.96 * std_dev), np.exp(ln_price + 1.96 * std_dev)
 
 
 class MultiplicativePricingModel:
@@ -85,40 +199,47 @@ class MultiplicativePricingModel:
         """
         self.base_anchors = base_anchors
     
-    def estimate_price(self, variable_scores: Dict[str, Dict[str, Any]], 
+    def estimate_price(self, variable_scores: Union[Dict[str, Dict[str, Any]], np.ndarray], 
                       data_type: str = "telecom_profile") -> float:
         """
         Estimate price using multiplicative model.
         
         Args:
-            variable_scores: Dict mapping variable names to {"score": float, ...}
+            variable_scores: Dict mapping variable names to {"score": float, ...}, or a
+                score vector in VARIABLE_ORDER (see extract_scores)
             data_type: Data type key for base anchor
             
         Returns:
             Estimated price (single point)
         """
-        base = self.base_anchors.get(data_type, 50.0)
-        
-        # Define multiplier functions
-        multipliers = {
-            "target": lambda x: 0.5 + 0.15 * x,
-            "sensitivity": lambda x: 0.6 + 0.10 * x,
-            "completeness": lambda x: 0.5 + 0.10 * x,
-            "freshness": lambda x: 0.3 + 0.07 * x,
-            "rarity": lambda x: 0.7 + 0.08 * x,
-            "exploitability": lambda x: 0.6 + 0.12 * x,
-            "volume": lambda x: 0.8 + 0.02 * x,
-            "packaging": lambda x: 0.9 + 0.02 * x,
-            "seller_reputation": lambda x: 0.85 + 0.03 * x,
-            "legal_risk": lambda x: 1.0 - 0.03 * (10 - x)  # Inverse
-        }
+        if isinstance(variable_scores, np.ndarray):
+            return float(self.estimate_price_batch(variable_scores[np.newaxis, :], data_type)[0])
         
-        price = base
-        for var_name, mult_func in multipliers.items():
+        price = self.base_anchors.get(data_type, 50.0)
+        for var_name, intercept, slope, pivot in MULTIPLIERS:
             if var_name in variable_scores:
                 score = variable_scores[var_name]["score"]
-                price *= mult_func(score)
+                price *= intercept + slope * (score - pivot)
         
         return price
-
-
+    
+    def estimate_price_batch(self, score_matrix: np.ndarray,
+                             data_type: str = "telecom_profile") -> np.ndarray:
+        """
+        Estimate prices for many score vectors at once.
+        
+        Args:
+            score_matrix: (N, 10) array of scores in VARIABLE_ORDER (see scores_to_matrix);
+                NaN entries are treated as missing variables
+            data_type: Data type key for base anchor
+            
+        Returns:
+            (N,) array of estimated prices
+        """
+        score_matrix = _as_float_array(score_matrix)
+        prices = np.full(score_matrix.shape[0], self.base_anchors.get(data_type, 50.0))
+        for col, (_, intercept, slope, pivot) in enumerate(MULTIPLIERS):
+            scores = score_matrix[:, col]
+            prices *= np.where(np.isnan(scores), 1.0, intercept + slope * (scores - pivot))
+        
+        return prices
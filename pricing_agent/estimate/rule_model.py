@@ -1,7 +1,7 @@
 """Rule-based pricing model."""
 
-from typing import Dict, Any
-from ..aggregate.modifiers import apply_all_modifiers
+from typing import Dict, Any, Tuple
+from ..aggregate.modifiers import apply_all_modifiers, apply_all_modifiers_detailed
 
 
 def apply_modifiers(base_sum: float, features: Dict[str, Any]) -> float:
@@ -17,3 +17,23 @@ def apply_modifiers(base_sum: float, features: Dict[str, Any]) -> float:
     """
     vip_add = features.get("vip_add", 0.0)
     return apply_all_modifiers(base_sum, features, vip_add)
+
+
+def apply_modifiers_detailed(base_sum: float, features: Dict[str, Any]) -> Tuple[float, Dict[str, float]]:
+    """
+    Apply pricing modifiers to base sum and report the modifiers applied.
+    
+    Args:
+        base_sum: Base price sum from benchmark
+        features: Feature dictionary with modifier values
+        
+    Returns:
+        Tuple of (final estimated price, modifiers applied)
+    """
+    vip_add = features.get("vip_add", 0.0)
+    est_price, modifiers = apply_all_modifiers_detailed(base_sum, features, vip_add)
+    
+    if "vip_add" in features:
+        modifiers["vip_add"] = features["vip_add"]
+    
+    return est_price, modifiers
@@ -12,6 +12,11 @@ class AttackerAction(Enum):
     RESELL_BULK = "resell_bulk"
 
 
+# Column index of each action in per-action parameter arrays
+ACTION_INDEX = {action: i for i, action in enumerate(AttackerAction)}
+N_ACTIONS = len(AttackerAction)
+
+
 @dataclass
 class VictimState:
     """Victim state parameters."""
@@ -29,6 +34,47 @@ class ExPostParams:
     R_expected: Dict[AttackerAction, float]
     C_cost: Dict[AttackerAction, float]
     detection_risk: Dict[AttackerAction, float]
+    
+    def as_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Convert the per-action dicts to arrays indexed by ACTION_INDEX.
+        
+        Returns:
+            Tuple of (action_mask, P_success, R_expected, C_cost, detection_risk),
+            each of shape (N_ACTIONS,); action_mask marks the actions present in
+            P_success, and parameters of absent actions are 0
+        """
+        action_mask = np.zeros(N_ACTIONS, dtype=bool)
+        arrays = np.zeros((4, N_ACTIONS))
+        for action, i in ACTION_INDEX.items():
+            if action not in self.P_success:
+                continue
+            action_mask[i] = True
+            arrays[:, i] = (
+                self.P_success[action],
+                self.R_expected[action],
+                self.C_cost[action],
+                self.detection_risk[action]
+            )
+        return (action_mask, *arrays)
+
+
+def _clip_inplace(samples: np.ndarray, low: float, high: float) -> np.ndarray:
+    """Clip freshly drawn samples in place, avoiding a second array."""
+    return np.clip(samples, low, high, out=samples)
+
+
+def _jitter_inplace(z: np.ndarray, base: np.ndarray, rel_sigma: float) -> np.ndarray:
+    """Turn standard-normal draws into base * (1 + rel_sigma * z), in place."""
+    np.multiply(z, rel_sigma, out=z)
+    np.add(z, 1.0, out=z)
+    return np.multiply(z, base, out=z)
+
+
+def _mean(values) -> float:
+    """Mean of a few scalars without a NumPy round-trip (NaN when empty)."""
+    values = tuple(values)
+    return sum(values) / len(values) if values else math.nan
 
 
 class VoIModel:
@@ -39,12 +85,15 @@ class VoIModel:
         risk_aversion: float = 0.5,
         detection_penalty: float = -1000.0,
         freshness_decay_lambda: float = 0.1,
-        n_simulations: int = 10000
+        n_simulations: int = 10000,
+        seed: Optional[int] = None
     ):
         self.risk_aversion = risk_aversion
         self.detection_penalty = detection_penalty # negative value
         self.freshness_decay_lambda = freshness_decay_lambda
         self.n_simulations = n_simulations
+        self.rng = np.random.default_rng(seed)  # seed for reproducible simulations
+        self._ex_ante_cache: Dict[Tuple[float, ...], Tuple[float, float, AttackerAction]] = {}
         self.prior_wealth_mu = 5.0
         self.prior_wealth_sigma = 2.5
         self.prior_defense_mu = 4.0
@@ -66,7 +115,10 @@ class VoIModel:
         
         if revenue > 0 and self.risk_aversion > 0:
             revenue_scaled = revenue / 1000.0
-            revenue_utility = (revenue_scaled ** (1.0 - self.risk_aversion)) * 1000.0
+            exponent = 1.0 - self.risk_aversion
+            # sqrt is much cheaper than pow for the default risk aversion of 0.5
+            powered = math.sqrt(revenue_scaled) if exponent == 0.5 else revenue_scaled ** exponent
+            revenue_utility = powered * 1000.0
         else:
             revenue_utility = revenue
         
@@ -78,11 +130,11 @@ class VoIModel:
     
     def sample_ex_ante_state(self) -> VictimState:
         """Sample victim state from ex-ante distribution."""
-        wealth = np.clip(np.random.normal(self.prior_wealth_mu, self.prior_wealth_sigma), 0, 10)
-        defense = np.clip(np.random.normal(self.prior_defense_mu, self.prior_defense_sigma), 0, 10)
-        sensitivity = np.random.beta(2, 5) * 10
-        detection = np.random.beta(3, 7)
-        liquidity = np.random.beta(5, 3)
+        wealth = np.clip(self.rng.normal(self.prior_wealth_mu, self.prior_wealth_sigma), 0, 10)
+        defense = np.clip(self.rng.normal(self.prior_defense_mu, self.prior_defense_sigma), 0, 10)
+        sensitivity = self.rng.beta(2, 5) * 10
+        detection = self.rng.beta(3, 7)
+        liquidity = self.rng.beta(5, 3)
         
         return VictimState(
             wealth=wealth,
@@ -92,23 +144,46 @@ class VoIModel:
             asset_liquidity=liquidity
         )
     
-    def sample_ex_post_state(self, ex_post_params: ExPostParams, signal_strength: float = 0.7) -> VictimState:
-        """Sample victim state from ex-post distribution."""
-        avg_revenue = np.mean(list(ex_post_params.R_expected.values()))
-        wealth_signal = np.log1p(avg_revenue / 1000.0)
+    def ex_post_posterior(self, ex_post_params: ExPostParams, signal_strength: float = 0.7) -> Tuple[float, float, float]:
+        """
+        Compute the sample-independent ex-post posterior parameters.
+        
+        Returns:
+            Tuple of (wealth_post_mu, defense_post_mu, avg_detection)
+        """
+        avg_revenue = _mean(ex_post_params.R_expected.values())
+        wealth_signal = math.log1p(avg_revenue / 1000.0)
         
-        avg_detection = np.mean(list(ex_post_params.detection_risk.values()))
+        avg_detection = _mean(ex_post_params.detection_risk.values())
         defense_signal = avg_detection * 10.0
         
         wealth_post_mu = signal_strength * wealth_signal + (1 - signal_strength) * self.prior_wealth_mu
         defense_post_mu = signal_strength * defense_signal + (1 - signal_strength) * self.prior_defense_mu
         
-        wealth = np.clip(np.random.normal(wealth_post_mu, self.prior_wealth_sigma * 0.7), 0, 10)
-        defense = np.clip(np.random.normal(defense_post_mu, self.prior_defense_sigma * 0.7), 0, 10)
+        return wealth_post_mu, defense_post_mu, avg_detection
+    
+    def sample_ex_post_state(
+        self,
+        ex_post_params: ExPostParams,
+        signal_strength: float = 0.7,
+        posterior: Optional[Tuple[float, float, float]] = None
+    ) -> VictimState:
+        """
+        Sample victim state from ex-post distribution.
         
-        sensitivity = np.random.beta(2, 5) * 10
-        detection = np.clip(np.random.beta(3, 7) + avg_detection * 0.3, 0, 1)
-        liquidity = np.random.beta(5, 3)
+        Pass posterior (from ex_post_posterior) when sampling repeatedly for
+        the same ex_post_params to skip recomputing it.
+        """
+        if posterior is None:
+            posterior = self.ex_post_posterior(ex_post_params, signal_strength)
+        wealth_post_mu, defense_post_mu, avg_detection = posterior
+        
+        wealth = np.clip(self.rng.normal(wealth_post_mu, self.prior_wealth_sigma * 0.7), 0, 10)
+        defense = np.clip(self.rng.normal(defense_post_mu, self.prior_defense_sigma * 0.7), 0, 10)
+        
+        sensitivity = self.rng.beta(2, 5) * 10
+        detection = np.clip(self.rng.beta(3, 7) + avg_detection * 0.3, 0, 1)
+        liquidity = self.rng.beta(5, 3)
         
         return VictimState(
             wealth=wealth,
@@ -118,6 +193,112 @@ class VoIModel:
             asset_liquidity=liquidity
         )
     
+    def sample_ex_ante_states(self, n: int) -> Dict[str, np.ndarray]:
+        """Sample n victim states from the ex-ante distribution as arrays."""
+        return {
+            "wealth": _clip_inplace(self.rng.normal(self.prior_wealth_mu, self.prior_wealth_sigma, n), 0, 10),
+            "defense_level": _clip_inplace(self.rng.normal(self.prior_defense_mu, self.prior_defense_sigma, n), 0, 10),
+            "sensitivity": self.rng.beta(2, 5, n) * 10,
+            "detection_capability": self.rng.beta(3, 7, n),
+            "asset_liquidity": self.rng.beta(5, 3, n)
+        }
+    
+    def sample_ex_post_states(
+        self, n: int, ex_post_params: ExPostParams, signal_strength: float = 0.7
+    ) -> Dict[str, np.ndarray]:
+        """Sample n victim states from the ex-post distribution as arrays."""
+        wealth_post_mu, defense_post_mu, avg_detection = self.ex_post_posterior(ex_post_params, signal_strength)
+        
+        return {
+            "wealth": _clip_inplace(self.rng.normal(wealth_post_mu, self.prior_wealth_sigma * 0.7, n), 0, 10),
+            "defense_level": _clip_inplace(self.rng.normal(defense_post_mu, self.prior_defense_sigma * 0.7, n), 0, 10),
+            "sensitivity": self.rng.beta(2, 5, n) * 10,
+            "detection_capability": _clip_inplace(self.rng.beta(3, 7, n) + avg_detection * 0.3, 0, 1),
+            "asset_liquidity": self.rng.beta(5, 3, n)
+        }
+    
+    def compute_utilities(
+        self,
+        actions: List[AttackerAction],
+        states: Dict[str, np.ndarray],
+        P_success: np.ndarray,
+        R_expected: np.ndarray,
+        C_cost: np.ndarray,
+        detection_risk: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized compute_utility over samples and actions.
+        
+        Parameter arrays broadcast against shape (n, len(actions)), with one
+        column per action; the result has that shape.
+        """
+        revenue = np.asarray(P_success) * R_expected
+        
+        if self.risk_aversion > 0:
+            positive = revenue > 0
+            revenue_scaled = np.where(positive, revenue, 0.0) / 1000.0
+            exponent = 1.0 - self.risk_aversion
+            powered = np.sqrt(revenue_scaled) if exponent == 0.5 else revenue_scaled ** exponent
+            revenue_utility = np.where(positive, powered * 1000.0, revenue)
+        else:
+            revenue_utility = revenue
+        
+        scaled_penalty = self.detection_penalty * (1.0 + revenue / 10000.0)
+        detection_cost = detection_risk * scaled_penalty
+        
+        utility = revenue_utility - C_cost + detection_cost
+        
+        n = len(next(iter(states.values())))
+        utility = np.broadcast_to(utility, (n, len(actions)))
+        if AttackerAction.DO_NOTHING not in actions:
+            return utility
+        do_nothing = np.array([action == AttackerAction.DO_NOTHING for action in actions])
+        return np.where(do_nothing, 0.0, utility)
+    
+    def _estimate_ex_ante(self) -> Tuple[float, float, AttackerAction]:
+        """
+        Estimate the ex-ante (no signal) baseline.
+        
+        The baseline depends only on the model parameters, not on the
+        ex-post signal, so it is computed once per parameter set.
+        
+        Returns:
+            Tuple of (mean utility, utility std, optimal action)
+        """
+        key = (
+            self.risk_aversion, self.detection_penalty, self.n_simulations,
+            self.prior_wealth_mu, self.prior_wealth_sigma,
+            self.prior_defense_mu, self.prior_defense_sigma
+        )
+        cached = self._ex_ante_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        # Ex-ante: generic parameters (no specific signal)
+        ex_ante_P_success = 0.3
+        ex_ante_R_expected = 500.0
+        ex_ante_C_cost = 100.0
+        ex_ante_detection_risk = 0.1
+        
+        actions = list(AttackerAction)
+        ex_ante_states = self.sample_ex_ante_states(self.n_simulations)
+        ex_ante_matrix = self.compute_utilities(
+            actions, ex_ante_states,
+            ex_ante_P_success,
+            ex_ante_R_expected,
+            ex_ante_C_cost,
+            ex_ante_detection_risk
+        )
+        ex_ante_utilities = ex_ante_matrix.max(axis=1)
+        
+        result = (
+            np.mean(ex_ante_utilities),
+            np.std(ex_ante_utilities),
+            actions[int(np.argmax(ex_ante_matrix.mean(axis=0)))]
+        )
+        self._ex_ante_cache[key] = result
+        return result
+    
     def estimate_V_ex_ante(
         self,
         ex_post_params: ExPostParams,
@@ -127,81 +308,64 @@ class VoIModel:
         """Estimate V_ex_ante via Monte Carlo."""
         freshness_factor = math.exp(-self.freshness_decay_lambda * freshness_days)
         
-        # Ex-ante: generic parameters (no specific signal)
-        ex_ante_P_success = 0.3
-        ex_ante_R_expected = 500.0
-        ex_ante_C_cost = 100.0
-        ex_ante_detection_risk = 0.1
+        actions = list(AttackerAction)
+        ex_ante_utility, ex_ante_std, optimal_action_ex_ante = self._estimate_ex_ante()
         
-        ex_ante_utilities = []
-        for _ in range(self.n_simulations):
-            state = self.sample_ex_ante_state()
-            action_utilities = {}
-            for action in AttackerAction:
-                u = self.compute_utility(
-                    action, state,
-                    ex_ante_P_success,
-                    ex_ante_R_expected,
-                    ex_ante_C_cost,
-                    ex_ante_detection_risk
-                )
-                action_utilities[action] = u
-            max_utility = max(action_utilities.values())
-            ex_ante_utilities.append(max_utility)
-        
-        ex_ante_utility = np.mean(ex_ante_utilities)
-        optimal_action_ex_ante = max(
-            AttackerAction,
-            key=lambda a: np.mean([
-                self.compute_utility(
-                    a, self.sample_ex_ante_state(),
-                    ex_ante_P_success,
-                    ex_ante_R_expected,
-                    ex_ante_C_cost,
-                    ex_ante_detection_risk
-                )
-                for _ in range(1000)
-            ])
-        )
+        # Only use actions explicitly in ex_post_params
+        action_mask, P_arr, R_arr, C_arr, D_arr = ex_post_params.as_arrays()
+        action_counts = np.zeros(N_ACTIONS, dtype=np.int64)
+        n = self.n_simulations
         
-        ex_post_utilities = []
-        action_counts = {action: 0 for action in AttackerAction}
+        # DO_NOTHING always has utility 0, so only the other actions are simulated
+        noop_idx = ACTION_INDEX[AttackerAction.DO_NOTHING]
+        noop_present = bool(action_mask[noop_idx])
+        active_mask = action_mask.copy()
+        active_mask[noop_idx] = False
+        active_idx = np.flatnonzero(active_mask)
         
-        for _ in range(self.n_simulations):
-            state = self.sample_ex_post_state(ex_post_params, signal_strength)
-            action_utilities = {}
+        if active_idx.size:
+            n_actions = active_idx.size
+            base_P_success = P_arr[active_idx]
+            base_R_expected = R_arr[active_idx]
+            base_C_cost = C_arr[active_idx]
+            base_detection_risk = D_arr[active_idx]
             
-            # Only use actions explicitly in ex_post_params
-            for action in AttackerAction:
-                if action not in ex_post_params.P_success:
-                    continue
-                
-                base_P_success = ex_post_params.P_success[action]
-                base_R_expected = ex_post_params.R_expected[action]
-                base_C_cost = ex_post_params.C_cost[action]
-                base_detection_risk = ex_post_params.detection_risk[action]
-                
-                P_success = np.clip(np.random.normal(base_P_success, base_P_success * 0.15), 0.01, 0.99)
-                R_expected = max(0, np.random.normal(base_R_expected, base_R_expected * 0.2))
-                C_cost = base_C_cost  # Costs stay fixed
-                detection_risk = np.clip(np.random.normal(base_detection_risk, base_detection_risk * 0.15), 0.0, 1.0)
-                
-                u = self.compute_utility(action, state, P_success, R_expected, C_cost, detection_risk)
-                action_utilities[action] = u
-
-            if action_utilities:  # Only if we have at least one action
-                optimal_action = max(action_utilities, key=action_utilities.get)
-                max_utility = action_utilities[optimal_action]
-                ex_post_utilities.append(max_utility)
-                action_counts[optimal_action] += 1
+            ex_post_states = self.sample_ex_post_states(n, ex_post_params, signal_strength)
+            # One standard-normal draw for all three noisy parameters, scaled in place
+            P_success, R_expected, detection_risk = self.rng.standard_normal((3, n, n_actions))
+            _jitter_inplace(P_success, base_P_success, 0.15)
+            np.clip(P_success, 0.01, 0.99, out=P_success)
+            _jitter_inplace(R_expected, base_R_expected, 0.2)
+            np.maximum(R_expected, 0, out=R_expected)
+            C_cost = base_C_cost  # Costs stay fixed
+            _jitter_inplace(detection_risk, base_detection_risk, 0.15)
+            np.clip(detection_risk, 0.0, 1.0, out=detection_risk)
+            
+            ex_post_matrix = self.compute_utilities(
+                [actions[i] for i in active_idx], ex_post_states,
+                P_success, R_expected, C_cost, detection_risk
+            )
+            best = ex_post_matrix.argmax(axis=1)
+            ex_post_utilities = ex_post_matrix[np.arange(n), best]
+            optimal_idx = active_idx[best]
+            if noop_present:
+                # DO_NOTHING comes first, so it also wins ties at zero
+                idle = ex_post_utilities <= 0.0
+                optimal_idx = np.where(idle, noop_idx, optimal_idx)
+                ex_post_utilities = np.where(idle, 0.0, ex_post_utilities)
+            action_counts = np.bincount(optimal_idx, minlength=N_ACTIONS)
+        elif noop_present:
+            ex_post_utilities = np.zeros(n)
+            action_counts[noop_idx] = n
+        else:
+            ex_post_utilities = np.empty(0)
         
         ex_post_utility = np.mean(ex_post_utilities)
-        optimal_action_ex_post = max(action_counts, key=action_counts.get)
+        optimal_action_ex_post = actions[int(np.argmax(action_counts))]
         
         V_raw = ex_post_utility - ex_ante_utility
         V_ex_ante = V_raw * freshness_factor
         
-        ex_ante_std = np.std(ex_ante_utilities)
         ex_post_std = np.std(ex_post_utilities)
         total_variance = ex_ante_std**2 + ex_post_std**2
         
@@ -226,30 +390,67 @@ class VoIModel:
                 "ex_post_mean": ex_post_utility,
                 "ex_post_std": ex_post_std,
                 "V_raw": V_raw,
-                "action_distribution": {k.value: v/self.n_simulations for k, v in action_counts.items()}
+                "action_distribution": {
+                    action.value: int(count)/self.n_simulations for action, count in zip(actions, action_counts)
+                }
             }
         }
     
     def normalize_to_usd(
-        self, V_ex_ante: float, anchors: List[Dict[str, Any]], data_type: str = "telecom_profile"
+        self,
+        V_ex_ante: float,
+        anchors: List[Dict[str, Any]],
+        data_type: str = "telecom_profile",
+        anchor_table: Optional[Dict[Optional[str], Tuple[float, float, List[Dict[str, Any]]]]] = None
     ) -> Tuple[float, float, List[Dict[str, Any]]]:
-        """Convert VoI (utility units) to USD using market anchor prices."""
+        """
+        Convert VoI (utility units) to USD using market anchor prices.
+        
+        Pass anchor_table (from build_anchor_table) to reuse the precomputed
+        median scaling factor and confidence across calls.
+        """
         if not anchors:
             price_usd = V_ex_ante * 0.1
             confidence = 0.3
             return price_usd, confidence, []
         
-        relevant_anchors = [a for a in anchors if a.get("data_type") == data_type]
-        if not relevant_anchors:
-            relevant_anchors = anchors
-        
-        anchor_prices = [a.get("price") for a in relevant_anchors]
-        anchor_voi = [a.get("estimated_voi") for a in relevant_anchors]
+        if anchor_table is None:
+            anchor_table = build_anchor_table(anchors)
+        median_scale, confidence, anchors_used = anchor_table.get(data_type) or anchor_table[None]
         
-        scaling_factors = [p / max(v, 1.0) for p, v in zip(anchor_prices, anchor_voi)]
-        median_scale = np.median(scaling_factors)
         price_usd = V_ex_ante * median_scale
+        return price_usd, confidence, [dict(a) for a in anchors_used]
+
+
+def build_anchor_table(
+    anchors: List[Dict[str, Any]]
+) -> Dict[Optional[str], Tuple[float, float, List[Dict[str, Any]]]]:
+    """
+    Group market anchors by data type for VoIModel.normalize_to_usd.
+    
+    The anchors are fixed for the lifetime of an agent, so the median
+    price / VoI scaling factor and the confidence derived from its spread
+    are computed here once instead of on every conversion.
+    
+    Args:
+        anchors: Anchor price observations
+        
+    Returns:
+        Dict mapping each data type (and None, for all anchors) to a tuple of
+        (median scaling factor, confidence, summaries of up to five anchors)
+    """
+    groups: Dict[Optional[str], List[Dict[str, Any]]] = {None: list(anchors)}
+    for a in anchors:
+        if a.get("data_type") is not None:
+            groups.setdefault(a.get("data_type"), []).append(a)
+    
+    table = {}
+    for data_type, group in groups.items():
+        prices = np.array([a.get("price") for a in group], dtype=float)
+        voi = np.array([a.get("estimated_voi") for a in group], dtype=float)
+        scaling_factors = prices / np.maximum(voi, 1.0)
         
+        median_scale = np.median(scaling_factors)
         if len(scaling_factors) > 1:
             scale_std = np.std(scaling_factors)
             scale_mean = np.mean(scaling_factors)
@@ -265,8 +466,7 @@ class VoIModel:
                 "estimated_voi": a.get("estimated_voi"),
                 "source": a.get("source", "unknown")
             }
-            for a in relevant_anchors[:5]
+            for a in group[:5]
         ]
-        
-        return price_usd, confidence, anchors_used
-
+        table[data_type] = (median_scale, confidence, anchors_used)
+    return table
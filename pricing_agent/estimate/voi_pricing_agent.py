@@ -1,10 +1,14 @@
+import logging
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
-from .voi_model import VoIModel
+from .voi_model import VoIModel, ExPostParams, build_anchor_table
 from .ex_post_inference import ExPostInference
 
+logger = logging.getLogger(__name__)
+
 
 class VoIPricingAgent:
     """
@@ -31,7 +35,8 @@ class VoIPricingAgent:
             risk_aversion=model_params.get("risk_aversion", 0.5),
             detection_penalty=model_params.get("detection_penalty", -1000.0),
             freshness_decay_lambda=model_params.get("freshness_decay_lambda", 0.1),
-            n_simulations=model_params.get("n_simulations", 10000)
+            n_simulations=model_params.get("n_simulations", 10000),
+            seed=model_params.get("seed")
         )
         
         # Initialize ex-post inference engine
@@ -39,6 +44,7 @@ class VoIPricingAgent:
         
         # Load or use provided anchor prices
         self.anchor_prices = anchor_prices or self._default_anchors()
+        self._anchor_table = build_anchor_table(self.anchor_prices)
     
     def estimate_price(
         self,
@@ -47,6 +53,18 @@ class VoIPricingAgent:
         metadata: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Estimate price for API response."""
+        # infer ex-post parameters from API signal
+        ex_post_params = self.ex_post_inference.infer_ex_post(api_response)
+        
+        return self._estimate_from_ex_post(ex_post_params, query_id, metadata)
+    
+    def _estimate_from_ex_post(
+        self,
+        ex_post_params: ExPostParams,
+        query_id: str = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Estimate price from already inferred ex-post parameters."""
         # Generate IDs
         query_id = query_id or str(uuid.uuid4())
         timestamp = datetime.utcnow().isoformat() + "Z"
@@ -57,9 +75,6 @@ class VoIPricingAgent:
         data_type = metadata.get("data_type", "telecom_profile")
         region = metadata.get("region", "unknown")
         
-        # infer ex-post parameters from API signal
-        ex_post_params = self.ex_post_inference.infer_ex_post(api_response)
-        
         # estimate V_ex_ante via Monte Carlo
         voi_result = self.voi_model.estimate_V_ex_ante(
             ex_post_params=ex_post_params,
@@ -71,7 +86,8 @@ class VoIPricingAgent:
         usd_estimate, anchor_confidence, anchors_used = self.voi_model.normalize_to_usd(
             V_ex_ante=voi_result["V_ex_ante"],
             anchors=self.anchor_prices,
-            data_type=data_type
+            data_type=data_type,
+            anchor_table=self._anchor_table
         )
         
         # combine confidences (take minimum for conservative estimate)
@@ -203,15 +219,20 @@ class VoIPricingAgent:
         self,
         api_responses: List[Dict[str, Any]],
         query_ids: Optional[List[str]] = None,
-        metadata_list: Optional[List[Dict[str, Any]]] = None
+        metadata_list: Optional[List[Dict[str, Any]]] = None,
+        max_workers: int = 8
     ) -> List[Dict[str, Any]]:
         """
         Batch estimation for multiple API responses.
         
+        Ex-post inference (one LLM call per response) runs concurrently on a
+        thread pool; the vectorized Monte Carlo step then runs per item.
+        
         Args:
             api_responses: List of API response dictionaries
             query_ids: Optional list of query IDs
             metadata_list: Optional list of metadata dicts
+            max_workers: Maximum number of concurrent LLM calls
             
         Returns:
             List of VoI estimation results
@@ -222,9 +243,15 @@ class VoIPricingAgent:
         query_ids = query_ids or [None] * n
         metadata_list = metadata_list or [None] * n
         
-        for i, (api_response, query_id, metadata) in enumerate(zip(api_responses, query_ids, metadata_list)):
-            print(f"Processing batch item {i+1}/{n}...")
-            result = self.estimate_price(api_response, query_id, metadata)
+        if n > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, n)) as executor:
+                ex_post_list = list(executor.map(self.ex_post_inference.infer_ex_post, api_responses))
+        else:
+            ex_post_list = [self.ex_post_inference.infer_ex_post(r) for r in api_responses]
+        
+        for i, (ex_post_params, query_id, metadata) in enumerate(zip(ex_post_list, query_ids, metadata_list)):
+            logger.debug("Processing batch item %d/%d", i + 1, n)
+            result = self._estimate_from_ex_post(ex_post_params, query_id, metadata)
             results.append(result)
         
         return results
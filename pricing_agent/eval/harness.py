@@ -1,6 +1,9 @@
 """Evaluation harness for pricing models."""
 
 from typing import List, Dict, Any
+
+import numpy as np
+
 from ..schemas import PriceEvidence, ItemSpec, EstimationResult
 from ..estimate.estimator import PriceEstimator
 from .metrics import calculate_mape, calculate_rmse
@@ -32,17 +35,15 @@ class EvaluationHarness:
         if len(test_specs) != len(actual_prices):
             raise ValueError("Test specs and actual prices must have same length")
         
-        predicted_prices = []
-        for spec in test_specs:
-            result = self.estimator.estimate(spec)
-            predicted_prices.append(result.est_price)
+        results = self.estimator.batch_estimate(test_specs)
+        predicted_prices = [result.est_price for result in results]
         
         # Calculate metrics
         mape = calculate_mape(actual_prices, predicted_prices)
         rmse = calculate_rmse(actual_prices, predicted_prices)
         
         # Calculate mean absolute error
-        mae = sum(abs(a - p) for a, p in zip(actual_prices, predicted_prices)) / len(actual_prices)
+        mae = float(np.mean(np.abs(np.asarray(actual_prices, dtype=float) - np.asarray(predicted_prices, dtype=float))))
         
         return {
             "mape": mape,
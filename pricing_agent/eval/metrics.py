@@ -1,7 +1,8 @@
 """Evaluation metrics for pricing models."""
 
 from typing import List, Tuple
-import statistics
+
+import numpy as np
 
 
 def calculate_percentiles(data: List[float]) -> Tuple[float, float, float]:
@@ -14,23 +15,11 @@ def calculate_percentiles(data: List[float]) -> Tuple[float, float, float]:
     Returns:
         Tuple of (p10, p50, p90)
     """
-    if not data:
+    if len(data) == 0:
         return 0.0, 0.0, 0.0
     
-    sorted_data = sorted(data)
-    n = len(sorted_data)
-    
-    def percentile(p: int) -> float:
-        k = (n - 1) * p / 100
-        f = int(k)
-        c = k - f
-        
-        if f + 1 < n:
-            return sorted_data[f] * (1 - c) + sorted_data[f + 1] * c
-        else:
-            return sorted_data[f]
-    
-    return percentile(10), percentile(50), percentile(90)
+    p10, p50, p90 = np.percentile(np.asarray(data, dtype=float), [10, 50, 90])
+    return float(p10), float(p50), float(p90)
 
 
 def calculate_mape(actual: List[float], predicted: List[float]) -> float:
@@ -47,19 +36,17 @@ def calculate_mape(actual: List[float], predicted: List[float]) -> float:
     if len(actual) != len(predicted):
         raise ValueError("Actual and predicted lists must have same length")
     
-    if not actual:
+    if len(actual) == 0:
         return 0.0
     
-    errors = []
-    for a, p in zip(actual, predicted):
-        if a != 0:  # Avoid division by zero
-            error = abs(a - p) / abs(a)
-            errors.append(error)
-    
-    if not errors:
+    a = np.asarray(actual, dtype=float)
+    p = np.asarray(predicted, dtype=float)
+    mask = a != 0  # Avoid division by zero
+    if not mask.any():
         return 0.0
     
-    return statistics.mean(errors) * 100  # Return as percentage
+    errors = np.abs(a[mask] - p[mask]) / np.abs(a[mask])
+    return float(np.mean(errors)) * 100  # Return as percentage
 
 
 def calculate_rmse(actual: List[float], predicted: List[float]) -> float:
@@ -76,9 +63,8 @@ def calculate_rmse(actual: List[float], predicted: List[float]) -> float:
     if len(actual) != len(predicted):
         raise ValueError("Actual and predicted lists must have same length")
     
-    if not actual:
+    if len(actual) == 0:
         return 0.0
     
-    squared_errors = [(a - p) ** 2 for a, p in zip(actual, predicted)]
-    mse = statistics.mean(squared_errors)
-    return mse ** 0.5
+    diff = np.asarray(actual, dtype=float) - np.asarray(predicted, dtype=float)
+    return float(np.sqrt(np.mean(diff * diff)))
@@ -1,7 +1,27 @@
 """Extraction pipeline for finding and normalizing price evidence."""
 
-from .regex_pass import sniff_prices
-from .llm_client import LLMClient
-from .extractor import EvidenceExtractor
+import importlib
 
-__all__ = ["sniff_prices", "LLMClient", "EvidenceExtractor"]
+__all__ = ["sniff_prices", "has_price_mention", "LLMClient", "BatchLLMClient", "EvidenceExtractor"]
+
+# Submodules are imported on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "sniff_prices": ".regex_pass",
+    "has_price_mention": ".regex_pass",
+    "LLMClient": ".llm_client",
+    "BatchLLMClient": ".batch_llm_client",
+    "EvidenceExtractor": ".extractor",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,205 @@
+"""Offline price evidence extraction through the OpenAI Batch API."""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .prompts import EXTRACTION_SYSTEM
+from .llm_client import format_extraction_prompt
+
+# Batch jobs that end in one of these states will not produce more output
+BATCH_TERMINAL_STATES = ("completed", "failed", "expired", "cancelled")
+
+
+def batch_custom_id(metadata: Dict[str, Any], index: int) -> str:
+    """
+    Build the request ID linking a batch result back to its chunk.
+
+    Args:
+        metadata: Document metadata of the chunk
+        index: Position of the chunk in the submitted list
+
+    Returns:
+        Custom ID of the form "<source_id>#<index>"
+    """
+    return f"{metadata.get('source_id', 'unknown')}#{index}"
+
+
+class BatchLLMClient:
+    """
+    Extraction client for bulk, non-interactive runs.
+
+    Requests are uploaded as a JSONL file and processed by the provider within
+    a 24-hour window at a lower price than synchronous calls. Results are
+    returned in the same shape as LLMClient.extract_price_evidence.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4.1-nano",
+                 api_host: str = "https://api.openai.com/v1", work_dir: str = "batch_jobs",
+                 temperature: float = 0.1, max_tokens: int = 12000):
+        """
+        Initialize batch LLM client.
+
+        Args:
+            api_key: API key for LLM provider
+            model: Model name to use
+            api_host: Base URL of an OpenAI-compatible API that supports batches
+            work_dir: Directory for the generated request files
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens per response
+        """
+        from openai import OpenAI
+
+        self.api_key = api_key or os.getenv("LLM_API_KEY")
+        self.model = model
+        self.work_dir = Path(work_dir)
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.client = OpenAI(api_key=self.api_key, base_url=api_host)
+
+    def build_requests(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Build one chat completion request per chunk.
+
+        Args:
+            items: (chunk, metadata) pairs
+
+        Returns:
+            Batch request lines, with custom IDs from batch_custom_id
+        """
+        return [
+            {
+                "custom_id": batch_custom_id(metadata, i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": EXTRACTION_SYSTEM},
+                        {"role": "user", "content": format_extraction_prompt(chunk, metadata)}
+                    ],
+                    "temperature": self.temperature,
+                    "max_tokens": self.max_tokens,
+                    "response_format": {"type": "json_object"}
+                }
+            }
+            for i, (chunk, metadata) in enumerate(items)
+        ]
+
+    def submit(self, items: List[Tuple[str, Dict[str, Any]]]) -> str:
+        """
+        Upload the extraction requests and start a batch job.
+
+        Args:
+            items: (chunk, metadata) pairs
+
+        Returns:
+            Batch job ID
+        """
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        request_path = self.work_dir / f"extraction_{time.strftime('%Y%m%d_%H%M%S')}.jsonl"
+        with open(request_path, "w", encoding="utf-8") as f:
+            for request in self.build_requests(items):
+                f.write(json.dumps(request, ensure_ascii=False) + "\n")
+
+        with open(request_path, "rb") as f:
+            input_file = self.client.files.create(file=f, purpose="batch")
+
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    def poll(self, batch_id: str) -> str:
+        """
+        Get the current status of a batch job.
+
+        Args:
+            batch_id: Batch job ID from submit
+
+        Returns:
+            Batch status (e.g. "in_progress", "completed")
+        """
+        return self.client.batches.retrieve(batch_id).status
+
+    def wait(self, batch_id: str, poll_interval: float = 60.0, timeout: Optional[float] = None) -> str:
+        """
+        Block until a batch job reaches a terminal state.
+
+        Args:
+            batch_id: Batch job ID from submit
+            poll_interval: Seconds between status checks
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Final batch status
+
+        Raises:
+            TimeoutError: If the job is still running after timeout seconds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            status = self.poll(batch_id)
+            if status in BATCH_TERMINAL_STATES:
+                return status
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Batch {batch_id} still {status} after {timeout} seconds")
+            time.sleep(poll_interval)
+
+    def collect(self, batch_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Download and parse the results of a finished batch job.
+
+        Args:
+            batch_id: Batch job ID from submit
+
+        Returns:
+            Dict mapping each custom ID to its structured price evidence
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        results: Dict[str, Dict[str, Any]] = {}
+
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if line.strip():
+                    record = json.loads(line)
+                    results[record["custom_id"]] = self._parse_record(record)
+
+        return results
+
+    def _parse_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn one batch output line into an extraction result."""
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            return {
+                "price_evidence": [],
+                "confidence": 0.0,
+                "extraction_notes": f"LLM call failed: {record.get('error') or response.get('body')}"
+            }
+
+        choice = response["body"]["choices"][0]
+        content = choice["message"].get("content") or ""
+        if choice.get("finish_reason") != "stop":
+            return {
+                "price_evidence": [],
+                "confidence": 0.0,
+                "extraction_notes": f"LLM response truncated: {choice.get('finish_reason')}"
+            }
+
+        try:
+            data = json.loads(content)
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            return data
+        return {
+            "price_evidence": [],
+            "confidence": 0.0,
+            "extraction_notes": f"Failed to parse LLM response: {content[:200]}..."
+        }
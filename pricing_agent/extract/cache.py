@@ -0,0 +1,110 @@
+"""On-disk, content-addressed cache for LLM extraction results."""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def extraction_cache_key(model: str, prompt_version: str, system_prompt: str, user_prompt: str) -> str:
+    """
+    Build the content address of an extraction request.
+
+    Each part is length-prefixed before hashing, so different splits of the
+    same text between parts can never collide.
+
+    Args:
+        model: LLM model name
+        prompt_version: Version tag of the extraction prompts
+        system_prompt: System prompt sent to the LLM
+        user_prompt: User prompt sent to the LLM
+
+    Returns:
+        SHA-256 hex digest identifying the request
+    """
+    digest = hashlib.sha256()
+    for part in (model, prompt_version, system_prompt, user_prompt):
+        encoded = part.encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "little"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """Stores one JSON file per extraction result, named by its cache key."""
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize extraction cache.
+
+        Args:
+            cache_dir: Directory holding the cached results (created if missing)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        # Shard by key prefix to keep directories small on large corpora
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+
+        Unreadable or malformed entries are removed and reported as a miss.
+
+        Args:
+            key: Cache key from extraction_cache_key
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            value = None
+
+        if not isinstance(value, dict) or not isinstance(value.get("price_evidence", []), list):
+            self.invalidate(key)
+            return None
+        return value
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a result atomically, so readers never see a partial file.
+
+        Args:
+            key: Cache key from extraction_cache_key
+            value: JSON-serializable extraction result
+        """
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove a cached result if present.
+
+        Args:
+            key: Cache key from extraction_cache_key
+        """
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
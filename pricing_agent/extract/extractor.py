@@ -1,8 +1,104 @@
 """Main extractor for converting chunks to price evidence."""
 
-from typing import List, Dict, Any, Optional
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from ..schemas import PriceEvidence, DataType, ListingType, Currency
+from ..utils.rate_limit import RateLimiter
 from .llm_client import LLMClient
+from .batch_llm_client import batch_custom_id
+from .regex_pass import has_price_mention
+
+logger = logging.getLogger(__name__)
+
+# Chunks sent per LLM call by extract_from_chunks (~1k-token chunks fit comfortably)
+EXTRACTION_BATCH_SIZE = 8
+
+# Lookup tables for validating extracted fields, built once at import
+DATA_TYPE_MAP = {
+    'contact': DataType.CONTACT,
+    'pii_core': DataType.PII_CORE,
+    'fullz': DataType.FULLZ,
+    'credit_card': DataType.CREDIT_CARD,
+    'bank_login': DataType.BANK_LOGIN,
+    'gov_id_scan': DataType.GOV_ID_SCAN,
+    'medical_record': DataType.MEDICAL_RECORD,
+    'consumer_account': DataType.CONSUMER_ACCOUNT,
+    'corporate_access': DataType.CORPORATE_ACCESS,
+    'telecom_subscription': DataType.TELECOM_SUBSCRIPTION,
+    'telecom_profile': DataType.TELECOM_PROFILE,
+    'other': DataType.OTHER,
+}
+
+LISTING_TYPE_MAP = {
+    'retail_lookup': ListingType.RETAIL_LOOKUP,
+    'bulk_dump': ListingType.BULK_DUMP,
+    'account_access': ListingType.ACCOUNT_ACCESS,
+    'document_scan': ListingType.DOCUMENT_SCAN,
+}
+
+# Compact codes used in the extraction prompt (matched after lowercasing)
+DATA_TYPE_CODES = {
+    'dt1': DataType.CONTACT,
+    'dt2': DataType.PII_CORE,
+    'dt3': DataType.FULLZ,
+    'dt4': DataType.CREDIT_CARD,
+    'dt5': DataType.BANK_LOGIN,
+    'dt6': DataType.GOV_ID_SCAN,
+    'dt7': DataType.MEDICAL_RECORD,
+    'dt8': DataType.CONSUMER_ACCOUNT,
+    'dt9': DataType.CORPORATE_ACCESS,
+    'dt10': DataType.TELECOM_SUBSCRIPTION,
+    'dt11': DataType.TELECOM_PROFILE,
+    'dt12': DataType.OTHER,
+}
+
+LISTING_TYPE_CODES = {
+    'lt1': ListingType.RETAIL_LOOKUP,
+    'lt2': ListingType.BULK_DUMP,
+    'lt3': ListingType.ACCOUNT_ACCESS,
+    'lt4': ListingType.DOCUMENT_SCAN,
+}
+
+CURRENCY_MAP = {
+    'USD': Currency.USD,
+    'EUR': Currency.EUR,
+    'CNY': Currency.CNY,
+    'GBP': Currency.GBP,
+}
+
+VALID_UNITS = frozenset({'per_record', 'per_account', 'per_dataset'})
+
+
+def _safe_float(value, default=None):
+    """Safely convert value to float."""
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _safe_int(value, default=None):
+    """Safely convert value to int."""
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _source_fields(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick the PriceEvidence provenance fields out of document metadata."""
+    return {
+        'source_id': metadata.get('source_id', 'unknown'),
+        'source_url': metadata.get('source_url'),
+        'source_title': metadata.get('source_title'),
+        'published_date': metadata.get('published_date'),
+    }
 
 
 class EvidenceExtractor:
@@ -16,39 +112,194 @@ class EvidenceExtractor:
             llm_client: LLM client for extraction
         """
         self.llm_client = llm_client
+        
+        # Regex prefilter statistics, for tuning the hit rate
+        self.chunks_checked = 0
+        self.chunks_skipped = 0
+        self._stats_lock = threading.Lock()
+    
+    def _should_extract(self, chunk: str, force_llm: bool) -> bool:
+        """Decide whether a chunk is worth an LLM call and record the outcome."""
+        has_signal = force_llm or has_price_mention(chunk)
+        with self._stats_lock:
+            self.chunks_checked += 1
+            if not has_signal:
+                self.chunks_skipped += 1
+        return has_signal
     
-    def extract_from_chunk(self, metadata: Dict[str, Any], chunk: str) -> List[PriceEvidence]:
+    def extract_from_chunk(self, metadata: Dict[str, Any], chunk: str, force_llm: bool = False) -> List[PriceEvidence]:
         """
         Extract price evidence from a text chunk.
         
+        Chunks without any regex price signal are skipped without an LLM call.
+        
         Args:
             metadata: Document metadata
             chunk: Text chunk to analyze
+            force_llm: Send the chunk to the LLM even without a price signal
             
         Returns:
             List of price evidence objects
         """
+        if not self._should_extract(chunk, force_llm):
+            return []
+        return self._extract_single(metadata, chunk)
+    
+    def iter_price_evidence(self, metadata: Dict[str, Any], chunk: str,
+                            force_llm: bool = False) -> Iterator[PriceEvidence]:
+        """
+        Extract price evidence from a text chunk, yielding items as the LLM streams them.
+        
+        Args:
+            metadata: Document metadata
+            chunk: Text chunk to analyze
+            force_llm: Send the chunk to the LLM even without a price signal
+            
+        Yields:
+            Price evidence objects
+        """
+        if not self._should_extract(chunk, force_llm):
+            return
+        
+        source_fields = _source_fields(metadata)
+        for item in self.llm_client.stream_price_evidence(chunk, metadata):
+            try:
+                evidence = self._create_price_evidence(item, metadata, chunk, source_fields)
+            except Exception as e:
+                logger.warning("Failed to create price evidence from item %s: %s", item, e)
+                continue
+            if evidence:
+                yield evidence
+    
+    def _extract_single(self, metadata: Dict[str, Any], chunk: str) -> List[PriceEvidence]:
+        """Extract price evidence from one chunk with its own LLM call."""
         try:
             # Get structured extraction from LLM
             result = self.llm_client.extract_price_evidence(chunk, metadata)
+            return self._evidence_from_result(result, metadata, chunk)
             
-            evidence_list = []
-            for item in result.get('price_evidence', []):
-                try:
-                    evidence = self._create_price_evidence(item, metadata, chunk)
-                    if evidence:
-                        evidence_list.append(evidence)
-                except Exception as e:
-                    print(f"Warning: Failed to create price evidence from item {item}: {e}")
-                    continue
+        except Exception as e:
+            logger.error("Error extracting evidence from chunk: %s", e)
+            return []
+    
+    def extract_from_chunks_parallel(self, items: List[Tuple[Dict[str, Any], str]],
+                                     max_workers: int = 8,
+                                     requests_per_minute: Optional[float] = None,
+                                     force_llm: bool = False) -> List[List[PriceEvidence]]:
+        """
+        Extract price evidence from many text chunks, one LLM call per chunk, concurrently.
+        
+        Transient HTTP errors are already retried with backoff by the OpenAI
+        client, so only the request rate is managed here.
+        
+        Args:
+            items: (metadata, chunk) pairs
+            max_workers: Maximum number of concurrent LLM calls
+            requests_per_minute: Maximum number of LLM calls started per minute (unlimited if None)
+            force_llm: Send every chunk to the LLM, even without a price signal
             
-            return evidence_list
+        Returns:
+            Price evidence for each chunk, in input order
+        """
+        if not items:
+            return []
+        
+        limiter = RateLimiter(requests_per_minute) if requests_per_minute else None
+        
+        def extract(item: Tuple[Dict[str, Any], str]) -> List[PriceEvidence]:
+            metadata, chunk = item
+            if not self._should_extract(chunk, force_llm):
+                return []
+            if limiter is not None:
+                limiter.acquire()
+            return self._extract_single(metadata, chunk)
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(extract, items))
+    
+    def extract_from_chunks(self, items: List[Tuple[Dict[str, Any], str]],
+                            batch_size: int = EXTRACTION_BATCH_SIZE,
+                            max_workers: int = 8,
+                            force_llm: bool = False) -> List[PriceEvidence]:
+        """
+        Extract price evidence from many text chunks, several per LLM call.
+        
+        Chunks without any regex price signal are dropped first. Batches are
+        sent concurrently on a thread pool, since each call is dominated by
+        network latency.
+        
+        Args:
+            items: (metadata, chunk) pairs
+            batch_size: Maximum number of chunks sent in one LLM call
+            max_workers: Maximum number of concurrent LLM calls
+            force_llm: Send every chunk to the LLM, even without a price signal
             
+        Returns:
+            List of price evidence objects, in input order
+        """
+        items = [item for item in items if self._should_extract(item[1], force_llm)]
+        batches = [items[start:start + batch_size] for start in range(0, len(items), batch_size)]
+        if len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+                batch_evidence = list(executor.map(self._extract_batch, batches))
+        else:
+            batch_evidence = [self._extract_batch(batch) for batch in batches]
+        
+        return [evidence for evidence_list in batch_evidence for evidence in evidence_list]
+    
+    def _extract_batch(self, batch: List[Tuple[Dict[str, Any], str]]) -> List[PriceEvidence]:
+        """Extract price evidence from one batch of chunks with a single LLM call."""
+        try:
+            results = self.llm_client.extract_price_evidence_batch(
+                [(chunk, metadata) for metadata, chunk in batch]
+            )
         except Exception as e:
-            print(f"Error extracting evidence from chunk: {e}")
+            logger.error("Error extracting evidence from chunk batch: %s", e)
             return []
+        
+        evidence_list = []
+        for (metadata, chunk), result in zip(batch, results):
+            evidence_list.extend(self._evidence_from_result(result, metadata, chunk))
+        
+        return evidence_list
     
-    def _create_price_evidence(self, item: Dict[str, Any], metadata: Dict[str, Any], chunk: str) -> Optional[PriceEvidence]:
+    def extract_from_batch_results(self, items: List[Tuple[Dict[str, Any], str]],
+                                   results: Dict[str, Dict[str, Any]]) -> List[PriceEvidence]:
+        """
+        Convert results collected by BatchLLMClient into price evidence.
+        
+        Args:
+            items: (metadata, chunk) pairs, in the order they were submitted
+            results: Results keyed by batch custom ID, from BatchLLMClient.collect
+            
+        Returns:
+            List of price evidence objects, in input order
+        """
+        evidence_list = []
+        for i, (metadata, chunk) in enumerate(items):
+            result = results.get(batch_custom_id(metadata, i))
+            if result is not None:
+                evidence_list.extend(self._evidence_from_result(result, metadata, chunk))
+        
+        return evidence_list
+    
+    def _evidence_from_result(self, result: Dict[str, Any], metadata: Dict[str, Any], chunk: str) -> List[PriceEvidence]:
+        """Convert one chunk's extraction result into price evidence objects."""
+        evidence_list = []
+        source_fields = _source_fields(metadata)  # Shared by every item of the chunk
+        for item in result.get('price_evidence', []):
+            try:
+                evidence = self._create_price_evidence(item, metadata, chunk, source_fields)
+                if evidence:
+                    evidence_list.append(evidence)
+            except Exception as e:
+                logger.warning("Failed to create price evidence from item %s: %s", item, e)
+                continue
+        
+        return evidence_list
+    
+    def _create_price_evidence(self, item: Dict[str, Any], metadata: Dict[str, Any], chunk: str,
+                               source_fields: Optional[Dict[str, Any]] = None) -> Optional[PriceEvidence]:
         """
         Create a PriceEvidence object from extracted item.
         
@@ -56,6 +307,7 @@ class EvidenceExtractor:
             item: Extracted item data
             metadata: Document metadata
             chunk: Original text chunk
+            source_fields: Provenance fields precomputed from metadata (optional)
             
         Returns:
             PriceEvidence object or None if invalid
@@ -90,8 +342,8 @@ class EvidenceExtractor:
                 return None
             
             # Validate and fix units
-            units = item.get('units', 'per_record')
-            if units not in ['per_record', 'per_account', 'per_dataset']:
+            units = item.get('units') or 'per_record'
+            if units not in VALID_UNITS:
                 # Map common invalid units to valid ones
                 if 'card' in units.lower() or 'credit' in units.lower():
                     units = 'per_record'
@@ -105,11 +357,11 @@ class EvidenceExtractor:
             # Create snippet from chunk (simplified)
             snippet = self._extract_snippet(chunk, item.get('snippet', ''))
             
+            if source_fields is None:
+                source_fields = _source_fields(metadata)
+            
             return PriceEvidence(
-                source_id=metadata.get('source_id', 'unknown'),
-                source_url=metadata.get('source_url'),
-                source_title=metadata.get('source_title'),
-                published_date=metadata.get('published_date'),
+                **source_fields,
                 data_type=data_type,
                 listing_type=listing_type,
                 region=item.get('region'),
@@ -119,54 +371,28 @@ class EvidenceExtractor:
                 units=units,
                 quality_notes=item.get('quality_notes'),
                 packaging=item.get('packaging'),
-                sample_size=self._safe_int(item.get('sample_size')),
-                price_low=self._safe_float(item.get('price_low')),
-                price_high=self._safe_float(item.get('price_high')),
+                sample_size=_safe_int(item.get('sample_size')),
+                price_low=_safe_float(item.get('price_low')),
+                price_high=_safe_float(item.get('price_high')),
                 snippet=snippet,
-                extractor_confidence=self._safe_float(item.get('confidence'), 0.7)
+                extractor_confidence=_safe_float(item.get('confidence'), 0.7)
             )
             
         except Exception as e:
-            print(f"Error creating price evidence: {e}")
+            logger.warning("Error creating price evidence: %s", e)
             return None
     
     def _parse_data_type(self, data_type_str: str) -> Optional[DataType]:
-        """Parse data type string to enum."""
-        mapping = {
-            'contact': DataType.CONTACT,
-            'pii_core': DataType.PII_CORE,
-            'fullz': DataType.FULLZ,
-            'credit_card': DataType.CREDIT_CARD,
-            'bank_login': DataType.BANK_LOGIN,
-            'gov_id_scan': DataType.GOV_ID_SCAN,
-            'medical_record': DataType.MEDICAL_RECORD,
-            'consumer_account': DataType.CONSUMER_ACCOUNT,
-            'corporate_access': DataType.CORPORATE_ACCESS,
-            'telecom_subscription': DataType.TELECOM_SUBSCRIPTION,
-            'telecom_profile': DataType.TELECOM_PROFILE,
-            'other': DataType.OTHER,
-        }
-        return mapping.get(data_type_str)
+        """Parse data type string (full name or prompt code) to enum."""
+        return DATA_TYPE_MAP.get(data_type_str) or DATA_TYPE_CODES.get(data_type_str)
     
     def _parse_listing_type(self, listing_type_str: str) -> Optional[ListingType]:
-        """Parse listing type string to enum."""
-        mapping = {
-            'retail_lookup': ListingType.RETAIL_LOOKUP,
-            'bulk_dump': ListingType.BULK_DUMP,
-            'account_access': ListingType.ACCOUNT_ACCESS,
-            'document_scan': ListingType.DOCUMENT_SCAN,
-        }
-        return mapping.get(listing_type_str)
+        """Parse listing type string (full name or prompt code) to enum."""
+        return LISTING_TYPE_MAP.get(listing_type_str) or LISTING_TYPE_CODES.get(listing_type_str)
     
     def _parse_currency(self, currency_str: str) -> Currency:
         """Parse currency string to enum."""
-        mapping = {
-            'USD': Currency.USD,
-            'EUR': Currency.EUR,
-            'CNY': Currency.CNY,
-            'GBP': Currency.GBP,
-        }
-        return mapping.get(currency_str, Currency.USD)
+        return CURRENCY_MAP.get(currency_str, Currency.USD)
     
     def _extract_snippet(self, chunk: str, suggested_snippet: str) -> str:
         """Extract relevant snippet from chunk."""
@@ -175,21 +401,3 @@ class EvidenceExtractor:
         
         # Fallback: return first 200 characters of chunk
         return chunk[:200] + "..." if len(chunk) > 200 else chunk
-    
-    def _safe_float(self, value, default=None):
-        """Safely convert value to float."""
-        if value is None:
-            return default
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return default
-    
-    def _safe_int(self, value, default=None):
-        """Safely convert value to int."""
-        if value is None:
-            return default
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return default
@@ -1,24 +1,307 @@
+import functools
+import hashlib
 import json
+import logging
 import os
+import re
 import sys
-from typing import Dict, Any, Optional
-from .prompts import EXTRACTION_SYSTEM, EXTRACTION_USER_TEMPLATE
+import time
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+from ..utils.cache import ResponseCache
+from .cache import ExtractionCache, extraction_cache_key
+from .prompts import (
+    EXTRACTION_SYSTEM,
+    EXTRACTION_USER_TEMPLATE,
+    EXTRACTION_BATCH_BLOCK_TEMPLATE,
+    EXTRACTION_BATCH_USER_TEMPLATE,
+    EXTRACTION_STREAM_USER_TEMPLATE,
+    PROMPT_VERSION,
+)
+
+logger = logging.getLogger(__name__)
+
+
+PRICE_EVIDENCE_LIST_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "data_type": {"type": "string"},
+            "listing_type": {"type": "string"},
+            "region": {"type": "string"},
+            "price_value": {"type": "number"},
+            "currency": {"type": "string"},
+            "units": {"type": "string"},
+            "item_desc": {"type": "string"},
+            "quality_notes": {"type": "string"},
+            "packaging": {"type": "string"},
+            "sample_size": {"type": "integer"},
+            "price_low": {"type": "number"},
+            "price_high": {"type": "number"},
+            "snippet": {"type": "string"},
+            "confidence": {"type": "number"}
+        }
+    }
+}
+
+
+def _strict_object_schema(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Make every property required but nullable, as strict structured outputs demand."""
+    return {
+        "type": "object",
+        "properties": {
+            name: {**prop, "type": [prop["type"], "null"]}
+            for name, prop in properties.items()
+        },
+        "required": list(properties),
+        "additionalProperties": False
+    }
+
+
+# Strict-mode version of the extraction schema (optional fields become nullable)
+PRICE_EVIDENCE_STRICT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "price_evidence": {
+            "type": "array",
+            "items": _strict_object_schema(PRICE_EVIDENCE_LIST_SCHEMA["items"]["properties"])
+        }
+    },
+    "required": ["price_evidence"],
+    "additionalProperties": False
+}
+
+# Chunks longer than this are split before extraction, to stay clear of the
+# context window and leave room for the response
+MAX_INPUT_TOKENS = 8000
+
+# Distinct chunk texts remembered by LLMClient.extract_price_evidence
+CHUNK_MEMO_SIZE = 4096
+
+def _is_extraction_result(result: Dict[str, Any]) -> bool:
+    """Check that an extraction response carries a price evidence list."""
+    return isinstance(result, dict) and isinstance(result.get("price_evidence"), list)
+
+
+def _is_batch_extraction_result(result: Dict[str, Any]) -> bool:
+    """Check that a batch extraction response carries a list of per-chunk results."""
+    return isinstance(result, dict) and isinstance(result.get("results"), list)
+
+
+def _passes(validate: Callable[[Dict[str, Any]], bool], result: Dict[str, Any]) -> bool:
+    """Run a response validator, treating a validator error as a rejection."""
+    try:
+        return bool(validate(result))
+    except Exception:
+        return False
+
+
+# Boundaries tried in turn when a piece of text is over the token budget:
+# paragraph breaks, line breaks (so price table rows stay whole), then the
+# whitespace after a sentence
+_SPLIT_BOUNDARY_RES = (
+    re.compile(r'(\n[ \t]*\n\s*)'),
+    re.compile(r'(\n+)'),
+    re.compile(r'(?<=[.!?])(\s+)'),
+)
+
+
+def split_to_token_budget(text: str, max_tokens: int, count_tokens: Callable[[str], int],
+                          _level: int = 0) -> List[str]:
+    """
+    Split text into pieces of at most max_tokens tokens, on natural boundaries.
+    
+    Paragraphs are packed greedily and rejoined with their original
+    whitespace. A paragraph over the budget is split on line breaks, a line
+    over the budget on sentence boundaries, and only a single sentence over
+    the budget is cut into equal-length slices.
+    
+    Args:
+        text: Text to split
+        max_tokens: Token budget per piece
+        count_tokens: Function returning the token count of a string
+        
+    Returns:
+        Pieces of text, in order
+    """
+    if _level == len(_SPLIT_BOUNDARY_RES):
+        n_tokens = count_tokens(text)
+        if n_tokens <= max_tokens or len(text) <= 1:
+            return [text]
+        # Tokens are not spread evenly, so a slice still over the budget is cut again
+        step = -(-len(text) // -(-n_tokens // max_tokens))
+        return [piece for i in range(0, len(text), step)
+                for piece in split_to_token_budget(text[i:i + step], max_tokens, count_tokens, _level)]
+    
+    parts = _SPLIT_BOUNDARY_RES[_level].split(text)
+    segments, separators = parts[0::2], parts[1::2] + [""]
+    
+    pieces = []
+    current = None
+    current_tokens = 0
+    pending_sep = ""
+    for segment, sep in zip(segments, separators):
+        n_tokens = count_tokens(segment)
+        if n_tokens > max_tokens:
+            if current is not None:
+                pieces.append(current)
+                current, current_tokens = None, 0
+            pieces.extend(split_to_token_budget(segment, max_tokens, count_tokens, _level + 1))
+            continue
+        if current is None:
+            current, current_tokens = segment, n_tokens
+            pending_sep = sep
+            continue
+        joined_tokens = current_tokens + count_tokens(pending_sep) + n_tokens
+        if joined_tokens > max_tokens:
+            pieces.append(current)
+            current, current_tokens = segment, n_tokens
+        else:
+            current, current_tokens = current + pending_sep + segment, joined_tokens
+        pending_sep = sep
+    if current is not None:
+        pieces.append(current)
+    return pieces
+
+
+# Fenced ```json block, tried first by the fallback JSON parser
+_JSON_FENCE_RE = re.compile(r'```json\s*(.*?)```', re.DOTALL)
+
+
+def _extract_json_span(text: str, pos: int = 0) -> Optional[Tuple[int, int]]:
+    """
+    Find the first balanced JSON object in text.
+    
+    Braces inside JSON strings (including escaped quotes) are ignored. If the
+    scan from an opening brace reaches the end of the text without closing it,
+    scanning restarts at the next opening brace, so a stray unbalanced brace
+    in the surrounding prose does not hide the object after it. Each restart
+    rescans, so the worst case is quadratic in the number of unclosed braces.
+    
+    Args:
+        text: Text that may contain a JSON object
+        pos: Index to start searching from
+        
+    Returns:
+        (start, end) slice bounds of the object, or None if there is none
+    """
+    start = text.find('{', pos)
+    while start != -1:
+        depth = 0
+        in_str = False
+        esc = False
+        for i in range(start, len(text)):
+            ch = text[i]
+            if in_str:
+                if esc:
+                    esc = False
+                elif ch == '\\':
+                    esc = True
+                elif ch == '"':
+                    in_str = False
+            elif ch == '"':
+                in_str = True
+            elif ch == '{':
+                depth += 1
+            elif ch == '}':
+                depth -= 1
+                if depth == 0:
+                    return start, i + 1
+        start = text.find('{', start + 1)
+    return None
+
+
+def _decode_first_object(text: str) -> Optional[Dict[str, Any]]:
+    """Decode the first balanced JSON object in text that parses, or return None."""
+    pos = 0
+    while True:
+        span = _extract_json_span(text, pos)
+        if span is None:
+            return None
+        start, end = span
+        try:
+            return json.loads(text[start:end])
+        except ValueError:
+            pos = start + 1
+
+
+def _parse_json_line(line: str) -> Optional[Dict[str, Any]]:
+    """Decode one JSON Lines record, ignoring blank lines, fences and partial output."""
+    line = line.strip()
+    if not line.startswith('{'):
+        return None
+    try:
+        item = json.loads(line)
+    except ValueError:
+        return None
+    return item if isinstance(item, dict) else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _extraction_prompt_parts(template: str, source_id: str, source_title: str,
+                             published_date: str) -> Tuple[str, str]:
+    """Fill in the per-document header of a template once, returning the text around {chunk}."""
+    prefix, suffix = template.split("{chunk}", 1)
+    prefix = prefix.format(source_id=source_id, source_title=source_title, published_date=published_date)
+    return prefix, suffix.replace("{{", "{").replace("}}", "}")
+
+
+def format_extraction_prompt(chunk: str, metadata: Dict[str, Any],
+                             template: str = EXTRACTION_USER_TEMPLATE) -> str:
+    """
+    Build the user prompt for extracting price evidence from one chunk.
+    
+    The document header is formatted once per document and reused for each
+    of its chunks.
+    
+    Args:
+        chunk: Text chunk to analyze
+        metadata: Document metadata
+        template: User prompt template to fill in
+        
+    Returns:
+        Formatted user prompt
+    """
+    prefix, suffix = _extraction_prompt_parts(
+        template,
+        str(metadata.get('source_id', 'unknown')),
+        str(metadata.get('source_title', 'Unknown')),
+        str(metadata.get('published_date', 'Unknown'))
+    )
+    return prefix + chunk + suffix
 
 class LLMClient:
     """Provider-agnostic LLM client for structured extraction."""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4.1-nano"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4.1-nano",
+                 cache_dir: Optional[str] = None, structured_output: bool = False,
+                 api_host: str = "https://yunwu.ai/v1", max_tokens: int = 12000):
         """
         Initialize LLM client.
         
         Args:
             api_key: API key for LLM provider
             model: Model name to use
+            cache_dir: Directory for the on-disk extraction cache (disabled if None)
+            structured_output: Have the provider enforce the price evidence schema
+                in extract_price_evidence instead of recovering JSON from free text
+            api_host: Base URL of the OpenAI-compatible API
+            max_tokens: Maximum tokens per response
         """
         self.api_key = api_key or os.getenv("LLM_API_KEY")
         self.model = model
+        self.structured_output = structured_output
         self._invoker = None
+        self.extraction_cache = ExtractionCache(cache_dir) if cache_dir else None
+        self._enc = self._load_tokenizer(model)
+        # In-process memo of extractions from identical chunk text within a run
+        self.chunk_memo = ResponseCache(max_entries=CHUNK_MEMO_SIZE)
         
         # Initialize GPTInvoker if API key is available
         if self.api_key:
@@ -35,32 +318,45 @@ class LLMClient:
                 self._invoker = GPTInvoker(
                     model=self.model,
                     api_key=self.api_key,
-                    api_host="https://yunwu.ai/v1",
+                    api_host=api_host,
                     temperature=0.1,
-                    max_tokens=12000,
+                    max_tokens=max_tokens,
                     write_to_cache=False,
                     read_from_cache=False,
                 )
-                print(f"Initialized GPTInvoker with model {model}")
+                logger.info("Initialized GPTInvoker with model %s", model)
             except ImportError:
-                print("Warning: GPTInvoker not found. Please ensure gpt_invoker.py is in your Python path.")
-                print("Falling back to stub implementation.")
+                logger.warning("GPTInvoker not found. Please ensure gpt_invoker.py is in your Python path. "
+                               "Falling back to stub implementation.")
             except Exception as e:
-                print(f"Error initializing GPTInvoker: {e}")
-                print("Falling back to stub implementation.")
+                logger.error("Error initializing GPTInvoker: %s. Falling back to stub implementation.", e)
     
-    def json_extract(self, system_prompt: str, user_prompt: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    def json_extract(self, system_prompt: str, user_prompt: str, schema: Dict[str, Any],
+                     validate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Dict[str, Any]:
         """
         Extract structured data using LLM with function calling.
         
+        Results go through the on-disk cache only when validate is given:
+        cached entries it rejects are evicted and re-requested, and responses
+        it rejects are never stored, so a bad reply cannot be replayed.
+        
         Args:
             system_prompt: System prompt for the LLM
             user_prompt: User prompt with the text to analyze
             schema: JSON schema for the expected output
+            validate: Check that a parsed response is usable (enables caching)
             
         Returns:
             Extracted data as dictionary
         """
+        cache_key = None
+        if self.extraction_cache is not None and validate is not None:
+            cache_key = extraction_cache_key(self.model, PROMPT_VERSION, system_prompt, user_prompt)
+            cached = self.extraction_cache.get(cache_key)
+            if cached is not None:
+                if _passes(validate, cached):
+                    return cached
+                self.extraction_cache.invalidate(cache_key)
         
         try:
             messages = [
@@ -69,38 +365,8 @@ class LLMClient:
             ]
             
             response = self._invoker.generate(messages)
-            try:
-                result = self._invoker.extract_json(response)
-                return result
-            except:
-                # If JSON extraction fails, try to parse manually
-                try:
-                    # Look for JSON in the response with more flexible patterns
-                    import re
-                    
-                    # Try to find JSON block with ```json markers first
-                    json_block_match = re.search(r'```json\s*(\{.*?\})\s*```', response, re.DOTALL)
-                    if json_block_match:
-                        result = json.loads(json_block_match.group(1))
-                        return result
-                    
-                    # Try to find any JSON object in the response
-                    json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', response, re.DOTALL)
-                    if json_match:
-                        result = json.loads(json_match.group())
-                        return result
-                    
-                    # Try to find JSON starting from the first { and ending at the last }
-                    start_idx = response.find('{')
-                    end_idx = response.rfind('}')
-                    if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
-                        json_str = response[start_idx:end_idx+1]
-                        result = json.loads(json_str)
-                        return result
-                        
-                except Exception:
-                    pass
-                
+            result = self._parse_json_response(response)
+            if result is None:
                 # Return empty result if parsing fails
                 return {
                     "price_evidence": [],
@@ -110,31 +376,155 @@ class LLMClient:
                 
         except ValueError as e:
             if "Finish reason is not 'stop'" in str(e):
-                print(f"Warning: LLM response truncated due to token limit. Consider increasing max_tokens.")
+                logger.warning("LLM response truncated due to token limit. Consider increasing max_tokens.")
                 return {
                     "price_evidence": [],
                     "confidence": 0.0,
                     "extraction_notes": f"LLM response truncated: {str(e)}"
                 }
             else:
-                print(f"Error calling LLM: {e}")
+                logger.error("Error calling LLM: %s", e)
                 return {
                     "price_evidence": [],
                     "confidence": 0.0,
                     "extraction_notes": f"LLM call failed: {str(e)}"
                 }
         except Exception as e:
-            print(f"Error calling LLM: {e}")
+            logger.error("Error calling LLM: %s", e)
             return {
                 "price_evidence": [],
                 "confidence": 0.0,
                 "extraction_notes": f"LLM call failed: {str(e)}"
             }
+        
+        # Only valid responses are cached; failures are retried next run
+        if cache_key is not None and _passes(validate, result):
+            try:
+                self.extraction_cache.put(cache_key, result)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning("Failed to cache extraction result: %s", e)
+        return result
+    
+    def _parse_json_response(self, response: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse the JSON object out of an LLM response.
+        
+        Args:
+            response: Raw LLM response text
+            
+        Returns:
+            Parsed data, or None if no JSON object could be decoded
+        """
+        try:
+            return self._invoker.extract_json(response)
+        except Exception:
+            # If JSON extraction fails, try a ```json block first, then the first
+            # balanced object that parses, then everything from the first { to the last }
+            fence = _JSON_FENCE_RE.search(response)
+            if fence:
+                data = _decode_first_object(fence.group(1))
+                if data is not None:
+                    return data
+            
+            data = _decode_first_object(response)
+            if data is not None:
+                return data
+            
+            start_idx = response.find('{')
+            end_idx = response.rfind('}')
+            if start_idx != -1 and end_idx > start_idx:
+                try:
+                    return json.loads(response[start_idx:end_idx + 1])
+                except ValueError:
+                    pass
+            return None
+    
+    def json_extract_constrained(self, system_prompt: str, user_prompt: str, schema: Dict[str, Any],
+                                 schema_name: str = "response", max_retries: int = 0) -> Dict[str, Any]:
+        """
+        Extract structured data with the schema enforced by the provider.
+        
+        Sends the schema as a strict structured-output response format, so the
+        model can only produce JSON matching it. The schema must follow the
+        provider's strict-mode rules (all properties required,
+        additionalProperties false).
+        
+        Args:
+            system_prompt: System prompt for the LLM
+            user_prompt: User prompt with the text to analyze
+            schema: JSON schema for the expected output
+            schema_name: Name reported to the provider for the schema
+            max_retries: Extra attempts when the response cannot be decoded; each
+                retry shows the model its previous output and the error
+            
+        Returns:
+            Extracted data as dictionary
+            
+        Raises:
+            RuntimeError: If no LLM backend is available
+            ValueError: If the response cannot be decoded
+        """
+        if not self._invoker:
+            raise RuntimeError("LLM backend is not available")
+        
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {"name": schema_name, "schema": schema, "strict": True}
+        }
+        
+        for attempt in range(max_retries + 1):
+            response = self._invoker.generate(messages, response_format=response_format)
+            try:
+                return json.loads(response)
+            except ValueError as e:
+                if attempt == max_retries:
+                    raise
+                messages = messages + [
+                    {"role": "assistant", "content": response},
+                    {"role": "user", "content": f"Your output had error: {e}. Fix and retry."}
+                ]
+                time.sleep(1.0 * (attempt + 1))
+    
+    @staticmethod
+    def _load_tokenizer(model: str):
+        """Get the tiktoken encoding for a model, or None if tiktoken is unavailable."""
+        if tiktoken is None:
+            return None
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    
+    def count_tokens(self, text: str) -> int:
+        """
+        Count the tokens in text.
+        
+        Falls back to a conservative estimate of one token per three
+        characters when tiktoken is not installed.
+        
+        Args:
+            text: Text to measure
+            
+        Returns:
+            Number of tokens
+        """
+        if self._enc is None:
+            return len(text) // 3 + 1
+        return len(self._enc.encode(text, disallowed_special=()))
     
     def extract_price_evidence(self, chunk: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract price evidence from a text chunk.
         
+        Chunks over MAX_INPUT_TOKENS are split on sentence boundaries and the
+        evidence from all pieces is combined. Repeated chunk text (boilerplate,
+        repeated tables) is answered from an in-process memo; the extracted
+        items carry no provenance, so this is safe across documents.
+        
         Args:
             chunk: Text chunk to analyze
             metadata: Document metadata
@@ -142,39 +532,216 @@ class LLMClient:
         Returns:
             Structured price evidence
         """
-        user_prompt = EXTRACTION_USER_TEMPLATE.format(
-            source_id=metadata.get('source_id', 'unknown'),
-            source_title=metadata.get('source_title', 'Unknown'),
-            published_date=metadata.get('published_date', 'Unknown'),
-            chunk=chunk
+        memo_key = self._memo_key(chunk)
+        memoized = self.chunk_memo.get(memo_key)
+        if memoized is not None:
+            return memoized
+        
+        if self.count_tokens(chunk) <= MAX_INPUT_TOKENS:
+            result = self._extract_price_evidence_single(chunk, metadata)
+        else:
+            result = {"price_evidence": []}
+            notes = []
+            for piece in split_to_token_budget(chunk, MAX_INPUT_TOKENS, self.count_tokens):
+                piece_result = self._extract_price_evidence_single(piece, metadata)
+                result["price_evidence"].extend(piece_result.get('price_evidence', []))
+                if piece_result.get('extraction_notes'):
+                    notes.append(str(piece_result['extraction_notes']))
+            if notes:
+                result['extraction_notes'] = "; ".join(notes)
+        
+        # Failed calls are not memoized, so a repeat of the chunk tries again
+        if not result.get('extraction_notes'):
+            self.chunk_memo.put(memo_key, result)
+        return result
+    
+    def _memo_key(self, chunk: str) -> str:
+        """Key of a chunk's extraction in chunk_memo."""
+        return self.model + ":" + hashlib.blake2b(chunk.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _extract_price_evidence_single(self, chunk: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract price evidence from a chunk that fits the token budget."""
+        user_prompt = format_extraction_prompt(chunk, metadata)
+        
+        if self.structured_output:
+            return self._extract_price_evidence_structured(user_prompt)
+        
+        schema = {
+            "type": "object",
+            "properties": {
+                "price_evidence": PRICE_EVIDENCE_LIST_SCHEMA
+            }
+        }
+        
+        return self.json_extract(EXTRACTION_SYSTEM, user_prompt, schema, validate=_is_extraction_result)
+    
+    def _extract_price_evidence_structured(self, user_prompt: str) -> Dict[str, Any]:
+        """Extract price evidence with the schema enforced by the provider."""
+        cache_key = None
+        if self.extraction_cache is not None:
+            cache_key = extraction_cache_key(self.model, PROMPT_VERSION + "+strict", EXTRACTION_SYSTEM, user_prompt)
+            cached = self.extraction_cache.get(cache_key)
+            if cached is not None:
+                if _is_extraction_result(cached):
+                    return cached
+                self.extraction_cache.invalidate(cache_key)
+        
+        try:
+            result = self.json_extract_constrained(
+                EXTRACTION_SYSTEM, user_prompt, PRICE_EVIDENCE_STRICT_SCHEMA,
+                schema_name="price_evidence", max_retries=2
+            )
+        except Exception as e:
+            logger.error("Error calling LLM: %s", e)
+            return {
+                "price_evidence": [],
+                "confidence": 0.0,
+                "extraction_notes": f"LLM call failed: {str(e)}"
+            }
+        
+        if cache_key is not None and _is_extraction_result(result):
+            try:
+                self.extraction_cache.put(cache_key, result)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning("Failed to cache extraction result: %s", e)
+        return result
+    
+    def extract_price_evidence_batch(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Extract price evidence from several text chunks with a single LLM call.
+        
+        The chunks are sent as numbered blocks and the LLM returns one result
+        per block, so the system prompt is paid once per batch. Chunks that are
+        memoized or over MAX_INPUT_TOKENS, chunks the response leaves out, and
+        all chunks when structured_output is set or the response cannot be used
+        at all, go through extract_price_evidence one by one.
+        
+        Args:
+            items: (chunk, metadata) pairs
+            
+        Returns:
+            Structured price evidence for each chunk, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        if not self.structured_output:
+            pending = [
+                i for i, (chunk, _) in enumerate(items)
+                if self.chunk_memo.get(self._memo_key(chunk)) is None
+                and self.count_tokens(chunk) <= MAX_INPUT_TOKENS
+            ]
+            if len(pending) > 1:
+                self._extract_batch_call([items[i] for i in pending], pending, results)
+        
+        missing = [i for i, result in enumerate(results) if result is None]
+        for i in missing:
+            chunk, metadata = items[i]
+            results[i] = self.extract_price_evidence(chunk, metadata)
+        return results
+    
+    def _extract_batch_call(self, batch: List[Tuple[str, Dict[str, Any]]], positions: List[int],
+                            results: List[Optional[Dict[str, Any]]]) -> None:
+        """Extract a batch in one LLM call, filling results[positions[k]] for each chunk the response covers."""
+        batches = "\n\n".join(
+            EXTRACTION_BATCH_BLOCK_TEMPLATE.format(
+                chunk_id=k,
+                source_id=metadata.get('source_id', 'unknown'),
+                source_title=metadata.get('source_title', 'Unknown'),
+                published_date=metadata.get('published_date', 'Unknown'),
+                chunk=chunk
+            )
+            for k, (chunk, metadata) in enumerate(batch)
         )
+        user_prompt = EXTRACTION_BATCH_USER_TEMPLATE.format(n_chunks=len(batch), batches=batches)
         
         schema = {
             "type": "object",
             "properties": {
-                "price_evidence": {
+                "results": {
                     "type": "array",
                     "items": {
                         "type": "object",
                         "properties": {
-                            "data_type": {"type": "string"},
-                            "listing_type": {"type": "string"},
-                            "region": {"type": "string"},
-                            "price_value": {"type": "number"},
-                            "currency": {"type": "string"},
-                            "units": {"type": "string"},
-                            "item_desc": {"type": "string"},
-                            "quality_notes": {"type": "string"},
-                            "packaging": {"type": "string"},
-                            "sample_size": {"type": "integer"},
-                            "price_low": {"type": "number"},
-                            "price_high": {"type": "number"},
-                            "snippet": {"type": "string"},
-                            "confidence": {"type": "number"}
+                            "chunk_id": {"type": "integer"},
+                            "price_evidence": PRICE_EVIDENCE_LIST_SCHEMA
                         }
                     }
                 }
             }
         }
         
-        return self.json_extract(EXTRACTION_SYSTEM, user_prompt, schema)
+        response = self.json_extract(EXTRACTION_SYSTEM, user_prompt, schema, validate=_is_batch_extraction_result)
+        entries = response.get('results')
+        if not isinstance(entries, list):
+            logger.warning("Unusable batch extraction response, extracting %d chunks one by one", len(batch))
+            return
+        
+        evidence_by_id: Dict[int, List[Any]] = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                chunk_id = int(entry.get('chunk_id'))
+            except (TypeError, ValueError):
+                continue
+            evidence = entry.get('price_evidence')
+            if 0 <= chunk_id < len(batch) and isinstance(evidence, list):
+                evidence_by_id.setdefault(chunk_id, []).extend(evidence)
+        
+        for k, evidence in evidence_by_id.items():
+            result = {"price_evidence": evidence}
+            self.chunk_memo.put(self._memo_key(batch[k][0]), result)
+            results[positions[k]] = result
+        
+        n_missing = len(batch) - len(evidence_by_id)
+        if n_missing:
+            logger.warning("Batch extraction response left out %d of %d chunks, extracting them one by one",
+                           n_missing, len(batch))
+    
+    def stream_price_evidence(self, chunk: str, metadata: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Extract price evidence items from a text chunk as the response streams in.
+        
+        The LLM is asked for one JSON object per line, and each complete line is
+        yielded as soon as it arrives. A line cut off by truncation is dropped.
+        If the backend cannot stream, this falls back to a single
+        extract_price_evidence call.
+        
+        Args:
+            chunk: Text chunk to analyze
+            metadata: Document metadata
+            
+        Yields:
+            Price evidence items
+        """
+        generate_stream = getattr(self._invoker, "generate_stream", None)
+        if generate_stream is None:
+            yield from self.extract_price_evidence(chunk, metadata).get('price_evidence', [])
+            return
+        
+        messages = [
+            {"role": "system", "content": EXTRACTION_SYSTEM},
+            {"role": "user", "content": format_extraction_prompt(chunk, metadata, EXTRACTION_STREAM_USER_TEMPLATE)}
+        ]
+        
+        buffer = ""
+        yielded = False
+        try:
+            for text in generate_stream(messages):
+                buffer += text
+                *lines, buffer = buffer.split("\n")
+                for line in lines:
+                    item = _parse_json_line(line)
+                    if item is not None:
+                        yielded = True
+                        yield item
+        except Exception as e:
+            if yielded:
+                logger.warning("LLM stream interrupted: %s", e)
+                return
+            logger.warning("Error streaming from LLM, falling back to a single call: %s", e)
+            yield from self.extract_price_evidence(chunk, metadata).get('price_evidence', [])
+            return
+        
+        item = _parse_json_line(buffer)
+        if item is not None:
+            yield item
@@ -1,68 +1,22 @@
 """Prompts for LLM-based price evidence extraction."""
 
-EXTRACTION_SYSTEM = """You are a data analyst specializing in extracting pricing information from documents about data breaches and dark web markets.
-
-Your task is to identify and extract price evidence from text, focusing on:
-1. Data types being sold (personal info, credit cards, accounts, etc.)
-2. Listing types (retail lookup, bulk dump, account access, document scan)
-3. Price information (amount, currency, units)
-4. Quality and packaging details
-5. Geographic regions when mentioned
-
-IMPORTANT RULES:
-- Only extract information that is explicitly stated in the text
-- Do not make assumptions or infer information not present
-- Focus on actual pricing data, not general market commentary
-- Be conservative with confidence scores
-- Include relevant text snippets as evidence
-- Return structured JSON following the exact schema provided
-- Use flat structure: price_value (number), currency (string), units (string) - NOT nested objects
-
-Data types to look for:
-- contact: Contact information (email, phone, address)
-- pii_core: Core personally identifiable information (name, SSN, DOB)
-- fullz: Complete identity packages
-- credit_card: Credit card information
-- bank_login: Bank account credentials
-- gov_id_scan: Government ID documents
-- medical_record: Medical records
-- consumer_account: Consumer account credentials
-- corporate_access: Corporate system access
-- telecom_subscription: Telecom service subscriptions
-- telecom_profile: Telecom customer profiles
-- other: Other types of data
-
-Listing types:
-- retail_lookup: Individual record lookups
-- bulk_dump: Large datasets
-- account_access: Account credentials
-- document_scan: Scanned documents
-
-JSON FORMAT EXAMPLE:
-{
-  "price_evidence": [
-    {
-      "data_type": "credit_card",
-      "listing_type": "retail_lookup",
-      "region": "US",
-      "price_value": 17.36,
-      "currency": "USD",
-      "units": "per_record",
-      "item_desc": "Credit card information",
-      "quality_notes": "High quality",
-      "packaging": "Individual",
-      "sample_size": 1,
-      "price_low": 15.00,
-      "price_high": 20.00,
-      "snippet": "The average price of a credit card is $17.36",
-      "confidence": 0.8
-    }
-  ]
-}
-
-IMPORTANT: The 'units' field must be one of: 'per_record', 'per_account', or 'per_dataset' - no other values are allowed.
-
-Return only valid JSON following this exact schema."""
+# Bump whenever the prompts below change, so cached extractions are not reused
+PROMPT_VERSION = "2"
+
+EXTRACTION_SYSTEM = """You extract price evidence about data sold in breaches and dark web markets: data type, listing type, price (amount, currency, units), quality/packaging, region.
+
+RULES:
+- Only extract explicitly stated prices; no inference, no general market commentary
+- Be conservative with confidence scores; include the supporting text snippet
+- Flat fields only: price_value (number), currency (string), units (string)
+- units must be one of: per_record, per_account, per_dataset
+
+data_type codes: DT1=contact (email/phone/address), DT2=pii_core (name/SSN/DOB), DT3=fullz (full identity package), DT4=credit_card, DT5=bank_login, DT6=gov_id_scan, DT7=medical_record, DT8=consumer_account, DT9=corporate_access, DT10=telecom_subscription, DT11=telecom_profile, DT12=other
+listing_type codes: LT1=retail_lookup (single records), LT2=bulk_dump (large datasets), LT3=account_access (credentials), LT4=document_scan
+Emit the codes (e.g. "DT4", "LT1") as data_type and listing_type.
+
+Return only valid JSON, e.g.:
+{"price_evidence":[{"data_type":"DT4","listing_type":"LT1","region":"US","price_value":17.36,"currency":"USD","units":"per_record","item_desc":"Credit card information","quality_notes":"High quality","packaging":"Individual","sample_size":1,"price_low":15.0,"price_high":20.0,"snippet":"The average price of a credit card is $17.36","confidence":0.8}]}"""
 
 EXTRACTION_USER_TEMPLATE = """Extract price evidence from the following text:
 
@@ -74,3 +28,33 @@ Text to analyze:
 {chunk}
 
 Extract any pricing information following the schema. If no pricing information is found, return an empty price_evidence array."""
+
+
+EXTRACTION_BATCH_BLOCK_TEMPLATE = """=== CHUNK {chunk_id} ===
+Source: {source_id}
+Title: {source_title}
+Date: {published_date}
+
+{chunk}
+=== END {chunk_id} ==="""
+
+EXTRACTION_BATCH_USER_TEMPLATE = """Extract price evidence from each of the following {n_chunks} text chunks. Treat every chunk independently and only use information stated in that chunk.
+
+{batches}
+
+Return a JSON object with one entry per chunk, using the chunk number as chunk_id:
+{{"results": [{{"chunk_id": 0, "price_evidence": [...]}}, {{"chunk_id": 1, "price_evidence": [...]}}]}}
+
+Each price_evidence item follows the schema. If a chunk has no pricing information, return an empty price_evidence array for it."""
+
+
+EXTRACTION_STREAM_USER_TEMPLATE = """Extract price evidence from the following text:
+
+Source: {source_id}
+Title: {source_title}
+Date: {published_date}
+
+Text to analyze:
+{chunk}
+
+OUTPUT FORMAT OVERRIDE: instead of a price_evidence wrapper object, emit each price evidence item as one compact JSON object on its own line (JSON Lines), with no wrapper, no array and no markdown. If no pricing information is found, output nothing."""
@@ -3,78 +3,132 @@
 import re
 from typing import List, Tuple
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
-def sniff_prices(text: str) -> List[str]:
+
+# Currency symbols and codes
+CURRENCY_PATTERNS = [
+    r'\$',  # Dollar sign
+    r'USD',  # USD
+    r'EUR',  # Euro
+    r'CNY',  # Chinese Yuan
+    r'GBP',  # British Pound
+    r'€',    # Euro symbol
+    r'¥',    # Yen symbol
+    r'£',    # Pound symbol
+]
+
+# Amount patterns
+AMOUNT_PATTERNS = [
+    r'\d+\.?\d*',  # Numbers with optional decimal
+    r'\d{1,3}(?:,\d{3})*(?:\.\d{2})?',  # Formatted numbers
+]
+
+# Price-related keywords
+PRICE_KEYWORDS = [
+    r'price', r'cost', r'fee', r'charge', r'rate',
+    r'per\s+(?:record|account|dataset|item)',
+    r'bulk', r'discount', r'wholesale',
+]
+
+
+def _build_pattern_sources() -> List[str]:
+    """List the price patterns in the order sniff_prices reports their matches."""
+    sources = []
+    
+    # Currency + amount combinations
+    for currency_pattern in CURRENCY_PATTERNS:
+        for amount_pattern in AMOUNT_PATTERNS:
+            sources.append(rf'({currency_pattern})\s*({amount_pattern})')  # Currency before amount
+            sources.append(rf'({amount_pattern})\s*({currency_pattern})')  # Amount before currency
+    
+    # Price keywords near amounts
+    for keyword in PRICE_KEYWORDS:
+        for amount_pattern in AMOUNT_PATTERNS:
+            sources.append(rf'({keyword})\s*[:\-]?\s*({amount_pattern})')  # Keyword before amount
+            sources.append(rf'({amount_pattern})\s*[:\-]?\s*({keyword})')  # Amount before keyword
+    
+    return sources
+
+
+# Compiled once at import instead of rebuilt on every call
+_PATTERN_SOURCES = _build_pattern_sources()
+_PRICE_PATTERNS = [re.compile(source, re.IGNORECASE) for source in _PATTERN_SOURCES]
+_ANY_PRICE_RE = re.compile('|'.join(f'(?:{source})' for source in _PATTERN_SOURCES), re.IGNORECASE)
+
+
+def _build_hyperscan_db():
+    """Compile all price patterns into one Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[source.encode('utf-8') for source in _PATTERN_SOURCES],
+            ids=list(range(len(_PATTERN_SOURCES))),
+            elements=len(_PATTERN_SOURCES),
+            flags=[flags] * len(_PATTERN_SOURCES),
+        )
+    except Exception:
+        return None
+    return db
+
+
+_HS_DB = _build_hyperscan_db()
+
+
+def has_price_mention(text: str) -> bool:
     """
-    Find potential price mentions using regex patterns.
+    Check whether text contains any potential price mention.
+    
+    Equivalent to bool(sniff_prices(text)), but scans the text once and stops
+    at the first match. Uses Hyperscan when it is installed and falls back to
+    the compiled regex otherwise.
     
     Args:
         text: Text to search for prices
         
     Returns:
-        List of matched price strings
+        True if any price pattern matches
     """
-    # Currency symbols and codes
-    currency_patterns = [
-        r'\$',  # Dollar sign
-        r'USD',  # USD
-        r'EUR',  # Euro
-        r'CNY',  # Chinese Yuan
-        r'GBP',  # British Pound
-        r'€',    # Euro symbol
-        r'¥',    # Yen symbol
-        r'£',    # Pound symbol
-    ]
-    
-    # Amount patterns
-    amount_patterns = [
-        r'\d+\.?\d*',  # Numbers with optional decimal
-        r'\d{1,3}(?:,\d{3})*(?:\.\d{2})?',  # Formatted numbers
-    ]
+    if _HS_DB is None:
+        return _ANY_PRICE_RE.search(text) is not None
     
-    # Price-related keywords
-    price_keywords = [
-        r'price', r'cost', r'fee', r'charge', r'rate',
-        r'per\s+(?:record|account|dataset|item)',
-        r'bulk', r'discount', r'wholesale',
-    ]
+    found = []
     
-    matches = []
+    def on_match(pattern_id, start, end, flags, context):
+        found.append(pattern_id)
+        return True  # Stop scanning at the first match
     
-    # Look for currency + amount combinations
-    for currency_pattern in currency_patterns:
-        for amount_pattern in amount_patterns:
-            # Currency before amount
-            pattern1 = f'({currency_pattern})\s*({amount_pattern})'
-            matches.extend(re.findall(pattern1, text, re.IGNORECASE))
-            
-            # Amount before currency
-            pattern2 = f'({amount_pattern})\s*({currency_pattern})'
-            matches.extend(re.findall(pattern2, text, re.IGNORECASE))
-    
-    # Look for price keywords near amounts
-    for keyword in price_keywords:
-        for amount_pattern in amount_patterns:
-            # Keyword before amount
-            pattern1 = f'({keyword})\s*[:\-]?\s*({amount_pattern})'
-            matches.extend(re.findall(pattern1, text, re.IGNORECASE))
-            
-            # Amount before keyword
-            pattern2 = f'({amount_pattern})\s*[:\-]?\s*({keyword})'
-            matches.extend(re.findall(pattern2, text, re.IGNORECASE))
-    
-    # Convert tuples to strings and deduplicate
-    price_strings = []
-    seen = set()
+    try:
+        _HS_DB.scan(text.encode('utf-8'), match_event_handler=on_match)
+    except hyperscan.error:
+        # Terminating from the callback is reported as an error by some versions
+        if not found:
+            raise
+    return bool(found)
+
+
+def sniff_prices(text: str) -> List[str]:
+    """
+    Find potential price mentions using regex patterns.
     
-    for match in matches:
-        if isinstance(match, tuple):
-            price_str = ' '.join(str(m) for m in match if m)
-        else:
-            price_str = str(match)
+    Args:
+        text: Text to search for prices
         
-        if price_str and price_str not in seen:
-            price_strings.append(price_str)
-            seen.add(price_str)
+    Returns:
+        List of matched price strings
+    """
+    # Convert match tuples to strings and deduplicate, keeping first-seen order
+    price_strings = {}
+    for pattern in _PRICE_PATTERNS:
+        for match in pattern.findall(text):
+            price_str = ' '.join(m for m in match if m)
+            if price_str:
+                price_strings[price_str] = None
     
-    return price_strings
+    return list(price_strings)
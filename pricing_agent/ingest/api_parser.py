@@ -1,7 +1,106 @@
+import ast
 import re
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 from ..api_schemas import APIDefinition, APIParameter, APIField
 
+# A section is a "# N) Name" header boxed by "# ====" rules; its body runs up
+# to the next rule. Headers and rules are matched separately so the body is
+# found with one forward search instead of a lazy scan with lookahead
+_SECTION_HEADER_RE = re.compile(r'#\s*={40,}\s*\n\s*#\s*\d+\)\s*(.+?)\s*\n\s*#\s*={40,}\s*\n', re.DOTALL)
+_RULE_RE = re.compile(r'#\s*={40,}')
+_CODE_BLOCK_RE = re.compile(r'```python\s*\n(.*?)```', re.DOTALL)
+_OPTIONAL_RE = re.compile(r'Optional\[(.*?)\]')
+_NONWORD_RE = re.compile(r'[^\w\s-]')
+_WSEP_RE = re.compile(r'[\s-]+')
+
+# Keyword groups checked in order against the lower-cased API name; the first
+# group with a substring match decides the category
+_CATEGORY_KEYWORDS = (
+    (('customer', 'search', 'list'), 'customer'),
+    (('document', 'verify', 'id', 'passport'), 'document'),
+    (('contact', 'participant'), 'contact'),
+    (('device', 'group'), 'device'),
+    (('priority', 'star'), 'premium'),
+    (('real', 'name', 'authentication', 'check'), 'verification'),
+    (('onboarding', 'photo'), 'onboarding'),
+)
+_CATEGORY_RES = tuple(
+    (re.compile('|'.join(map(re.escape, keywords))), category)
+    for keywords, category in _CATEGORY_KEYWORDS
+)
+
+
+# Type strings and API names recur across fields and files, so both helpers
+# are memoized; they are module-level so the caches do not hold parsers alive
+@lru_cache(maxsize=2048)
+def _clean_type(type_str: str) -> str:
+    type_str = _OPTIONAL_RE.sub(r'\1', type_str)
+    return type_str.strip()
+
+
+@lru_cache(maxsize=2048)
+def _generate_api_id(api_name: str) -> str:
+    api_id = api_name.lower()
+    api_id = _NONWORD_RE.sub('', api_id)
+    api_id = _WSEP_RE.sub('_', api_id)
+    return api_id
+
+
+def _iter_sections(content: str) -> Iterator[Tuple[str, str, str]]:
+    # (name, body, raw section text) for each API section, in order
+    pos = 0
+    while True:
+        header = _SECTION_HEADER_RE.search(content, pos)
+        if header is None:
+            return
+        rule = _RULE_RE.search(content, header.end())
+        pos = rule.start() if rule is not None else len(content)
+        yield header.group(1), content[header.end():pos], content[header.start():pos]
+
+
+def _is_dataclass_decorator(node: ast.expr) -> bool:
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Attribute):
+        return node.attr == 'dataclass'
+    return isinstance(node, ast.Name) and node.id == 'dataclass'
+
+
+@lru_cache(maxsize=256)
+def _ast_dataclass_fields(code: str) -> Optional[Tuple[Tuple[bool, str, str, Optional[str], Optional[str]], ...]]:
+    # (is_input, name, type, default, comment) for each annotated field of the
+    # Input/Output dataclasses, or None if the block is not valid Python
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return None
+    
+    lines = code.splitlines()
+    result = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if not any(_is_dataclass_decorator(d) for d in node.decorator_list):
+            continue
+        if 'Input' in node.name:
+            is_input = True
+        elif 'Output' in node.name:
+            is_input = False
+        else:
+            continue
+        
+        for stmt in node.body:
+            if not isinstance(stmt, ast.AnnAssign) or not isinstance(stmt.target, ast.Name):
+                continue
+            default = ast.unparse(stmt.value) if stmt.value is not None else None
+            # Comments are not in the AST; take a trailing one from the source
+            trailing = lines[stmt.end_lineno - 1][stmt.end_col_offset:].strip()
+            comment = trailing[1:].strip() or None if trailing.startswith('#') else None
+            result.append((is_input, stmt.target.id, ast.unparse(stmt.annotation), default, comment))
+    
+    return tuple(result)
+
 
 class APIDefinitionParser:
     
@@ -12,30 +111,24 @@ class APIDefinitionParser:
     
     def parse_content(self, content: str) -> List[APIDefinition]:
         api_definitions = []
-        section_pattern = r'#\s*={40,}\s*\n\s*#\s*\d+\)\s*(.+?)\s*\n\s*#\s*={40,}\s*\n(.*?)(?=#\s*={40,}|$)'
         
-        for match in re.finditer(section_pattern, content, re.DOTALL):
-            api_name = match.group(1).strip()
-            section_content = match.group(2).strip()
+        for api_name, section_content, raw_definition in _iter_sections(content):
+            api_name = api_name.strip()
+            section_content = section_content.strip()
             
             if not section_content:
                 continue
             
-            code_blocks = re.findall(r'```python\s*\n(.*?)```', section_content, re.DOTALL)
+            code_blocks = _CODE_BLOCK_RE.findall(section_content)
             
             if len(code_blocks) >= 1:
                 all_params = []
                 all_fields = []
                 
                 for code_block in code_blocks:
-                    dataclass_pattern = r'@dataclass\s+class\s+\w+.*?(?=@dataclass|$)'
-                    dataclasses = re.findall(dataclass_pattern, code_block, re.DOTALL)
-                    
-                    for dc in dataclasses:
-                        if 'Input' in dc:
-                            all_params.extend(self._parse_dataclass(dc, is_input=True))
-                        elif 'Output' in dc:
-                            all_fields.extend(self._parse_dataclass(dc, is_input=False))
+                    params, fields = self._parse_code_block(code_block)
+                    all_params.extend(params)
+                    all_fields.extend(fields)
                 
                 if all_params or all_fields:
                     api_id = self._generate_api_id(api_name)
@@ -49,75 +142,108 @@ class APIDefinitionParser:
                         output_fields=all_fields,
                         category=category,
                         region="ANY",
-                        raw_definition=match.group(0).strip()
+                        raw_definition=raw_definition.strip()
                     )
                     
                     api_definitions.append(api_def)
         
         return api_definitions
     
-    def _parse_dataclass(self, code: str, is_input: bool = None) -> List:
-        fields = []
+    def _parse_code_block(self, code: str) -> Tuple[List[APIParameter], List[APIField]]:
+        fields = _ast_dataclass_fields(code)
+        if fields is None:
+            # Not valid Python (e.g. elided snippets); fall back to the line scanner
+            return self._scan_dataclasses(code)
         
-        if is_input is None:
-            dataclass_match = re.search(r'class\s+(\w+)', code)
-            is_input = 'Input' in dataclass_match.group(1) if dataclass_match else False
+        params = []
+        outputs = []
+        for is_input, name, field_type, default_value, comment in fields:
+            field = self._build_field(name, field_type, default_value, comment, is_input)
+            (params if is_input else outputs).append(field)
+        return params, outputs
+    
+    def _scan_dataclasses(self, code: str) -> Tuple[List[APIParameter], List[APIField]]:
+        # Single pass over the lines: an "@dataclass" line arms the scanner, the
+        # following "class X" line picks input/output, and each later
+        # "name: type [= default] [# comment]" line is a field of that class
+        params = []
+        fields = []
+        armed = False
+        target = None
         
-        field_pattern = r'(\w+):\s*([^\n=]+?)(?:\s*=\s*([^\n#]+?))?(?:\s*#\s*(.+?))?$'
-        for match in re.finditer(field_pattern, code, re.MULTILINE):
-            field_name = match.group(1).strip()
-            field_type = match.group(2).strip()
-            default_value = match.group(3).strip() if match.group(3) else None
-            comment = match.group(4).strip() if match.group(4) else None
-            
-            if field_name in ['dataclass', 'class']:
+        for raw_line in code.splitlines():
+            line = raw_line.strip()
+            if not line:
+                continue
+            if line.startswith('@dataclass'):
+                armed = True
+                target = None
+                continue
+            if line.startswith('class '):
+                if armed:
+                    class_name = line[6:].partition(':')[0].partition('(')[0].strip()
+                    if 'Input' in class_name:
+                        target = params
+                    elif 'Output' in class_name:
+                        target = fields
+                    else:
+                        target = None
+                armed = False
+                continue
+            if target is None or line.startswith('#'):
                 continue
             
-            required = default_value is None and 'Optional' not in field_type
-            is_array = 'List[' in field_type or 'list[' in field_type.lower()
-            clean_type = self._clean_type(field_type)
-            
-            if is_input:
-                fields.append(APIParameter(
-                    name=field_name,
-                    type=clean_type,
-                    required=required,
-                    description=comment
-                ))
-            else:
-                fields.append(APIField(
-                    name=field_name,
-                    type=clean_type,
-                    is_array=is_array,
-                    description=comment
-                ))
+            field = self._parse_field_line(line, is_input=target is params)
+            if field is not None:
+                target.append(field)
+        
+        return params, fields
+    
+    def _parse_field_line(self, line: str, is_input: bool):
+        field_name, sep, rest = line.partition(':')
+        field_name = field_name.strip()
+        if not sep or not field_name.isidentifier():
+            return None
+        
+        declaration, _, comment = rest.partition('#')
+        field_type, _, default_value = declaration.partition('=')
+        field_type = field_type.strip()
+        default_value = default_value.strip() or None
+        comment = comment.strip() or None
+        if not field_type:
+            return None
+        return self._build_field(field_name, field_type, default_value, comment, is_input)
+    
+    def _build_field(self, field_name: str, field_type: str, default_value: Optional[str],
+                     comment: Optional[str], is_input: bool):
+        required = default_value is None and 'Optional' not in field_type
+        clean_type = self._clean_type(field_type)
         
-        return fields
+        if is_input:
+            return APIParameter(
+                name=field_name,
+                type=clean_type,
+                required=required,
+                description=comment
+            )
+        is_array = 'List[' in field_type or 'list[' in field_type.lower()
+        return APIField(
+            name=field_name,
+            type=clean_type,
+            is_array=is_array,
+            description=comment
+        )
     
     def _clean_type(self, type_str: str) -> str:
-        type_str = re.sub(r'Optional\[(.*?)\]', r'\1', type_str)
-        type_str = re.sub(r'List\[(.*?)\]', r'List[\1]', type_str)
-        return type_str.strip()
+        return _clean_type(type_str)
     
     def _generate_api_id(self, api_name: str) -> str:
-        api_id = api_name.lower()
-        api_id = re.sub(r'[^\w\s-]', '', api_id)
-        api_id = re.sub(r'[\s-]+', '_', api_id)
-        return api_id
+        return _generate_api_id(api_name)
     
     def _infer_category(self, api_name: str, input_params: List, output_fields: List) -> str:
         name_lower = api_name.lower()
-        categories = [
-            (['customer', 'search', 'list'], 'customer'),
-            (['document', 'verify', 'id', 'passport'], 'document'),
-            (['contact', 'participant'], 'contact'),
-            (['device', 'group'], 'device'),
-            (['priority', 'star'], 'premium'),
-            (['real', 'name', 'authentication', 'check'], 'verification'),
-            (['onboarding', 'photo'], 'onboarding')
-        ]
-        for keywords, category in categories:
-            if any(kw in name_lower for kw in keywords):
+        for pattern, category in _CATEGORY_RES:
+            if pattern.search(name_lower):
                 return category
         return 'general'
 
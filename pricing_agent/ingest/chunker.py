@@ -2,6 +2,9 @@
 
 from typing import List
 
+# Characters a chunk may end on, checked right to left
+_BOUNDARY_CHARS = (' ', '\n', '.', '!', '?')
+
 
 def chunk_text(text: str, max_chars: int = 3000, overlap: int = 200) -> List[str]:
     """
@@ -26,15 +29,20 @@ def chunk_text(text: str, max_chars: int = 3000, overlap: int = 200) -> List[str
         
         # Try to break at word boundary
         if end < len(text):
-            # Look for last space, newline, or sentence boundary
-            for i in range(end, max(start + max_chars // 2, end - 100), -1):
-                if text[i] in [' ', '\n', '.', '!', '?']:
-                    end = i + 1
-                    break
+            # Look for last space, newline, or sentence boundary in (lo, end]
+            lo = max(start + max_chars // 2, end - 100)
+            cut = max(text.rfind(c, lo + 1, end + 1) for c in _BOUNDARY_CHARS)
+            if cut > lo:
+                end = cut + 1
         
-        chunk = text[start:end].strip()
-        if chunk:
-            chunks.append(chunk)
+        # Trim whitespace on the indices so each chunk is sliced only once
+        lo, hi = start, min(end, len(text))
+        while lo < hi and text[lo].isspace():
+            lo += 1
+        while hi > lo and text[hi - 1].isspace():
+            hi -= 1
+        if lo < hi:
+            chunks.append(text[lo:hi])
         
         # Move start position with overlap
         start = end - overlap
@@ -1,10 +1,19 @@
 """Document loader for iterating through source files and web content."""
 
+import logging
 import os
 from pathlib import Path
 from typing import Iterator, Dict, Any, List
 from .web_scraper import WebScraper, get_pricing_sources
 
+logger = logging.getLogger(__name__)
+
+# Supported file extensions
+SUPPORTED_EXTENSIONS = frozenset({'.pdf', '.html', '.htm', '.md', '.txt'})
+
+# Path separators and dots become underscores in source IDs
+_SOURCE_ID_TRANS = str.maketrans({os.sep: '_', '/': '_', '.': '_'})
+
 
 def iter_docs(repo_dir: str, include_web: bool = False) -> Iterator[Dict[str, Any]]:
     """
@@ -42,24 +51,54 @@ def iter_local_docs(repo_dir: str) -> Iterator[Dict[str, Any]]:
     if not repo_path.exists():
         raise FileNotFoundError(f"Repository directory not found: {repo_dir}")
     
-    # Supported file extensions
-    supported_extensions = {'.pdf', '.html', '.htm', '.md', '.txt'}
-    
-    for file_path in repo_path.rglob('*'):
-        if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
-            # Extract relative path for source_id
-            relative_path = file_path.relative_to(repo_path)
-            source_id = str(relative_path).replace(os.sep, '_').replace('.', '_')
-            
-            yield {
-                'source_id': source_id,
-                'file_path': str(file_path),
-                'file_name': file_path.name,
-                'file_extension': file_path.suffix.lower(),
-                'file_size': file_path.stat().st_size,
-                'relative_path': str(relative_path),
-                'source_type': 'local'
-            }
+    root = str(repo_path)
+    for entry in _walk_files(root):
+        name = entry.name
+        dot = name.rfind('.')
+        # A leading dot marks a hidden file, not an extension
+        file_extension = name[dot:].lower() if dot > 0 else ''
+        if file_extension not in SUPPORTED_EXTENSIONS:
+            continue
+
+        # Extract relative path for source_id
+        relative_path = os.path.relpath(entry.path, root)
+        source_id = relative_path.translate(_SOURCE_ID_TRANS)
+
+        yield {
+            'source_id': source_id,
+            'file_path': entry.path,
+            'file_name': name,
+            'file_extension': file_extension,
+            'file_size': entry.stat().st_size,
+            'relative_path': relative_path,
+            'source_type': 'local'
+        }
+
+
+def _walk_files(directory: str) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield the files under a directory.
+
+    Files of a directory are yielded before descending into its
+    subdirectories, matching Path.rglob order. DirEntry caches the type and
+    stat information from the directory listing, so no extra syscalls are
+    made per file.
+
+    Args:
+        directory: Directory to walk
+
+    Yields:
+        DirEntry for each regular file (or symlink to one)
+    """
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                yield entry
+    for subdir in subdirs:
+        yield from _walk_files(subdir)
 
 
 def iter_web_docs() -> Iterator[Dict[str, Any]]:
@@ -70,7 +109,6 @@ def iter_web_docs() -> Iterator[Dict[str, Any]]:
         Dictionary with web document metadata
     """
     try:
-        scraper = WebScraper(delay=1.0)
         sources = get_pricing_sources()
         
         for source in sources:
@@ -88,7 +126,7 @@ def iter_web_docs() -> Iterator[Dict[str, Any]]:
                 'file_extension': '.html'
             }
     except Exception as e:
-        print(f"Error setting up web scraping: {e}")
+        logger.error("Error setting up web scraping: %s", e)
 
 
 def scrape_and_save_web_content(output_dir: str = "repo_docs") -> List[str]:
@@ -102,17 +140,17 @@ def scrape_and_save_web_content(output_dir: str = "repo_docs") -> List[str]:
         List of saved file paths
     """
     try:
-        scraper = WebScraper(delay=2.0)
         sources = get_pricing_sources()
         
         # Filter out placeholder URLs
         real_sources = [s for s in sources if 'example.com' not in s.get('url', '')]
         
         if not real_sources:
-            print("No real URLs to scrape (all are placeholders)")
+            logger.info("No real URLs to scrape (all are placeholders)")
             return []
         
-        documents = scraper.scrape_pricing_sources(real_sources)
+        with WebScraper(delay=2.0) as scraper:
+            documents = scraper.scrape_pricing_sources(real_sources)
         saved_files = []
         
         output_path = Path(output_dir)
@@ -130,10 +168,10 @@ def scrape_and_save_web_content(output_dir: str = "repo_docs") -> List[str]:
                 f.write(doc['content'])
             
             saved_files.append(str(filepath))
-            print(f"Saved web content to: {filepath}")
+            logger.info("Saved web content to: %s", filepath)
         
         return saved_files
         
     except Exception as e:
-        print(f"Error scraping web content: {e}")
+        logger.error("Error scraping web content: %s", e)
         return []
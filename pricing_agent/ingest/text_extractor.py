@@ -1,9 +1,31 @@
 """Text extraction from various document formats."""
 
+import logging
+import mmap
 import os
 from pathlib import Path
 from typing import Optional
 
+from .web_scraper import html_to_text
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import pymupdf
+except ImportError:
+    try:
+        import fitz as pymupdf  # PyMuPDF < 1.24.3
+    except ImportError:
+        pymupdf = None
+
+logger = logging.getLogger(__name__)
+
+# Files at least this large are read through a memory map instead of read()
+MMAP_THRESHOLD = 64 * 1024
+
 
 def extract_text(doc_info: dict) -> Optional[str]:
     """
@@ -33,18 +55,31 @@ def extract_text(doc_info: dict) -> Optional[str]:
         elif file_extension == '.pdf':
             return _extract_pdf(file_path)
         else:
-            print(f"Warning: Unsupported file type {file_extension} for {file_path}")
+            logger.warning("Unsupported file type %s for %s", file_extension, file_path)
             return None
             
     except Exception as e:
-        print(f"Error extracting text from {file_path}: {e}")
+        logger.error("Error extracting text from %s: %s", file_path, e)
         return None
 
 
 def _extract_txt(file_path: str) -> str:
     """Extract text from plain text file."""
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        return f.read()
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return ''
+        if size < MMAP_THRESHOLD:
+            text = f.read().decode('utf-8', errors='ignore')
+        else:
+            # Decode from the mapped pages directly, without an intermediate bytes copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, 'utf-8', 'ignore')
+    
+    # Match text-mode universal newlines
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 
 def _extract_md(file_path: str) -> str:
@@ -56,13 +91,23 @@ def _extract_md(file_path: str) -> str:
 
 def _extract_html(file_path: str) -> str:
     """Extract text from HTML file."""
-    # TODO: Implement HTML text extraction using BeautifulSoup or trafilatura
-    # For now, return a placeholder
-    return f"[HTML content from {file_path} - TODO: implement HTML parsing]"
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    
+    if HTMLParser is not None:
+        tree = HTMLParser(data)
+        for node in tree.css('script, style, noscript'):
+            node.decompose()
+        root = tree.body or tree.root
+        return root.text(separator=' ', strip=True) if root is not None else ''
+    
+    return html_to_text(data.decode('utf-8', errors='ignore'))
 
 
 def _extract_pdf(file_path: str) -> str:
     """Extract text from PDF file."""
-    # TODO: Implement PDF text extraction using pdfplumber or PyMuPDF
-    # For now, return a placeholder
-    return f"[PDF content from {file_path} - TODO: implement PDF parsing]"
+    if pymupdf is None:
+        raise ImportError("PDF extraction requires PyMuPDF (pip install pymupdf)")
+    
+    with pymupdf.open(file_path) as doc:
+        return "\n".join(page.get_text("text") for page in doc)
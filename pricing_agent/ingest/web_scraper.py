@@ -1,12 +1,91 @@
 """Web scraper for fetching pricing data from various sources."""
 
-import requests
+import asyncio
+import httpx
+import logging
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 import re
 
+try:
+    from lxml import html as lxml_html
+    try:
+        from lxml.html.clean import Cleaner
+    except ImportError:
+        # lxml >= 5.2 ships the cleaner as a separate package
+        from lxml_html_clean import Cleaner
+except ImportError:
+    lxml_html = None
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Connection pool shared by the fetch workers; with HTTP/2 each host is
+# multiplexed over a single connection
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+# Responses worth retrying, and how often (with exponential backoff)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF = 1.0
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+logger = logging.getLogger(__name__)
+
+# Runs of whitespace collapsed to a single space in extracted text
+_WS_RE = re.compile(r'\s+')
+
+if lxml_html is not None:
+    _CLEANER = Cleaner(kill_tags=('script', 'style', 'noscript', 'iframe'), style=True, scripts=True)
+
+
+def html_to_text(html: str) -> str:
+    """
+    Extract clean text from HTML.
+    
+    Uses the lxml C parser when available and BeautifulSoup's html.parser
+    otherwise.
+    
+    Args:
+        html: HTML content
+        
+    Returns:
+        Clean text content
+    """
+    if lxml_html is not None:
+        try:
+            tree = _CLEANER.clean_html(lxml_html.fromstring(html))
+            return _WS_RE.sub(' ', tree.text_content()).strip()
+        except Exception as e:
+            logger.warning("Error parsing HTML with lxml, falling back to html.parser: %s", e)
+    
+    try:
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+        
+        # Get text
+        text = soup.get_text()
+        
+        # Clean up whitespace
+        return _WS_RE.sub(' ', text).strip()
+    except Exception as e:
+        logger.error("Error parsing HTML: %s", e)
+        return html
+
 
 class WebScraper:
     """Web scraper for collecting pricing data from various sources."""
@@ -19,10 +98,21 @@ class WebScraper:
             delay: Delay between requests in seconds
         """
         self.delay = delay
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.client = httpx.Client(
+            headers=DEFAULT_HEADERS,
+            timeout=30.0,
+            follow_redirects=True,
+            transport=httpx.HTTPTransport(http2=HTTP2_AVAILABLE, limits=HTTP_POOL_LIMITS, retries=MAX_RETRIES)
+        )
+        
+        # Requests to the same host are serialized so the delay applies per host
+        self._host_locks = defaultdict(threading.Lock)
+        self._host_locks_guard = threading.Lock()
+    
+    def _host_lock(self, url: str) -> threading.Lock:
+        """Get the lock serializing requests to the host of a URL."""
+        with self._host_locks_guard:
+            return self._host_locks[urlparse(url).netloc]
     
     def fetch_url(self, url: str) -> Optional[str]:
         """
@@ -34,15 +124,31 @@ class WebScraper:
         Returns:
             HTML content or None if failed
         """
-        try:
-            print(f"Fetching: {url}")
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            time.sleep(self.delay)  # Be respectful
-            return response.text
-        except Exception as e:
-            print(f"Error fetching {url}: {e}")
-            return None
+        with self._host_lock(url):
+            try:
+                logger.info("Fetching: %s", url)
+                response = self.client.get(url)
+                for attempt in range(MAX_RETRIES):
+                    if response.status_code not in RETRY_STATUSES:
+                        break
+                    time.sleep(RETRY_BACKOFF * 2 ** attempt)
+                    response = self.client.get(url)
+                response.raise_for_status()
+                time.sleep(self.delay)  # Be respectful
+                return response.text
+            except Exception as e:
+                logger.error("Error fetching %s: %s", url, e)
+                return None
+    
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self.client.close()
+    
+    def __enter__(self) -> "WebScraper":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def extract_text_from_html(self, html: str) -> str:
         """
@@ -54,38 +160,89 @@ class WebScraper:
         Returns:
             Clean text content
         """
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Get text
-            text = soup.get_text()
-            
-            # Clean up whitespace
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = ' '.join(chunk for chunk in chunks if chunk)
-            
-            return text
-        except Exception as e:
-            print(f"Error parsing HTML: {e}")
-            return html
+        return html_to_text(html)
     
-    def scrape_pricing_sources(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def scrape_pricing_sources(self, sources: List[Dict[str, Any]],
+                               max_workers: int = 8) -> List[Dict[str, Any]]:
         """
         Scrape pricing data from multiple sources.
         
+        Different hosts are fetched concurrently; requests to the same host
+        still run one at a time with the configured delay.
+        
         Args:
             sources: List of source configurations
+            max_workers: Maximum number of concurrent fetches
             
         Returns:
-            List of scraped documents
+            List of scraped documents, in source order
         """
-        documents = []
+        to_fetch = self._fetchable_sources(sources)
+        if not to_fetch:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            pages = list(pool.map(lambda source: self.fetch_url(source['url']), to_fetch))
+        
+        texts = [self.extract_text_from_html(html) if html else None for html in pages]
+        return self._build_documents(to_fetch, texts)
+    
+    async def scrape_pricing_sources_async(self, sources: List[Dict[str, Any]],
+                                           max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Scrape pricing data from multiple sources on an asyncio event loop.
+        
+        Same results and per-host politeness as scrape_pricing_sources, but
+        fetches are coroutines instead of threads; HTML parsing runs in the
+        loop's default executor so it does not block other fetches.
         
+        Args:
+            sources: List of source configurations
+            max_concurrency: Maximum number of requests in flight
+            
+        Returns:
+            List of scraped documents, in source order
+        """
+        to_fetch = self._fetchable_sources(sources)
+        if not to_fetch:
+            return []
+        
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        host_locks = defaultdict(asyncio.Lock)
+        
+        async def fetch_text(client: httpx.AsyncClient, url: str) -> Optional[str]:
+            async with host_locks[urlparse(url).netloc], semaphore:
+                try:
+                    logger.info("Fetching: %s", url)
+                    response = await client.get(url)
+                    for attempt in range(MAX_RETRIES):
+                        if response.status_code not in RETRY_STATUSES:
+                            break
+                        await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+                        response = await client.get(url)
+                    response.raise_for_status()
+                    html = response.text
+                except Exception as e:
+                    logger.error("Error fetching %s: %s", url, e)
+                    return None
+                await asyncio.sleep(self.delay)  # Be respectful
+            return await loop.run_in_executor(None, self.extract_text_from_html, html) if html else None
+        
+        async with httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            timeout=30.0,
+            follow_redirects=True,
+            transport=httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=HTTP_POOL_LIMITS,
+                                               retries=MAX_RETRIES)
+        ) as client:
+            texts = await asyncio.gather(*(fetch_text(client, source['url']) for source in to_fetch))
+        
+        return self._build_documents(to_fetch, texts)
+    
+    def _fetchable_sources(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop sources without a URL or with a placeholder URL."""
+        to_fetch = []
         for source in sources:
             url = source.get('url')
             if not url:
@@ -93,23 +250,30 @@ class WebScraper:
             
             # Skip if it's a placeholder URL
             if 'example.com' in url:
-                print(f"Skipping placeholder URL: {url}")
+                logger.info("Skipping placeholder URL: %s", url)
                 continue
             
-            html = self.fetch_url(url)
-            if html:
-                text = self.extract_text_from_html(html)
-                
-                doc = {
-                    'source_id': source.get('id', f"web_{len(documents)}"),
-                    'source_url': url,
-                    'source_title': source.get('title', 'Web Scraped Content'),
-                    'published_date': source.get('date'),
-                    'content': text,
-                    'file_type': 'html'
-                }
-                documents.append(doc)
-                print(f"Successfully scraped: {source.get('id', url)}")
+            to_fetch.append(source)
+        return to_fetch
+    
+    def _build_documents(self, sources: List[Dict[str, Any]],
+                         texts: List[Optional[str]]) -> List[Dict[str, Any]]:
+        """Turn the extracted text of each fetched source into a document."""
+        documents = []
+        for source, text in zip(sources, texts):
+            if text is None:
+                continue
+            
+            doc = {
+                'source_id': source.get('id', f"web_{len(documents)}"),
+                'source_url': source['url'],
+                'source_title': source.get('title', 'Web Scraped Content'),
+                'published_date': source.get('date'),
+                'content': text,
+                'file_type': 'html'
+            }
+            documents.append(doc)
+            logger.info("Successfully scraped: %s", source.get('id', source['url']))
         
         return documents
 
@@ -178,5 +342,5 @@ def scrape_real_sources() -> List[Dict[str, Any]]:
         }
     ]
     
-    scraper = WebScraper(delay=2.0)  # Be respectful with delays
-    return scraper.scrape_pricing_sources(real_sources)
+    with WebScraper(delay=2.0) as scraper:  # Be respectful with delays
+        return scraper.scrape_pricing_sources(real_sources)
@@ -1,5 +1,5 @@
 """Normalization utilities for price data."""
 
-from .currency import to_usd
+from .currency import to_usd, to_usd_batch
 
-__all__ = ["to_usd"]
+__all__ = ["to_usd", "to_usd_batch"]
@@ -1,7 +1,11 @@
 """Currency normalization utilities."""
 
+import bisect
 from datetime import date
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+
 from ..schemas import Currency
 
 
@@ -25,6 +29,37 @@ FX_RATES: Dict[str, Dict[str, float]] = {
 }
 
 
+# Rate dates in ascending order, for nearest-date lookups
+_FX_KEYS = tuple(sorted(FX_RATES))
+_LATEST_KEY = _FX_KEYS[-1]
+
+# Position of each currency code in the per-date rate vectors
+_CURRENCY_INDEX: Dict[str, int] = {c.value: i for i, c in enumerate(Currency)}
+
+# Per-date rates as arrays indexed by _CURRENCY_INDEX (NaN where unknown)
+_RATE_VECTORS: Dict[str, np.ndarray] = {
+    key: np.array([1.0 if c is Currency.USD else rates.get(c.value, np.nan) for c in Currency])
+    for key, rates in FX_RATES.items()
+}
+
+
+def _rate_date_key(when: Optional[date]) -> str:
+    """
+    Pick the rate table in effect at a date.
+
+    Args:
+        when: Date for historical rate (None selects the most recent table)
+
+    Returns:
+        Latest FX_RATES key on or before the date, or the earliest key for
+        dates before the first table
+    """
+    if when is None:
+        return _LATEST_KEY
+    idx = bisect.bisect_right(_FX_KEYS, when.strftime("%Y-%m-01")) - 1
+    return _FX_KEYS[max(idx, 0)]
+
+
 def to_usd(amount: float, currency: Currency, when: Optional[date] = None) -> float:
     """
     Convert amount to USD using historical exchange rates.
@@ -37,22 +72,9 @@ def to_usd(amount: float, currency: Currency, when: Optional[date] = None) -> fl
     Returns:
         Amount in USD
     """
-    if currency == Currency.USD:
+    if currency is Currency.USD:
         return amount
-    
-    # Use provided date or default to most recent
-    if when:
-        date_key = when.strftime("%Y-%m-01")  # Use first of month
-    else:
-        date_key = "2024-12-01"  # Most recent rate
-    
-    # Find the closest available rate
-    if date_key not in FX_RATES:
-        # Use most recent available rate
-        date_key = max(FX_RATES.keys())
-    
-    rate = FX_RATES[date_key].get(currency.value, 1.0)
-    return amount / rate
+    return amount / get_fx_rate(currency, when)
 
 
 def get_fx_rate(currency: Currency, when: Optional[date] = None) -> float:
@@ -65,16 +87,46 @@ def get_fx_rate(currency: Currency, when: Optional[date] = None) -> float:
         
     Returns:
         Exchange rate (amount of currency per USD)
+        
+    Raises:
+        ValueError: If no rate is known for the currency
     """
-    if currency == Currency.USD:
+    if currency is Currency.USD:
         return 1.0
     
-    if when:
-        date_key = when.strftime("%Y-%m-01")
-    else:
-        date_key = "2024-12-01"
+    date_key = _rate_date_key(when)
+    try:
+        return FX_RATES[date_key][currency.value]
+    except KeyError:
+        raise ValueError(f"No FX rate for {currency.value} on {date_key}") from None
+
+
+def to_usd_batch(amounts: Union[Sequence[float], np.ndarray],
+                 currencies: Sequence[Union[Currency, str]],
+                 when: Optional[date] = None) -> np.ndarray:
+    """
+    Convert many amounts to USD at the rates of a single date.
     
-    if date_key not in FX_RATES:
-        date_key = max(FX_RATES.keys())
+    Args:
+        amounts: Amounts to convert
+        currencies: Source currency (enum member or code) of each amount
+        when: Date for historical rate (defaults to most recent)
+        
+    Returns:
+        Array of amounts in USD
+        
+    Raises:
+        ValueError: If a currency is unknown or has no rate
+    """
+    amounts = np.asarray(amounts, dtype=np.float64)
+    try:
+        idx = np.fromiter((_CURRENCY_INDEX[c] for c in currencies), dtype=np.intp, count=len(currencies))
+    except KeyError as e:
+        raise ValueError(f"Unknown currency {e.args[0]}") from None
     
-    return FX_RATES[date_key].get(currency.value, 1.0)
+    date_key = _rate_date_key(when)
+    rates = _RATE_VECTORS[date_key][idx]
+    if np.isnan(rates).any():
+        missing = sorted({str(c) for c, r in zip(currencies, rates) if np.isnan(r)})
+        raise ValueError(f"No FX rate for {', '.join(missing)} on {date_key}")
+    return amounts / rates
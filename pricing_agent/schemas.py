@@ -1,9 +1,32 @@
 """Pydantic schemas for pricing agent data models."""
 
+import os
 from datetime import date
 from enum import Enum
 from typing import List, Optional, Literal, Dict, Any
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, TypeAdapter, field_validator
+
+# Source URLs are only provenance, so parsing them as HttpUrl on every load is
+# opt-in; set VALIDATE_URLS=1 to check and normalize them during validation
+VALIDATE_URLS = os.getenv("VALIDATE_URLS") == "1"
+
+_HTTP_URL_ADAPTER = TypeAdapter(HttpUrl)
+
+
+def normalize_url(url: str) -> str:
+    """
+    Check that a URL is a well-formed HTTP(S) URL and normalize it.
+    
+    Args:
+        url: URL to check
+        
+    Returns:
+        Normalized URL (e.g. with a trailing slash on a bare host)
+        
+    Raises:
+        pydantic.ValidationError: If the URL is not a valid HTTP(S) URL
+    """
+    return str(_HTTP_URL_ADAPTER.validate_python(url))
 
 
 class ListingType(str, Enum):
@@ -41,9 +64,11 @@ class Currency(str, Enum):
 class PriceEvidence(BaseModel):
     """Evidence of a price found in a document."""
     
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     # Source information
     source_id: str = Field(description="Unique identifier for the source document")
-    source_url: Optional[HttpUrl] = Field(default=None, description="URL of the source document")
+    source_url: Optional[str] = Field(default=None, description="URL of the source document")
     source_title: Optional[str] = Field(default=None, description="Title of the source document")
     published_date: Optional[date] = Field(default=None, description="Publication date of the source")
     
@@ -73,11 +98,43 @@ class PriceEvidence(BaseModel):
     
     # Extraction metadata
     extractor_confidence: float = Field(default=0.7, ge=0.0, le=1.0, description="Confidence in extraction")
+    
+    @field_validator("source_url")
+    @classmethod
+    def _check_source_url(cls, url: Optional[str]) -> Optional[str]:
+        if url is None or not VALIDATE_URLS:
+            return url
+        return normalize_url(url)
+
+
+def validate_source_urls(evidence: List[PriceEvidence]) -> List[PriceEvidence]:
+    """
+    Check and normalize the source URLs of evidence loaded without VALIDATE_URLS.
+    
+    Args:
+        evidence: List of price evidence
+        
+    Returns:
+        Evidence with normalized source URLs (unchanged items are reused)
+        
+    Raises:
+        pydantic.ValidationError: If a source URL is not a valid HTTP(S) URL
+    """
+    validated = []
+    for ev in evidence:
+        if ev.source_url is not None:
+            url = normalize_url(ev.source_url)
+            if url != ev.source_url:
+                ev = ev.model_copy(update={"source_url": url})
+        validated.append(ev)
+    return validated
 
 
 class PriceBenchRow(BaseModel):
     """Aggregated pricing benchmark for a specific data type and listing type."""
     
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     data_type: DataType = Field(description="Type of data")
     listing_type: ListingType = Field(description="Type of listing")
     region: Optional[str] = Field(default=None, description="Geographic region")
@@ -96,6 +153,8 @@ class PriceBenchRow(BaseModel):
 class ItemSpec(BaseModel):
     """Specification for pricing estimation."""
     
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     data_type: DataType = Field(description="Primary data type")
     region: Optional[str] = Field(default=None, description="Geographic region")
     components: List[DataType] = Field(default_factory=list, description="Additional data components")
@@ -106,6 +165,8 @@ class ItemSpec(BaseModel):
 class EstimationResult(BaseModel):
     """Result of price estimation."""
     
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     base_sum: float = Field(description="Sum of base component prices")
     est_price: float = Field(description="Final estimated price")
     modifiers_applied: Dict[str, float] = Field(description="Modifier factors applied")
@@ -116,6 +177,8 @@ class EstimationResult(BaseModel):
 class ContentPriceEstimate(BaseModel):
     """Price estimate for content-based API query valuation."""
     
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     estimate_id: str = Field(description="Unique identifier for this estimate")
     query_id: str = Field(description="References input query_id")
     estimated_at: str = Field(description="ISO 8601 timestamp of estimation")
@@ -150,6 +213,8 @@ class VoIPriceEstimate(BaseModel):
     American Economic Review 108(1): 1-48.
     """
     
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     estimate_id: str = Field(description="Unique identifier for this estimate")
     query_id: str = Field(description="References input query_id")
     estimated_at: str = Field(description="ISO 8601 timestamp of estimation")
@@ -1,40 +1,75 @@
 """Taxonomy mapping for telecom data types."""
 
-from typing import List, Dict, Set
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, FrozenSet, Mapping, Set, Tuple
 from .schemas import DataType
 
 
-# Mapping from telecom field names to data types
-TELECOM_FIELD_MAPPING: Dict[str, List[DataType]] = {
+# Mapping from telecom field names to data types (frozensets, so merging a
+# hit into the result set reuses the stored hashes)
+TELECOM_FIELD_MAPPING: Dict[str, FrozenSet[DataType]] = {
     # Customer data
-    "name": [DataType.PII_CORE, DataType.CONTACT],
-    "phones": [DataType.CONTACT, DataType.TELECOM_PROFILE],
-    "idcard": [DataType.GOV_ID_SCAN, DataType.PII_CORE],
-    "info": [DataType.PII_CORE],
-    "star": [DataType.TELECOM_PROFILE],  # Customer rating/status
-    "contacts": [DataType.CONTACT],
+    "name": frozenset({DataType.PII_CORE, DataType.CONTACT}),
+    "phones": frozenset({DataType.CONTACT, DataType.TELECOM_PROFILE}),
+    "idcard": frozenset({DataType.GOV_ID_SCAN, DataType.PII_CORE}),
+    "info": frozenset({DataType.PII_CORE}),
+    "star": frozenset({DataType.TELECOM_PROFILE}),  # Customer rating/status
+    "contacts": frozenset({DataType.CONTACT}),
     
     # Card data
-    "card_id": [DataType.CREDIT_CARD],
-    "card_info": [DataType.CREDIT_CARD],
-    "bank_info": [DataType.BANK_LOGIN],
+    "card_id": frozenset({DataType.CREDIT_CARD}),
+    "card_info": frozenset({DataType.CREDIT_CARD}),
+    "bank_info": frozenset({DataType.BANK_LOGIN}),
     
     # Subscription data
-    "package_name": [DataType.TELECOM_SUBSCRIPTION],
-    "fee": [DataType.TELECOM_SUBSCRIPTION],
-    "subscription": [DataType.TELECOM_SUBSCRIPTION],
+    "package_name": frozenset({DataType.TELECOM_SUBSCRIPTION}),
+    "fee": frozenset({DataType.TELECOM_SUBSCRIPTION}),
+    "subscription": frozenset({DataType.TELECOM_SUBSCRIPTION}),
     
     # Order data
-    "location": [DataType.CONTACT],
-    "address": [DataType.CONTACT],
-    "order_details": [DataType.OTHER],
+    "location": frozenset({DataType.CONTACT}),
+    "address": frozenset({DataType.CONTACT}),
+    "order_details": frozenset({DataType.OTHER}),
     
     # Product data
-    "product": [DataType.OTHER],
-    "service": [DataType.OTHER],
+    "product": frozenset({DataType.OTHER}),
+    "service": frozenset({DataType.OTHER}),
 }
 
 
+# Substring keywords for fields without a direct mapping; every matching group
+# contributes its data types
+_KEYWORD_GROUPS: Tuple[Tuple[Tuple[str, ...], FrozenSet[DataType]], ...] = (
+    (("name", "full_name", "real_name"), frozenset({DataType.PII_CORE, DataType.CONTACT})),
+    (("phone", "mobile", "cell"), frozenset({DataType.CONTACT, DataType.TELECOM_PROFILE})),
+    (("id", "ssn", "passport", "license"), frozenset({DataType.GOV_ID_SCAN, DataType.PII_CORE})),
+    (("email", "address", "location"), frozenset({DataType.CONTACT})),
+    (("card", "credit", "debit"), frozenset({DataType.CREDIT_CARD})),
+    (("bank", "account", "routing"), frozenset({DataType.BANK_LOGIN})),
+    (("subscription", "plan", "package"), frozenset({DataType.TELECOM_SUBSCRIPTION})),
+    (("profile", "customer", "user"), frozenset({DataType.TELECOM_PROFILE})),
+)
+
+# One alternation per group, so each group is a single scan of the field name
+_KEYWORD_PATTERNS = tuple(
+    (re.compile("|".join(map(re.escape, keywords))), data_types)
+    for keywords, data_types in _KEYWORD_GROUPS
+)
+
+
+# Common telecom data component combinations (read-only, shared by all callers)
+_TELECOM_DATA_COMPONENTS: Mapping[str, Tuple[DataType, ...]] = MappingProxyType({
+    "customer_basic": (DataType.PII_CORE, DataType.CONTACT),
+    "customer_full": (DataType.PII_CORE, DataType.CONTACT, DataType.TELECOM_PROFILE),
+    "customer_premium": (DataType.PII_CORE, DataType.CONTACT, DataType.TELECOM_PROFILE, DataType.GOV_ID_SCAN),
+    "payment_info": (DataType.CREDIT_CARD, DataType.BANK_LOGIN),
+    "subscription_data": (DataType.TELECOM_SUBSCRIPTION,),
+    "full_profile": (DataType.PII_CORE, DataType.CONTACT, DataType.TELECOM_PROFILE, DataType.TELECOM_SUBSCRIPTION),
+})
+
+
 def guess_types_from_fields(fields: List[str]) -> List[DataType]:
     """
     Guess data types from a list of field names.
@@ -45,60 +80,37 @@ def guess_types_from_fields(fields: List[str]) -> List[DataType]:
     Returns:
         List of likely data types
     """
+    return list(_guess_types_cached(tuple(field.lower() for field in fields)))
+
+
+@lru_cache(maxsize=1024)
+def _guess_types_cached(fields: Tuple[str, ...]) -> Tuple[DataType, ...]:
+    """Guess data types from lowercased field names (memoized; the same field lists recur)."""
     found_types: Set[DataType] = set()
     
-    for field in fields:
-        field_lower = field.lower()
-        
+    for field_lower in fields:
         # Direct mapping
         if field_lower in TELECOM_FIELD_MAPPING:
             found_types.update(TELECOM_FIELD_MAPPING[field_lower])
             continue
             
         # Pattern matching
-        if any(keyword in field_lower for keyword in ["name", "full_name", "real_name"]):
-            found_types.update([DataType.PII_CORE, DataType.CONTACT])
-            
-        if any(keyword in field_lower for keyword in ["phone", "mobile", "cell"]):
-            found_types.update([DataType.CONTACT, DataType.TELECOM_PROFILE])
-            
-        if any(keyword in field_lower for keyword in ["id", "ssn", "passport", "license"]):
-            found_types.update([DataType.GOV_ID_SCAN, DataType.PII_CORE])
-            
-        if any(keyword in field_lower for keyword in ["email", "address", "location"]):
-            found_types.add(DataType.CONTACT)
-            
-        if any(keyword in field_lower for keyword in ["card", "credit", "debit"]):
-            found_types.add(DataType.CREDIT_CARD)
-            
-        if any(keyword in field_lower for keyword in ["bank", "account", "routing"]):
-            found_types.add(DataType.BANK_LOGIN)
-            
-        if any(keyword in field_lower for keyword in ["subscription", "plan", "package"]):
-            found_types.add(DataType.TELECOM_SUBSCRIPTION)
-            
-        if any(keyword in field_lower for keyword in ["profile", "customer", "user"]):
-            found_types.add(DataType.TELECOM_PROFILE)
+        for pattern, data_types in _KEYWORD_PATTERNS:
+            if pattern.search(field_lower):
+                found_types.update(data_types)
     
     # If no specific types found, default to other
     if not found_types:
         found_types.add(DataType.OTHER)
         
-    return list(found_types)
+    return tuple(found_types)
 
 
-def get_telecom_data_components() -> Dict[str, List[DataType]]:
+def get_telecom_data_components() -> Mapping[str, Tuple[DataType, ...]]:
     """
     Get common telecom data component combinations.
     
     Returns:
-        Dictionary mapping component names to their data types
+        Read-only mapping from component names to their data types
     """
-    return {
-        "customer_basic": [DataType.PII_CORE, DataType.CONTACT],
-        "customer_full": [DataType.PII_CORE, DataType.CONTACT, DataType.TELECOM_PROFILE],
-        "customer_premium": [DataType.PII_CORE, DataType.CONTACT, DataType.TELECOM_PROFILE, DataType.GOV_ID_SCAN],
-        "payment_info": [DataType.CREDIT_CARD, DataType.BANK_LOGIN],
-        "subscription_data": [DataType.TELECOM_SUBSCRIPTION],
-        "full_profile": [DataType.PII_CORE, DataType.CONTACT, DataType.TELECOM_PROFILE, DataType.TELECOM_SUBSCRIPTION],
-    }
+    return _TELECOM_DATA_COMPONENTS
@@ -0,0 +1,98 @@
+"""In-memory caching of LLM responses."""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+def canonical_key(*parts: Any) -> str:
+    """
+    Build a stable cache key from JSON-serializable parts.
+
+    Dictionary keys are sorted before hashing, so inputs that only differ
+    in key order map to the same key.
+
+    Args:
+        parts: Values identifying the request
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON encoding
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Exact-match LRU cache for LLM responses with optional expiry."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = None):
+        """
+        Initialize response cache.
+
+        Args:
+            max_entries: Maximum number of cached responses (least recently used are evicted)
+            ttl_seconds: Lifetime of an entry in seconds (None keeps entries until evicted)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from canonical_key
+
+        Returns:
+            Copy of the cached response, or None on a miss or expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, value = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from canonical_key
+            value: Response to cache (a copy is stored)
+        """
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
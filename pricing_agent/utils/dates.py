@@ -1,13 +1,31 @@
 """Date utilities for the pricing agent."""
 
-from datetime import date, datetime
-from typing import Optional
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import Optional, Tuple
+
+# Set to an ISO date (YYYY-MM-DD) to pin "today", e.g. for reproducible runs
+FROZEN_TODAY_ENV = "PRICING_AGENT_FROZEN_TODAY"
+
+# Formats tried in order by parse_date when the string has no common shape
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%Y-%m",
+    "%Y",
+)
 
 
 def parse_date(date_str: str) -> Optional[date]:
     """
     Parse date string in various formats.
     
+    ISO dates, year-months and years are parsed directly; other strings go
+    through DATE_FORMATS with strptime.
+    
     Args:
         date_str: Date string to parse
         
@@ -17,17 +35,11 @@ def parse_date(date_str: str) -> Optional[date]:
     if not date_str:
         return None
     
-    # Common date formats
-    formats = [
-        "%Y-%m-%d",
-        "%Y/%m/%d",
-        "%m/%d/%Y",
-        "%d/%m/%Y",
-        "%Y-%m",
-        "%Y",
-    ]
+    parsed = _parse_common_shape(date_str)
+    if parsed is not None:
+        return parsed
     
-    for fmt in formats:
+    for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt).date()
         except ValueError:
@@ -36,6 +48,21 @@ def parse_date(date_str: str) -> Optional[date]:
     return None
 
 
+def _parse_common_shape(date_str: str) -> Optional[date]:
+    """Parse YYYY-MM-DD, YYYY-MM and YYYY without strptime, or return None."""
+    n = len(date_str)
+    try:
+        if n == 10 and date_str[4] == '-' and date_str[7] == '-':
+            return date.fromisoformat(date_str)
+        if n == 7 and date_str[4] == '-' and date_str[:4].isdigit() and date_str[5:].isdigit():
+            return date(int(date_str[:4]), int(date_str[5:]), 1)
+        if n == 4 and date_str.isdigit():
+            return date(int(date_str), 1, 1)
+    except ValueError:
+        pass
+    return None
+
+
 def format_date(d: date) -> str:
     """
     Format date as ISO string.
@@ -49,6 +76,35 @@ def format_date(d: date) -> str:
     return d.isoformat()
 
 
+# (today, timestamp of the next local midnight)
+_today_cache: Tuple[date, float] = (date.min, 0.0)
+
+
+def today() -> date:
+    """
+    Get the current local date, cached until the next midnight.
+    
+    Batch scoring asks for the date once per row; this costs a single
+    time.time() call instead of a full date.today() conversion.
+    PRICING_AGENT_FROZEN_TODAY is read whenever the cached date expires.
+    
+    Returns:
+        Today's date, or the date in PRICING_AGENT_FROZEN_TODAY if set
+    """
+    global _today_cache
+    cached, expires_at = _today_cache
+    now = time.time()
+    if now >= expires_at:
+        frozen = os.environ.get(FROZEN_TODAY_ENV)
+        if frozen:
+            cached, expires_at = date.fromisoformat(frozen), float("inf")
+        else:
+            cached = date.fromtimestamp(now)
+            expires_at = datetime.combine(cached + timedelta(days=1), datetime.min.time()).timestamp()
+        _today_cache = (cached, expires_at)
+    return cached
+
+
 def days_since(date_obj: date) -> int:
     """
     Calculate days since given date.
@@ -59,8 +115,7 @@ def days_since(date_obj: date) -> int:
     Returns:
         Number of days since the date
     """
-    today = date.today()
-    return (today - date_obj).days
+    return (today() - date_obj).days
 
 
 def is_recent(date_obj: date, days: int = 30) -> bool:
@@ -1,6 +1,6 @@
 """Deduplication utilities for price evidence."""
 
-from typing import List, Set
+from typing import List, Set, Tuple
 from ..schemas import PriceEvidence
 
 
@@ -17,13 +17,14 @@ def deduplicate_evidence(evidence: List[PriceEvidence]) -> List[PriceEvidence]:
     if not evidence:
         return []
     
-    # Simple deduplication based on key fields
-    seen: Set[str] = set()
+    # Simple deduplication based on key fields; the tuple is hashed as is,
+    # without formatting the fields into a string (empty regions count as none)
+    seen: Set[Tuple] = set()
     deduplicated = []
     
     for ev in evidence:
-        # Create a key based on important fields
-        key = _create_evidence_key(ev)
+        key = (ev.source_id, ev.data_type, ev.listing_type, ev.price_value,
+               ev.currency, ev.units, ev.region or None)
         
         if key not in seen:
             seen.add(key)
@@ -32,25 +33,6 @@ def deduplicate_evidence(evidence: List[PriceEvidence]) -> List[PriceEvidence]:
     return deduplicated
 
 
-def _create_evidence_key(ev: PriceEvidence) -> str:
-    """Create a key for deduplication."""
-    # Use source, data type, listing type, and price as key
-    key_parts = [
-        ev.source_id,
-        ev.data_type.value,
-        ev.listing_type.value,
-        str(ev.price_value),
-        ev.currency.value,
-        ev.units,
-    ]
-    
-    # Add region if present
-    if ev.region:
-        key_parts.append(ev.region)
-    
-    return "|".join(key_parts)
-
-
 def merge_similar_evidence(evidence: List[PriceEvidence]) -> List[PriceEvidence]:
     """
     Merge similar evidence entries (e.g., price ranges).
@@ -1,24 +1,152 @@
 """I/O utilities for saving and loading data."""
 
+import dataclasses
 import json
+import math
+from datetime import date, datetime, time
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Type
+
+import numpy as np
+from pydantic import BaseModel, TypeAdapter
 from ..schemas import PriceEvidence, PriceBenchRow
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared encoder for the stdlib fallback; keeps non-ASCII text unescaped like orjson
+_INDENTED_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+if orjson is not None:
+    # Dates, enums and numpy values are encoded natively by orjson
+    _ORJSON_FILE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """
+    Get the adapter for a list of models, building it on first use only.
+    
+    Whole lists are then encoded and decoded in one pass by pydantic-core
+    instead of model by model, and the validator is compiled once per type.
+    
+    Args:
+        model: Pydantic model class of the list items
+        
+    Returns:
+        Cached TypeAdapter for List[model]
+    """
+    return TypeAdapter(List[model])
+
+
+def dumps_indented(data: Any) -> str:
+    """
+    Serialize data to an indented JSON string (e.g. for LLM prompts).
+    
+    Uses orjson when it is installed and falls back to the standard library.
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        JSON string indented by two spaces
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return _INDENTED_ENCODER.encode(data)
+
+
+def dumps_compact(data: Any) -> str:
+    """
+    Serialize data to a compact JSON string without whitespace.
+    
+    Cheaper to encode than dumps_indented and uses fewer prompt tokens.
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        JSON string with no indentation or separator spaces
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return _COMPACT_ENCODER.encode(data)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode values JSON has no type for (models as JSON dicts, anything else as str)."""
+    if isinstance(obj, BaseModel):
+        return _to_orjson_compatible(obj.model_dump(mode="json"))
+    # The types below are native to orjson; the stdlib fallback encodes them the same way
+    if isinstance(obj, (date, datetime, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return _to_orjson_compatible(obj.value)
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return _to_orjson_compatible(obj.tolist())
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return _to_orjson_compatible({f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)})
+    return str(obj)
+
+
+def _json_key(key: Any) -> Any:
+    """Convert a dict key the way orjson's OPT_NON_STR_KEYS does for non-native key types."""
+    if isinstance(key, (date, datetime, time)):
+        return key.isoformat()
+    if isinstance(key, Enum):
+        return key.value
+    return key
+
+
+def _to_orjson_compatible(data: Any) -> Any:
+    """
+    Prepare data for the stdlib encoder so it writes the values orjson would.
+    
+    Non-finite floats become None (orjson writes null where the stdlib
+    would write the invalid literals NaN/Infinity) and date and enum dict
+    keys are converted; other values are left to _json_default.
+    """
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {_json_key(k): _to_orjson_compatible(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_to_orjson_compatible(v) for v in data]
+    return data
+
+
+def _write_bytes(file_path: str, payload: bytes) -> None:
+    """Write encoded JSON to a file in one binary write, creating parent directories as needed."""
+    path = Path(file_path)
+    if not path.parent.is_dir():
+        path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(payload)
+
 
 def save_json(data: Any, file_path: str) -> None:
     """
     Save data to JSON file.
     
+    Uses orjson when it is installed and falls back to the standard library,
+    adjusted to write the same values (ISO 8601 dates, null for NaN and
+    infinity, converted dict keys).
+    
     Args:
         data: Data to save
         file_path: Path to save file
     """
-    path = Path(file_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+    if orjson is not None:
+        payload = orjson.dumps(data, default=_json_default, option=_ORJSON_FILE_OPTIONS)
+    else:
+        payload = json.dumps(_to_orjson_compatible(data), indent=2, default=_json_default,
+                             ensure_ascii=False, allow_nan=False).encode('utf-8')
+    _write_bytes(file_path, payload)
 
 
 def load_json(file_path: str) -> Any:
@@ -31,6 +159,8 @@ def load_json(file_path: str) -> Any:
     Returns:
         Loaded data
     """
+    if orjson is not None:
+        return orjson.loads(Path(file_path).read_bytes())
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
@@ -43,8 +173,7 @@ def save_evidence(evidence: List[PriceEvidence], file_path: str) -> None:
         evidence: List of price evidence
         file_path: Path to save file
     """
-    data = [ev.model_dump() for ev in evidence]
-    save_json(data, file_path)
+    _write_bytes(file_path, _list_adapter(PriceEvidence).dump_json(evidence, indent=2))
 
 
 def load_evidence(file_path: str) -> List[PriceEvidence]:
@@ -57,8 +186,7 @@ def load_evidence(file_path: str) -> List[PriceEvidence]:
     Returns:
         List of price evidence
     """
-    data = load_json(file_path)
-    return [PriceEvidence.model_validate(item) for item in data]
+    return _list_adapter(PriceEvidence).validate_json(Path(file_path).read_bytes())
 
 
 def save_benchmark(bench: List[PriceBenchRow], file_path: str) -> None:
@@ -69,8 +197,7 @@ def save_benchmark(bench: List[PriceBenchRow], file_path: str) -> None:
         bench: List of benchmark rows
         file_path: Path to save file
     """
-    data = [row.model_dump() for row in bench]
-    save_json(data, file_path)
+    _write_bytes(file_path, _list_adapter(PriceBenchRow).dump_json(bench, indent=2))
 
 
 def load_benchmark(file_path: str) -> List[PriceBenchRow]:
@@ -83,5 +210,4 @@ def load_benchmark(file_path: str) -> List[PriceBenchRow]:
     Returns:
         List of benchmark rows
     """
-    data = load_json(file_path)
-    return [PriceBenchRow.model_validate(item) for item in data]
+    return _list_adapter(PriceBenchRow).validate_json(Path(file_path).read_bytes())
@@ -0,0 +1,39 @@
+"""Non-blocking logging setup for the command-line entry points."""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from typing import Optional
+
+LOG_FORMAT = "%(message)s"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Route pricing_agent log records through a queue to a single writer thread.
+
+    Worker threads only enqueue records, so concurrent scraping and extraction
+    never contend on the stream lock. Calling this again has no effect.
+
+    Args:
+        level: Minimum level of pricing_agent records to emit
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    records: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    package_logger = logging.getLogger("pricing_agent")
+    package_logger.setLevel(level)
+    package_logger.addHandler(logging.handlers.QueueHandler(records))
+    package_logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(records, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
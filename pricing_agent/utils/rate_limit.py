@@ -0,0 +1,31 @@
+"""Thread-safe request rate limiting."""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Spaces calls evenly so that at most a fixed number start per minute."""
+
+    def __init__(self, requests_per_minute: float):
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Maximum number of calls started per minute
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        self.interval = 60.0 / requests_per_minute
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller may start its next call."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
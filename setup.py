@@ -1,16 +1,15 @@
 """Setup configuration for the pricing agent package."""
 
+import re
 from setuptools import setup, find_packages
 from pathlib import Path
 
+# Requirement lines: non-blank, not a comment and not an editable (-e) install
+_REQUIREMENT_RE = re.compile(r'^(?!\s*(?:#|-e))\s*(\S.*?)\s*$', re.MULTILINE)
+
 # Read the contents of requirements.txt
 requirements_path = Path(__file__).parent / "requirements.txt"
-with open(requirements_path, 'r', encoding='utf-8') as f:
-    requirements = [
-        line.strip() 
-        for line in f 
-        if line.strip() and not line.startswith('#') and not line.startswith('-e')
-    ]
+requirements = _REQUIREMENT_RE.findall(requirements_path.read_text(encoding='utf-8'))
 
 readme_path = Path(__file__).parent / "README.md"
 long_description = ""
@@ -9,16 +9,17 @@ import sys
 import subprocess
 from pathlib import Path
 
-def run_command(cmd, description):
-    """Run a command and handle errors."""
+def run_command(argv, description):
+    """Run a command, streaming its output to the terminal, and handle errors."""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
+        # No shell and no captured output: pip's progress goes straight to the
+        # terminal instead of being buffered here
+        subprocess.run(argv, check=True)
         print(f"✅ {description} completed")
         return True
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"❌ {description} failed: {e}")
-        print(f"Error output: {e.stderr}")
         return False
 
 def setup_environment():
@@ -35,15 +36,15 @@ def setup_environment():
     python_cmd = sys.executable
     
     # Install/upgrade pip
-    if not run_command(f"{python_cmd} -m pip install --upgrade pip", "Upgrading pip"):
+    if not run_command([python_cmd, "-m", "pip", "install", "--upgrade", "pip"], "Upgrading pip"):
         return False
     
     # Install requirements
-    if not run_command(f"{python_cmd} -m pip install -r requirements.txt", "Installing requirements"):
+    if not run_command([python_cmd, "-m", "pip", "install", "-r", "requirements.txt"], "Installing requirements"):
         return False
     
     # Install the package in development mode
-    if not run_command(f"{python_cmd} -m pip install -e .", "Installing pricing-agent package"):
+    if not run_command([python_cmd, "-m", "pip", "install", "-e", "."], "Installing pricing-agent package"):
         return False
     
     # Test imports
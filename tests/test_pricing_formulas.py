@@ -0,0 +1,54 @@
+"""Tests for the content-based pricing formulas."""
+
+import unittest
+
+import numpy as np
+
+from pricing_agent.estimate.pricing_formulas import (
+    VARIABLE_ORDER,
+    LogLinearPricingModel,
+    extract_scores,
+    scores_to_matrix,
+)
+
+
+def _variable_scores(names):
+    return {name: {"score": float(i % 10) + 0.5} for i, name in enumerate(names)}
+
+
+class LogLinearVectorPathTest(unittest.TestCase):
+    """The vector and batch paths must agree with the dict path for any betas."""
+
+    def assert_paths_agree(self, model_params, variable_scores):
+        model = LogLinearPricingModel(model_params)
+        expected = model.estimate_price(variable_scores)
+
+        vector_result = model.estimate_price(extract_scores(variable_scores))
+        np.testing.assert_allclose(vector_result, expected, rtol=1e-12)
+
+        points, lows, highs = model.estimate_price_batch(scores_to_matrix([variable_scores] * 3))
+        for batch_result in zip(points, lows, highs):
+            np.testing.assert_allclose(batch_result, expected, rtol=1e-12)
+
+    def test_default_betas(self):
+        self.assert_paths_agree({}, _variable_scores(VARIABLE_ORDER))
+
+    def test_reordered_betas(self):
+        betas = dict(reversed(list(LogLinearPricingModel._default_betas().items())))
+        self.assert_paths_agree({"betas": betas}, _variable_scores(VARIABLE_ORDER))
+
+    def test_subset_of_betas_with_covariance(self):
+        model_params = {
+            "alpha": 2.5,
+            "betas": {"legal_risk": -0.02, "target": 0.05},
+            "covariance": {"target": 0.02},
+        }
+        self.assert_paths_agree(model_params, _variable_scores(VARIABLE_ORDER))
+
+    def test_missing_scores(self):
+        betas = dict(reversed(list(LogLinearPricingModel._default_betas().items())))
+        self.assert_paths_agree({"betas": betas}, _variable_scores(VARIABLE_ORDER[::2]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,121 +1,129 @@
-import json
 import os
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
 from pricing_agent.estimate.voi_pricing_agent import VoIPricingAgent
 from pricing_agent.extract.llm_client import LLMClient
+from pricing_agent.utils.io import save_json
+
+
+# Static parts of the generated API responses; the generators only add the
+# timestamps, so treat these (and the nested dicts they share) as read-only
+_BASIC_CONSUMER_PROFILE: Dict[str, Any] = {
+    "subscriber_id": "sub_789456123",
+    "account_tier": "basic",
+    "name": "John Smith",
+    "phone": "+1-555-0123",
+    "email": "jsmith@email.com",
+    "address": {
+        "street": "123 Main St",
+        "city": "Anytown",
+        "state": "CA",
+        "zip": "90210"
+    },
+    "billing_summary": {
+        "monthly_charge": 45.99,
+        "data_usage_gb": 3.2,
+        "voice_minutes": 250
+    }
+}
+
+_VIP_EXECUTIVE_PROFILE: Dict[str, Any] = {
+    "subscriber_id": "sub_VIP_992847",
+    "account_tier": "premium_corporate",
+    "name": "Sarah Chen",
+    "job_title": "Chief Financial Officer",
+    "employer": "TechCorp International Inc.",
+    "phone": "+1-415-555-8800",
+    "email": "schen@techcorp.com",
+    "verified_identity": True,
+    "address": {
+        "street": "456 Executive Plaza",
+        "city": "San Francisco",
+        "state": "CA",
+        "zip": "94105"
+    },
+    "device_info": {
+        "imei": "352099001761481",
+        "sim_iccid": "8901410393928400001",
+        "device_model": "iPhone 14 Pro"
+    }
+}
+
+# (hours ago, static fields) of each location and call history entry
+_VIP_LOCATION_HISTORY = (
+    (1, {"latitude": 37.7749, "longitude": -122.4194, "accuracy_meters": 15}),
+    (8, {"latitude": 37.7899, "longitude": -122.3988, "accuracy_meters": 20}),
+)
+
+_VIP_CALL_HISTORY = (
+    (3, {"direction": "outgoing", "duration_seconds": 420, "contact_name": "Board Member - Legal"}),
+    (5, {"direction": "incoming", "duration_seconds": 180, "contact_name": "Bank of America - Private Client"}),
+)
+
+_VIP_BILLING_SUMMARY = {
+    "monthly_charge": 299.99,
+    "data_usage_gb": 45.8,
+    "international_calls": 12
+}
+
+_MINIMAL_API_RESPONSE: Dict[str, Any] = {
+    "status": "partial_data",
+    "subscriber_id": "sub_333222111",
+    "phone": "+1-555-9999",
+    "account_status": "active",
+    "note": "Limited data due to privacy restrictions"
+}
+
+_BULK_RECORDS = [
+    {
+        "subscriber_id": f"sub_bulk_{10000 + i}",
+        "name": f"User {i}",
+        "phone": f"+1-555-{2000 + i:04d}",
+        "email": f"user{i}@example.com",
+        "account_tier": "standard",
+        "monthly_charge": 35.99,
+        "data_usage_gb": 2.5 + (i % 10)
+    }
+    for i in range(50)
+]
 
 
 def generate_basic_consumer_profile() -> Dict[str, Any]:
     return {
-        "subscriber_id": "sub_789456123",
-        "account_tier": "basic",
-        "name": "John Smith",
-        "phone": "+1-555-0123",
-        "email": "jsmith@email.com",
-        "address": {
-            "street": "123 Main St",
-            "city": "Anytown",
-            "state": "CA",
-            "zip": "90210"
-        },
-        "billing_summary": {
-            "monthly_charge": 45.99,
-            "data_usage_gb": 3.2,
-            "voice_minutes": 250
-        },
+        **_BASIC_CONSUMER_PROFILE,
         "last_updated": (datetime.now() - timedelta(days=2)).isoformat()
     }
 
 
 def generate_vip_executive_profile() -> Dict[str, Any]:
+    now = datetime.now()
     return {
-        "subscriber_id": "sub_VIP_992847",
-        "account_tier": "premium_corporate",
-        "name": "Sarah Chen",
-        "job_title": "Chief Financial Officer",
-        "employer": "TechCorp International Inc.",
-        "phone": "+1-415-555-8800",
-        "email": "schen@techcorp.com",
-        "verified_identity": True,
-        "address": {
-            "street": "456 Executive Plaza",
-            "city": "San Francisco",
-            "state": "CA",
-            "zip": "94105"
-        },
-        "device_info": {
-            "imei": "352099001761481",
-            "sim_iccid": "8901410393928400001",
-            "device_model": "iPhone 14 Pro"
-        },
+        **_VIP_EXECUTIVE_PROFILE,
         "location_history": [
-            {
-                "timestamp": (datetime.now() - timedelta(hours=1)).isoformat(),
-                "latitude": 37.7749,
-                "longitude": -122.4194,
-                "accuracy_meters": 15
-            },
-            {
-                "timestamp": (datetime.now() - timedelta(hours=8)).isoformat(),
-                "latitude": 37.7899,
-                "longitude": -122.3988,
-                "accuracy_meters": 20
-            }
+            {"timestamp": (now - timedelta(hours=hours)).isoformat(), **fields}
+            for hours, fields in _VIP_LOCATION_HISTORY
         ],
         "call_history": [
-            {
-                "timestamp": (datetime.now() - timedelta(hours=3)).isoformat(),
-                "direction": "outgoing",
-                "duration_seconds": 420,
-                "contact_name": "Board Member - Legal"
-            },
-            {
-                "timestamp": (datetime.now() - timedelta(hours=5)).isoformat(),
-                "direction": "incoming",
-                "duration_seconds": 180,
-                "contact_name": "Bank of America - Private Client"
-            }
+            {"timestamp": (now - timedelta(hours=hours)).isoformat(), **fields}
+            for hours, fields in _VIP_CALL_HISTORY
         ],
-        "billing_summary": {
-            "monthly_charge": 299.99,
-            "data_usage_gb": 45.8,
-            "international_calls": 12
-        },
-        "last_updated": (datetime.now() - timedelta(hours=0.5)).isoformat()
+        "billing_summary": _VIP_BILLING_SUMMARY,
+        "last_updated": (now - timedelta(hours=0.5)).isoformat()
     }
 
 
 def generate_minimal_api_response() -> Dict[str, Any]:
-    return {
-        "status": "partial_data",
-        "subscriber_id": "sub_333222111",
-        "phone": "+1-555-9999",
-        "account_status": "active",
-        "note": "Limited data due to privacy restrictions"
-    }
+    return dict(_MINIMAL_API_RESPONSE)
 
 
 def generate_bulk_dataset_response() -> Dict[str, Any]:
     base_time = datetime.now() - timedelta(days=5)
     
-    records = []
-    for i in range(50):
-        records.append({
-            "subscriber_id": f"sub_bulk_{10000 + i}",
-            "name": f"User {i}",
-            "phone": f"+1-555-{2000 + i:04d}",
-            "email": f"user{i}@example.com",
-            "account_tier": "standard",
-            "monthly_charge": 35.99,
-            "data_usage_gb": 2.5 + (i % 10)
-        })
-    
     return {
         "dataset_id": "bulk_export_20251029",
-        "record_count": 50,
-        "records": records,
+        "record_count": len(_BULK_RECORDS),
+        "records": _BULK_RECORDS,
         "exported_at": base_time.isoformat()
     }
 
@@ -180,25 +188,24 @@ def run_simulation():
         }
     ]
     
-    results = []
-    for i, test_case in enumerate(test_cases, 1):
+    # Ex-post inference (the LLM round trips) runs concurrently inside batch_estimate
+    estimates = agent.batch_estimate(
+        api_responses=[test_case['api_response'] for test_case in test_cases],
+        query_ids=[f"sim_{i:03d}" for i in range(1, len(test_cases) + 1)],
+        metadata_list=[test_case['metadata'] for test_case in test_cases]
+    )
+    
+    results = [
+        {"test_case": test_case['name'], "result": result}
+        for test_case, result in zip(test_cases, estimates)
+    ]
+    
+    for i, (test_case, result) in enumerate(zip(test_cases, estimates), 1):
         print(f"\nTest Case {i}/{len(test_cases)}: {test_case['name']}")
         print("-" * 80)
         print(f"Description: {test_case['description']}")
         print()
         
-        # Estimate price
-        result = agent.estimate_price(
-            api_response=test_case['api_response'],
-            query_id=f"sim_{i:03d}",
-            metadata=test_case['metadata']
-        )
-        
-        results.append({
-            "test_case": test_case['name'],
-            "result": result
-        })
-        
         # Print summary
         print_result_summary(result)
         print()
@@ -218,8 +225,7 @@ def run_simulation():
         print()
     
     output_file = "voi_simulation_results.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    save_json(results, output_file)
     
     print(f"Detailed results saved to: {output_file}")
     print()